@@ -0,0 +1,72 @@
+"""
+Gunicorn configuration for production
+
+    gunicorn -c gunicorn.conf.py src.main:app
+
+With SERVER_PRELOAD_MODEL the master process loads the translation model
+before forking workers. Model weights are allocated once and never written
+after loading, so the workers share their pages copy-on-write and resident
+memory grows by each worker's private state rather than a full model copy.
+Check with ``python -m src.tools.worker_memory --sweep 1,2,4``.
+"""
+import gc
+import os
+
+from src.core.config import get_settings
+
+settings = get_settings()
+
+bind = settings.SERVER_BIND
+workers = settings.SERVER_WORKERS
+worker_class = "uvicorn.workers.UvicornWorker"
+# Import the app (and with it the settings) once, in the master
+preload_app = True
+# Model loading and warmup happen before workers report ready
+timeout = 120
+graceful_timeout = 30
+
+
+def _torch_threads() -> int:
+    if settings.SERVER_TORCH_THREADS > 0:
+        return settings.SERVER_TORCH_THREADS
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def when_ready(server):
+    """Load the model in the master, before the first worker is forked"""
+    if not settings.SERVER_PRELOAD_MODEL:
+        return
+    try:
+        import torch
+
+        # An OpenMP pool started in the master does not survive fork; keep
+        # the master single-threaded and size each worker's pool after fork
+        torch.set_num_threads(1)
+    except ImportError:
+        pass
+
+    from src.integrations.factory import preload_translation_provider
+
+    try:
+        preload_translation_provider()
+    except Exception as e:
+        # Workers fall back to loading their own copy at startup
+        server.log.error(f"Model preload failed, workers will load it themselves: {str(e)}")
+        return
+    # Keep the garbage collector from touching (and un-sharing) the pages of
+    # every object that exists now
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """Give the worker its own threads around the inherited model"""
+    try:
+        import torch
+
+        torch.set_num_threads(_torch_threads())
+    except ImportError:
+        pass
+
+    from src.integrations.factory import reinit_after_fork
+
+    reinit_after_fork()
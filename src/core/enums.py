@@ -7,6 +7,16 @@ class TranslationEngine(str, Enum):
     GOOGLE = "google"
     OPENAI = "openai"
     LOCAL = "local"  # GPU-based local translation
+    ONNX = "onnx"  # Local translation on ONNX Runtime (CPU)
+    COMPOSITE = "composite"  # Routes across ROUTER_ENGINES
+
+
+class JobStatus(str, Enum):
+    """Bulk translation job status"""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
 
 
 class SupportedLanguage(str, Enum):
@@ -32,4 +42,4 @@ class LocalModelType(str, Enum):
     NLLB = "facebook/nllb-200-distilled-600M"  # No Language Left Behind
 
 
-EngineType = Literal["google", "openai", "local"]
+EngineType = Literal["google", "openai", "local", "onnx", "composite"]
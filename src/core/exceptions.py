@@ -1,4 +1,5 @@
 from fastapi import status
+from typing import Dict, List, Optional
 
 
 class TranslationException(Exception):
@@ -42,6 +43,29 @@ class LocalTranslateException(TranslationEngineException):
         super().__init__(message, "local")
 
 
+class InferenceQueueFullException(TranslationEngineException):
+    """Inference executor queue is full"""
+    def __init__(self, executor: str = "inference"):
+        super().__init__(f"{executor} queue is full, please retry later", "local")
+
+
+class PartialBatchTranslationException(TranslationEngineException):
+    """Some texts of a batch failed; carries the texts that succeeded"""
+    def __init__(
+        self,
+        results: List[Optional[str]],
+        errors: Dict[int, str],
+        engine: str = "unknown"
+    ):
+        self.results = results
+        self.errors = errors
+        self.engine = engine
+        super().__init__(
+            f"{len(errors)} of {len(results)} texts failed",
+            engine
+        )
+
+
 class ModelLoadException(TranslationException):
     """Model loading error"""
     def __init__(self, model_name: str):
@@ -51,6 +75,30 @@ class ModelLoadException(TranslationException):
         )
 
 
+class JobNotFoundException(TranslationException):
+    """Bulk translation job does not exist"""
+    def __init__(self, job_id: str):
+        super().__init__(
+            f"Job not found: {job_id}",
+            status.HTTP_404_NOT_FOUND
+        )
+
+
+class JobNotReadyException(TranslationException):
+    """Bulk translation job has not completed yet"""
+    def __init__(self, job_id: str, job_status: str):
+        super().__init__(
+            f"Job {job_id} is {job_status}, results are not ready",
+            status.HTTP_409_CONFLICT
+        )
+
+
+class InvalidJobInputException(TranslationException):
+    """Bulk translation job input is malformed"""
+    def __init__(self, message: str):
+        super().__init__(message, status.HTTP_400_BAD_REQUEST)
+
+
 class RateLimitException(TranslationException):
     """Rate limit exceeded"""
     def __init__(self):
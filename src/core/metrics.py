@@ -0,0 +1,345 @@
+"""
+In-process metrics in the Prometheus text exposition format
+
+Observations happen on the request hot path, from the event loop and from
+executor threads, so they never take a lock: each thread updates its own
+shard of a metric's values (a single writer, so plain ``+=`` is safe), and
+the shards are only summed when ``/metrics`` is scraped. Label children and
+shards are created with ``dict.setdefault``, which is atomic.
+
+Values that already live in component statistics (queue depth, cache hit
+counters, model load times) are not double-counted on the hot path; they
+are read at scrape time by collectors registered with
+``REGISTRY.register_collector``.
+"""
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds, from a cached hit to a long local batch
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+RATIO_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0)
+
+# (labels, value) pairs of one metric family
+Samples = List[Tuple[Dict[str, str], float]]
+# A collector yields (name, type, documentation, samples)
+Collector = Callable[[], Iterable[Tuple[str, str, str, Samples]]]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+class _CounterShard:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+
+class _HistogramShard:
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Child:
+    """Values of one label combination, sharded by thread"""
+
+    def __init__(self, metric: "_Metric"):
+        self._metric = metric
+        self._shards: Dict[int, object] = {}
+
+    def _shard(self):
+        ident = threading.get_ident()
+        shard = self._shards.get(ident)
+        if shard is None:
+            shard = self._shards.setdefault(ident, self._metric._new_shard())
+        return shard
+
+    def shards(self) -> list:
+        # list() of a dict view runs without releasing the GIL
+        return list(self._shards.values())
+
+
+class _CounterChild(_Child):
+    def inc(self, amount: float = 1.0):
+        self._shard().value += amount
+
+    def value(self) -> float:
+        return sum(shard.value for shard in self.shards())
+
+
+class _GaugeChild(_CounterChild):
+    def dec(self, amount: float = 1.0):
+        self._shard().value -= amount
+
+
+class _HistogramChild(_Child):
+    def observe(self, value: float):
+        shard = self._shard()
+        shard.buckets[bisect_left(self._metric.buckets, value)] += 1
+        shard.sum += value
+        shard.count += 1
+
+
+class _Metric:
+    type_name = ""
+    child_class = _Child
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional["MetricsRegistry"] = None
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], _Child] = {}
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def labels(self, *values: str):
+        """The child for a label combination, in ``labelnames`` order"""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            child = self._children.setdefault(key, self.child_class(self))
+        return child
+
+    def _new_shard(self):
+        return _CounterShard()
+
+    def _children_items(self) -> List[Tuple[Dict[str, str], _Child]]:
+        return [
+            (dict(zip(self.labelnames, key)), child)
+            for key, child in list(self._children.items())
+        ]
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for labels, child in self._children_items():
+            lines.extend(self._render_child(labels, child))
+        return lines
+
+    def _render_child(self, labels: Dict[str, str], child: _Child) -> List[str]:
+        return [f"{self.name}{_format_labels(labels)} {_format_value(child.value())}"]
+
+
+class Counter(_Metric):
+    """Monotonic total; name it ``*_total``"""
+    type_name = "counter"
+    child_class = _CounterChild
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, e.g. requests in flight"""
+    type_name = "gauge"
+    child_class = _GaugeChild
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self.labels().dec(amount)
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets"""
+    type_name = "histogram"
+    child_class = _HistogramChild
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        registry: Optional["MetricsRegistry"] = None
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_shard(self):
+        # One slot per bucket plus the +Inf overflow
+        return _HistogramShard(len(self.buckets) + 1)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def _render_child(self, labels: Dict[str, str], child: _Child) -> List[str]:
+        shards = child.shards()
+        counts = [sum(shard.buckets[i] for shard in shards) for i in range(len(self.buckets) + 1)]
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), counts):
+            cumulative += count
+            bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+            lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+        label_text = _format_labels(labels)
+        lines.append(f"{self.name}_sum{label_text} {_format_value(sum(shard.sum for shard in shards))}")
+        lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics and scrape-time collectors rendered together"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Collector] = []
+
+    def register(self, metric: _Metric):
+        self._metrics.append(metric)
+
+    def register_collector(self, collector: Collector):
+        """Add a callable read at scrape time; it yields (name, type, documentation, samples)"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text format"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, type_name, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {type_name}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording HTTP latency per route and requests in flight
+
+    Latency runs until the response has been fully sent, so streamed
+    responses are measured end to end. Routes are labelled by their path
+    template, not the raw path, to keep label values bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status["code"])
+            ).observe(time.perf_counter() - start)
+
+
+# HTTP layer
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency until the response is fully sent",
+    ["method", "route", "status"]
+)
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests being served")
+
+# Translation service
+TRANSLATION_DURATION = Histogram(
+    "translation_duration_seconds",
+    "Translation latency per operation, engine and language pair",
+    ["operation", "engine", "pair"]
+)
+TRANSLATED_CHARACTERS = Counter(
+    "translation_characters_total",
+    "Source characters translated; rate() gives characters per second",
+    ["engine", "pair"]
+)
+TRANSLATED_TEXTS = Counter(
+    "translation_texts_total",
+    "Texts translated",
+    ["engine", "pair"]
+)
+
+# Local engines
+LOCAL_INPUT_TOKENS = Counter(
+    "local_input_tokens_total",
+    "Source tokens fed to local models; rate() gives tokens per second",
+    ["engine"]
+)
+LOCAL_OUTPUT_TOKENS = Counter(
+    "local_output_tokens_total",
+    "Tokens generated by local models, padding excluded",
+    ["engine"]
+)
+LOCAL_BATCH_SIZE = Histogram(
+    "local_batch_size",
+    "Rows per generate() call",
+    ["engine"],
+    buckets=SIZE_BUCKETS
+)
+LOCAL_PADDING_EFFICIENCY = Histogram(
+    "local_padding_efficiency",
+    "Real tokens / padded tokens per batch",
+    ["engine"],
+    buckets=RATIO_BUCKETS
+)
+
+# Queues
+EXECUTOR_QUEUE_WAIT = Histogram(
+    "executor_queue_wait_seconds",
+    "Time calls wait for an executor thread",
+    ["executor"]
+)
+MICROBATCH_QUEUE_WAIT = Histogram(
+    "microbatch_queue_wait_seconds",
+    "Time single texts wait to be flushed in a micro-batch"
+)
+MICROBATCH_SIZE = Histogram(
+    "microbatch_size",
+    "Texts per flushed micro-batch",
+    buckets=SIZE_BUCKETS
+)
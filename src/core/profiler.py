@@ -0,0 +1,234 @@
+"""
+Opt-in sampling profiler keeping stack profiles of the slowest requests
+
+While running, a background thread samples the Python stack of every busy
+thread each ``interval_ms`` and adds the samples to every request in flight.
+When a request finishes and is among the ``slowest`` seen since the
+profiler started, its samples are written to ``output_dir`` as collapsed
+stacks (``<name>.folded``, readable by flamegraph.pl and speedscope) with a
+``<name>.json`` summary carrying the duration and Server-Timing stages;
+files of requests pushed out of the top N are deleted. Files are written on
+a writer thread, so the event loop never waits on disk.
+
+With concurrent requests the samples of overlapping requests are shared, so
+profiles are clearest at low concurrency. Stopped, the profiler costs one
+attribute check per request.
+"""
+import heapq
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_STACK_DEPTH = 64
+
+# Innermost frames of threads that are waiting rather than working
+_IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("thread.py", "_worker"),
+    ("queue.py", "get"),
+}
+
+
+@dataclass
+class _RequestProfile:
+    method: str
+    path: str
+    started_at: float
+    samples: Counter = field(default_factory=Counter)
+
+
+class SamplingProfiler:
+    """Samples thread stacks while enabled and keeps the slowest requests' profiles"""
+
+    def __init__(self, output_dir: str, slowest: int = 10, interval_ms: float = 5.0):
+        self.output_dir = output_dir
+        self.slowest = max(1, slowest)
+        self.interval_ms = max(0.5, interval_ms)
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._active: Dict[int, _RequestProfile] = {}
+        self._ids = itertools.count()
+        # Min-heap of (duration, sequence, file stem) of the kept profiles
+        self._kept: List[Tuple[float, int, str]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._stop = threading.Event()
+
+    def start(self, slowest: Optional[int] = None, interval_ms: Optional[float] = None):
+        """Start sampling; kept profiles of a previous run are forgotten, not deleted"""
+        with self._lock:
+            if slowest is not None:
+                self.slowest = max(1, slowest)
+            if interval_ms is not None:
+                self.interval_ms = max(0.5, interval_ms)
+            if self.enabled:
+                return
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._kept = []
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._sample_loop, name="sampling-profiler", daemon=True)
+            # One thread, so a profile and the eviction of older ones stay ordered
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-writer")
+            self.enabled = True
+            self._thread.start()
+        logger.info(
+            f"Sampling profiler started: every {self.interval_ms}ms, "
+            f"keeping the {self.slowest} slowest requests in {self.output_dir}"
+        )
+
+    def stop(self):
+        """Stop sampling and finish pending writes; kept profiles stay on disk (blocking)"""
+        with self._lock:
+            if not self.enabled:
+                return
+            self.enabled = False
+            self._stop.set()
+            self._active.clear()
+            thread, writer = self._thread, self._writer
+        if thread is not None:
+            thread.join(timeout=1)
+        if writer is not None:
+            writer.shutdown(wait=True)
+        logger.info("Sampling profiler stopped")
+
+    def begin_request(self, scope: Dict[str, Any]) -> Optional[Tuple[int, _RequestProfile]]:
+        """Start collecting samples for a request; None while stopped"""
+        if not self.enabled:
+            return None
+        profile = _RequestProfile(scope.get("method", ""), scope.get("path", ""), time.time())
+        request_id = next(self._ids)
+        with self._lock:
+            self._active[request_id] = profile
+        return request_id, profile
+
+    def end_request(self, handle: Tuple[int, _RequestProfile], duration: float, stages: Dict[str, float]):
+        """Keep a finished request's profile if it is among the slowest; files are written in the background"""
+        request_id, profile = handle
+        with self._lock:
+            self._active.pop(request_id, None)
+            if not self.enabled:
+                return
+            if len(self._kept) >= self.slowest and duration <= self._kept[0][0]:
+                return
+            stem = f"{int(duration * 1000):07d}ms-{request_id}"
+            heapq.heappush(self._kept, (duration, request_id, stem))
+            evicted = heapq.heappop(self._kept) if len(self._kept) > self.slowest else None
+            self._writer.submit(
+                self._persist,
+                stem,
+                profile,
+                duration,
+                dict(stages),
+                evicted[2] if evicted is not None else None
+            )
+
+    def _persist(
+        self,
+        stem: str,
+        profile: _RequestProfile,
+        duration: float,
+        stages: Dict[str, float],
+        evicted_stem: Optional[str]
+    ):
+        """Write a kept profile and delete the one it pushed out, on the writer thread"""
+        try:
+            self._write(stem, profile, duration, stages)
+            if evicted_stem is not None:
+                for suffix in (".folded", ".json"):
+                    path = os.path.join(self.output_dir, evicted_stem + suffix)
+                    if os.path.exists(path):
+                        os.remove(path)
+        except OSError as e:
+            logger.warning(f"Could not write request profile: {str(e)}")
+
+    def status(self) -> Dict[str, Any]:
+        """Current settings and the kept profiles, slowest first"""
+        with self._lock:
+            kept = sorted(self._kept, reverse=True)
+        return {
+            "enabled": self.enabled,
+            "interval_ms": self.interval_ms,
+            "slowest": self.slowest,
+            "output_dir": self.output_dir,
+            "profiles": [
+                {"duration_ms": round(duration * 1000, 1), "file": os.path.join(self.output_dir, stem + ".folded")}
+                for duration, _, stem in kept
+            ],
+        }
+
+    def _write(self, stem: str, profile: _RequestProfile, duration: float, stages: Dict[str, float]):
+        with open(os.path.join(self.output_dir, stem + ".folded"), "w", encoding="utf-8") as folded:
+            for stack, count in profile.samples.most_common():
+                folded.write(f"{stack} {count}\n")
+        summary = {
+            "method": profile.method,
+            "path": profile.path,
+            "started_at": profile.started_at,
+            "duration_ms": round(duration * 1000, 2),
+            "stages_ms": {name: round(seconds * 1000, 2) for name, seconds in stages.items()},
+            "samples": sum(profile.samples.values()),
+            "interval_ms": self.interval_ms,
+        }
+        with open(os.path.join(self.output_dir, stem + ".json"), "w", encoding="utf-8") as summary_file:
+            json.dump(summary, summary_file, indent=2)
+
+    def _sample_loop(self):
+        own_ident = threading.get_ident()
+        stop = self._stop
+        while not stop.wait(self.interval_ms / 1000):
+            if not self._active:
+                continue
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            stacks = []
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = _collapse(frame)
+                if stack is not None:
+                    stacks.append(f"{names.get(ident, ident)};{stack}")
+            with self._lock:
+                for profile in self._active.values():
+                    profile.samples.update(stacks)
+
+
+def _collapse(frame) -> Optional[str]:
+    """Root-first ``function (file:line)`` frames joined by ';', or None for idle threads"""
+    code = frame.f_code
+    if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+        return None
+    frames = []
+    while frame is not None and len(frames) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(frames))
+
+
+def get_profiler() -> SamplingProfiler:
+    """Get the process-wide profiler, configured from settings"""
+    global _profiler
+
+    if _profiler is None:
+        from src.core.config import get_settings
+
+        settings = get_settings()
+        _profiler = SamplingProfiler(
+            settings.PROFILER_OUTPUT_DIR,
+            slowest=settings.PROFILER_SLOWEST,
+            interval_ms=settings.PROFILER_INTERVAL_MS
+        )
+    return _profiler
+
+
+_profiler: Optional[SamplingProfiler] = None
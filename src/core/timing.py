@@ -0,0 +1,190 @@
+"""
+Per-request stage timers, reported in the Server-Timing response header
+
+TimingMiddleware gives every HTTP request a dict of stage durations in a
+context variable. Code on the request path adds to it with ``stage(name)``;
+the context is copied into executor threads and into ``asyncio.to_thread``,
+so tokenization and generation running off the event loop are attributed to
+the request that asked for them. Durations of a stage are summed, so stages
+run concurrently (e.g. parallel API calls) can add up to more than the
+request's wall time.
+
+Stages recorded:
+    validate, serialize        request parsing and response serialization
+    tokenize, generate, decode local engines
+    inference_queue, ...       time waiting for an executor thread
+    microbatch_wait            time waiting for a micro-batch to flush
+    google, openai             remote API calls
+    rate_limit                 time waiting for the client-side rate limiter
+"""
+import asyncio
+import functools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from fastapi.routing import APIRoute
+
+_stages: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_stages", default=None)
+
+
+def current_stages() -> Optional[Dict[str, float]]:
+    """Stage durations of the request being served, if any"""
+    return _stages.get()
+
+
+def begin_stages() -> Dict[str, float]:
+    """Start a fresh set of stage durations in the current context"""
+    stages: Dict[str, float] = {}
+    _stages.set(stages)
+    return stages
+
+
+def record_stage(name: str, seconds: float, stages: Optional[Dict[str, float]] = None):
+    """Add a duration to a stage of the current (or a given) request"""
+    if stages is None:
+        stages = _stages.get()
+    if stages is not None:
+        stages[name] = stages.get(name, 0.0) + seconds
+
+
+def merge_stages(target: Optional[Dict[str, float]], source: Dict[str, float]):
+    """Add every stage of ``source`` to ``target``"""
+    if target is not None:
+        for name, seconds in source.items():
+            target[name] = target.get(name, 0.0) + seconds
+
+
+class stage:
+    """
+    Time a block as a stage of the current request
+
+    A no-op outside requests, so engine code can use it unconditionally.
+    """
+
+    __slots__ = ("name", "stages", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.stages = _stages.get()
+        if self.stages is not None:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.stages is not None:
+            elapsed = time.perf_counter() - self.start
+            self.stages[self.name] = self.stages.get(self.name, 0.0) + elapsed
+        return False
+
+
+def server_timing_header(stages: Dict[str, float], total: float) -> str:
+    """Format stages and the total as a Server-Timing header value (milliseconds)"""
+    metrics = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in list(stages.items())]
+    metrics.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(metrics)
+
+
+class TimingMiddleware:
+    """
+    ASGI middleware adding a Server-Timing header to every response
+
+    The header is sent with the response start, so a streamed response
+    reports the stages completed before its first byte. Finished requests
+    are handed to the sampling profiler when it is running.
+    """
+
+    def __init__(self, app, profiler: Optional[Any] = None):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stages: Dict[str, float] = {}
+        token = _stages.set(stages)
+        start = time.perf_counter()
+        profile = self.profiler.begin_request(scope) if self.profiler is not None else None
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                header = server_timing_header(stages, time.perf_counter() - start)
+                message = {
+                    **message,
+                    "headers": list(message.get("headers", [])) + [
+                        (b"server-timing", header.encode("latin-1"))
+                    ],
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _stages.reset(token)
+            if profile is not None:
+                self.profiler.end_request(profile, time.perf_counter() - start, stages)
+
+
+@dataclass
+class _RouteMarks:
+    started: float
+    handler_started: Optional[float] = None
+    handler_finished: Optional[float] = None
+
+
+_route_marks: ContextVar[Optional[_RouteMarks]] = ContextVar("route_marks", default=None)
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark when the endpoint body starts and ends"""
+    if not asyncio.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    async def timed(*args, **kwargs):
+        marks = _route_marks.get()
+        if marks is not None:
+            marks.handler_started = time.perf_counter()
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            if marks is not None:
+                marks.handler_finished = time.perf_counter()
+
+    return timed
+
+
+class TimedRoute(APIRoute):
+    """
+    Route recording request validation and response serialization stages
+
+    FastAPI parses and validates the request before calling the endpoint
+    and serializes its return value afterwards; the gaps around the
+    endpoint body are recorded as ``validate`` and ``serialize``.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            marks = _RouteMarks(started=time.perf_counter())
+            token = _route_marks.set(marks)
+            try:
+                return await handler(request)
+            finally:
+                _route_marks.reset(token)
+                finished = time.perf_counter()
+                if marks.handler_started is not None:
+                    record_stage("validate", marks.handler_started - marks.started)
+                if marks.handler_finished is not None:
+                    record_stage("serialize", finished - marks.handler_finished)
+
+        return timed_handler
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Any, AsyncIterator
 from src.core.enums import SupportedLanguage
 
 
@@ -46,6 +46,51 @@ class TranslationProvider(ABC):
         """
         pass
     
+    async def batch_translate_stream(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Translate multiple texts, yielding each result as soon as it is ready
+        
+        Results may arrive out of order. The default implementation translates
+        texts one at a time; providers that batch or fan out override it.
+        
+        Args:
+            texts: List of texts to translate
+            source_language: Source language code
+            target_language: Target language code
+            
+        Yields:
+            Tuples of (index into texts, translated text)
+        """
+        for index, text in enumerate(texts):
+            yield index, await self.translate(text, source_language, target_language)
+    
+    async def translate_stream(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> AsyncIterator[Tuple[str, int]]:
+        """
+        Translate text, yielding the translation incrementally
+        
+        The default implementation yields the complete translation once;
+        providers that can stream tokens override it.
+        
+        Args:
+            text: Text to translate
+            source_language: Source language code
+            target_language: Target language code
+            
+        Yields:
+            Tuples of (text delta, number of tokens generated for it; 0 if unknown)
+        """
+        yield await self.translate(text, source_language, target_language), 0
+    
     @abstractmethod
     async def get_supported_languages(self) -> Dict[str, str]:
         """
@@ -79,3 +124,26 @@ class TranslationProvider(ABC):
             True if healthy, False otherwise
         """
         pass
+    
+    @property
+    def engine_name(self) -> str:
+        """Engine name reported in API responses"""
+        return self.__class__.__name__
+    
+    def cache_identity(self) -> str:
+        """
+        Identify the engine, model and precision producing translations
+        
+        Returns:
+            String that changes whenever the same input could translate differently
+        """
+        return self.__class__.__name__
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get runtime statistics for this provider
+        
+        Returns:
+            Dict of statistic names and values (empty if none are collected)
+        """
+        return {}
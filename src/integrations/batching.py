@@ -0,0 +1,289 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from src.core.metrics import MICROBATCH_QUEUE_WAIT, MICROBATCH_SIZE
+from src.core.timing import begin_stages, current_stages, merge_stages, record_stage
+
+logger = logging.getLogger(__name__)
+
+BatchFunction = Callable[[List[str], str, str], Awaitable[List[str]]]
+
+
+def percentile(samples, pct: float) -> float:
+    """
+    Nearest-rank percentile of a sample collection
+
+    Args:
+        samples: Iterable of numeric samples
+        pct: Percentile in the range 0-100
+
+    Returns:
+        Percentile value, or 0.0 when there are no samples
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = int(round(pct / 100 * (len(ordered) - 1)))
+    return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+
+def plan_token_batches(
+    lengths: List[int],
+    max_batch_tokens: int,
+    max_batch_size: int = 0
+) -> List[List[int]]:
+    """
+    Group inputs into length-sorted batches under a padded-token budget
+
+    Inputs are sorted longest first so that each batch pads to the length of
+    its first item; items are added while ``batch_size * longest`` stays
+    within ``max_batch_tokens`` and the batch has fewer than
+    ``max_batch_size`` rows. An input longer than the budget gets a batch of
+    its own.
+
+    Args:
+        lengths: Token length of every input, in original order
+        max_batch_tokens: Maximum padded tokens per batch
+        max_batch_size: Maximum rows per batch (0 = bounded by tokens only)
+
+    Returns:
+        Batches as lists of indices into the original input list
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+
+    batches: List[List[int]] = []
+    current: List[int] = []
+    longest = 0
+    for index in order:
+        if not current:
+            longest = max(lengths[index], 1)
+        elif (len(current) + 1) * longest > max_batch_tokens or len(current) == max_batch_size:
+            batches.append(current)
+            current = []
+            longest = max(lengths[index], 1)
+        current.append(index)
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def pack_by_budget(
+    sizes: List[int],
+    max_items: int,
+    max_size: int
+) -> List[List[int]]:
+    """
+    Pack consecutive inputs into requests under an item count and size budget
+
+    Inputs keep their original order so that results map straight back to
+    their indices. An input larger than ``max_size`` gets a request of its own.
+
+    Args:
+        sizes: Size of every input (characters, estimated tokens, ...)
+        max_items: Maximum inputs per request (0 = unlimited)
+        max_size: Maximum total size per request (0 = unlimited)
+
+    Returns:
+        Requests as lists of indices into the original input list
+    """
+    packs: List[List[int]] = []
+    current: List[int] = []
+    total = 0
+    for index, size in enumerate(sizes):
+        if current and (
+            (max_items and len(current) >= max_items) or
+            (max_size and total + size > max_size)
+        ):
+            packs.append(current)
+            current = []
+            total = 0
+        current.append(index)
+        total += size
+
+    if current:
+        packs.append(current)
+    return packs
+
+
+@dataclass
+class _PendingItem:
+    """Single caller waiting on a coalesced batch"""
+    text: str
+    future: asyncio.Future
+    enqueued_at: float
+    # Stage timers of the caller's request, if any
+    stages: Optional[Dict[str, float]] = None
+
+
+@dataclass
+class BatcherStats:
+    """Rolling latency and batch-fill statistics for a micro-batcher"""
+    max_batch_size: int
+    window: int = 1000
+    batches: int = 0
+    requests: int = 0
+    latencies_ms: Deque[float] = field(default_factory=deque)
+    queue_waits_ms: Deque[float] = field(default_factory=deque)
+    batch_sizes: Deque[int] = field(default_factory=deque)
+
+    def __post_init__(self):
+        self.latencies_ms = deque(maxlen=self.window)
+        self.queue_waits_ms = deque(maxlen=self.window)
+        self.batch_sizes = deque(maxlen=self.window)
+
+    def record_batch(self, size: int, queue_waits_ms: List[float]):
+        """Record a flushed batch and the time its items spent queued"""
+        self.batches += 1
+        self.requests += size
+        self.batch_sizes.append(size)
+        self.queue_waits_ms.extend(queue_waits_ms)
+
+    def record_latency(self, latency_ms: float):
+        """Record end-to-end latency of one coalesced request"""
+        self.latencies_ms.append(latency_ms)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get a point-in-time view of the statistics"""
+        sizes = list(self.batch_sizes)
+        avg_size = sum(sizes) / len(sizes) if sizes else 0.0
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "avg_batch_size": round(avg_size, 2),
+            "batch_fill_ratio": round(avg_size / self.max_batch_size, 3) if self.max_batch_size else 0.0,
+            "latency_p50_ms": round(percentile(self.latencies_ms, 50), 2),
+            "latency_p99_ms": round(percentile(self.latencies_ms, 99), 2),
+            "queue_wait_p50_ms": round(percentile(self.queue_waits_ms, 50), 2),
+            "queue_wait_p99_ms": round(percentile(self.queue_waits_ms, 99), 2),
+        }
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-text requests into batched model calls
+
+    Requests for the same language pair are collected until either
+    ``max_batch_size`` items are waiting or ``max_wait_ms`` has passed since
+    the first one arrived, then translated with a single call to
+    ``batch_fn``. Each caller awaits its own future.
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFunction,
+        max_batch_size: int,
+        max_wait_ms: float
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.stats = BatcherStats(max_batch_size=self.max_batch_size)
+        self._pending: Dict[Tuple[str, str], List[_PendingItem]] = {}
+        self._timers: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+        # The loop only keeps weak references to tasks; hold running batches
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> str:
+        """
+        Queue a text for translation and wait for its batch to complete
+
+        Args:
+            text: Text to translate
+            source_language: Source language code
+            target_language: Target language code
+
+        Returns:
+            Translated text
+        """
+        loop = asyncio.get_running_loop()
+        key = (source_language, target_language)
+        item = _PendingItem(text, loop.create_future(), time.perf_counter(), current_stages())
+
+        queue = self._pending.setdefault(key, [])
+        queue.append(item)
+        if len(queue) >= self.max_batch_size:
+            self._flush(key)
+        elif len(queue) == 1:
+            self._timers[key] = loop.call_later(self.max_wait, self._flush, key)
+
+        result = await item.future
+        self.stats.record_latency((time.perf_counter() - item.enqueued_at) * 1000)
+        return result
+
+    def _flush(self, key: Tuple[str, str]):
+        """Detach the pending items for a language pair and start their batch"""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        items = [item for item in self._pending.pop(key, []) if not item.future.done()]
+        if items:
+            task = asyncio.ensure_future(self._run_batch(key, items))
+            self._tasks.add(task)
+            task.add_done_callback(self._batch_done)
+
+    def _batch_done(self, task: asyncio.Task):
+        """Release a finished batch task and retrieve its exception"""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Micro-batch task failed: {str(task.exception())}")
+
+    async def _run_batch(self, key: Tuple[str, str], items: List[_PendingItem]):
+        """Translate one coalesced batch and resolve every caller"""
+        started = time.perf_counter()
+        self.stats.record_batch(
+            len(items),
+            [(started - item.enqueued_at) * 1000 for item in items]
+        )
+        MICROBATCH_SIZE.observe(len(items))
+        for item in items:
+            MICROBATCH_QUEUE_WAIT.observe(started - item.enqueued_at)
+            record_stage("microbatch_wait", started - item.enqueued_at, item.stages)
+
+        # The batch runs for every caller, so its stages are timed apart
+        # and credited to each caller's request
+        batch_stages = begin_stages()
+        try:
+            results = await self.batch_fn([item.text for item in items], *key)
+        except Exception as e:
+            self._credit_stages(items, batch_stages)
+            logger.error(f"Micro-batch of {len(items)} failed: {str(e)}")
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+
+        self._credit_stages(items, batch_stages)
+        if len(results) != len(items):
+            error = RuntimeError(
+                f"Batch returned {len(results)} results for {len(items)} inputs"
+            )
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(error)
+            return
+
+        for item, result in zip(items, results):
+            if not item.future.done():
+                item.future.set_result(result)
+
+    @staticmethod
+    def _credit_stages(items: List[_PendingItem], batch_stages: Dict[str, float]):
+        for item in items:
+            merge_stages(item.stages, batch_stages)
+
+    def pending_count(self, key: Optional[Tuple[str, str]] = None) -> int:
+        """Number of requests waiting to be flushed"""
+        if key is not None:
+            return len(self._pending.get(key, []))
+        return sum(len(queue) for queue in self._pending.values())
@@ -0,0 +1,375 @@
+import hashlib
+import logging
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from src.integrations.base import TranslationProvider
+from src.core.config import get_settings
+from src.core.exceptions import PartialBatchTranslationException
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Seconds to stop talking to Redis after a connection error
+REDIS_RETRY_INTERVAL = 30.0
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache lookups (NFC, surrounding whitespace)"""
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def make_cache_key(
+    identity: str,
+    source_language: str,
+    target_language: str,
+    text: str
+) -> str:
+    """
+    Build a cache key for a translation
+
+    Args:
+        identity: Engine, model and precision of the provider
+        source_language: Source language code
+        target_language: Target language code
+        text: Text to translate
+
+    Returns:
+        Namespaced SHA-256 key
+    """
+    payload = "\x1f".join(
+        [identity, source_language, target_language, normalize_text(text)]
+    )
+    return "translation:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """In-process LRU cache bounded by entry count and total size in bytes"""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a value and mark it as recently used"""
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str):
+        """Store a value, evicting least recently used entries as needed"""
+        size = self._size(key, value)
+        if size > self.max_bytes:
+            return
+
+        if key in self._data:
+            self.current_bytes -= self._size(key, self._data.pop(key))
+
+        self._data[key] = value
+        self.current_bytes += size
+
+        while (
+            len(self._data) > self.max_entries or
+            self.current_bytes > self.max_bytes
+        ):
+            old_key, old_value = self._data.popitem(last=False)
+            self.current_bytes -= self._size(old_key, old_value)
+
+    def clear(self):
+        """Remove every entry"""
+        self._data.clear()
+        self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def _size(key: str, value: str) -> int:
+        return len(key) + len(value.encode("utf-8"))
+
+
+class CachedTranslationProvider(TranslationProvider):
+    """
+    Two-tier translation cache wrapped around another provider
+
+    Lookups go to a bounded in-process LRU first, then to Redis. Misses are
+    translated by the wrapped provider and written back to both tiers.
+    Redis errors are logged and treated as misses so the cache can never take
+    translation down.
+    """
+
+    def __init__(self, provider: TranslationProvider, redis_client=None):
+        """
+        Initialize the cache
+
+        Args:
+            provider: Provider to wrap
+            redis_client: Async Redis client; created from REDIS_URL if omitted
+                and CACHE_REDIS_ENABLED is set
+        """
+        self.provider = provider
+        self.memory = LRUCache(
+            max_entries=settings.CACHE_MEMORY_MAX_ENTRIES,
+            max_bytes=settings.CACHE_MEMORY_MAX_BYTES
+        )
+        self.ttl = settings.CACHE_TTL
+        self.redis = redis_client
+        if self.redis is None and settings.CACHE_REDIS_ENABLED:
+            try:
+                from redis import asyncio as aioredis
+
+                self.redis = aioredis.from_url(settings.REDIS_URL)
+            except ImportError:
+                logger.warning("redis not installed, using in-process cache only")
+
+        self._redis_retry_at = 0.0
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.redis_errors = 0
+
+    @property
+    def engine_name(self) -> str:
+        return self.provider.engine_name
+
+    def cache_identity(self) -> str:
+        return self.provider.cache_identity()
+
+    async def translate(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> str:
+        """Translate text, serving repeated requests from the cache"""
+        key = self._key(text, source_language, target_language)
+
+        cached = self.memory.get(key)
+        if cached is not None:
+            self.memory_hits += 1
+            return cached
+
+        cached = (await self._redis_get([key]))[0]
+        if cached is not None:
+            self.redis_hits += 1
+            self.memory.set(key, cached)
+            return cached
+
+        self.misses += 1
+        translated = await self.provider.translate(
+            text,
+            source_language,
+            target_language
+        )
+        self.memory.set(key, translated)
+        await self._redis_set({key: translated})
+        return translated
+
+    async def batch_translate(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[str]:
+        """
+        Batch translate texts, only sending cache misses to the provider
+
+        Memory misses are looked up in Redis with a single MGET, and new
+        translations are written back in a single pipeline.
+        """
+        keys = [self._key(text, source_language, target_language) for text in texts]
+        results: List[Optional[str]] = [self.memory.get(key) for key in keys]
+        self.memory_hits += sum(result is not None for result in results)
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            remote = await self._redis_get([keys[i] for i in pending])
+            for i, value in zip(pending, remote):
+                if value is not None:
+                    self.redis_hits += 1
+                    results[i] = value
+                    self.memory.set(keys[i], value)
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            self.misses += len(missing)
+            errors = {}
+            engine = None
+            try:
+                translated = await self.provider.batch_translate(
+                    [texts[i] for i in missing],
+                    source_language,
+                    target_language
+                )
+            except PartialBatchTranslationException as e:
+                # Keep what succeeded; report failures against our own indices
+                translated = e.results
+                engine = e.engine
+                errors = {missing[position]: message for position, message in e.errors.items()}
+
+            fresh = {}
+            for i, value in zip(missing, translated):
+                results[i] = value
+                if value is not None:
+                    self.memory.set(keys[i], value)
+                    fresh[keys[i]] = value
+            await self._redis_set(fresh)
+
+            if errors:
+                raise PartialBatchTranslationException(results, errors, engine)
+
+        return results
+
+    async def batch_translate_stream(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """Yield cached translations immediately, then stream the misses"""
+        keys = [self._key(text, source_language, target_language) for text in texts]
+
+        pending = []
+        for i, key in enumerate(keys):
+            cached = self.memory.get(key)
+            if cached is None:
+                pending.append(i)
+            else:
+                self.memory_hits += 1
+                yield i, cached
+
+        missing = []
+        remote = await self._redis_get([keys[i] for i in pending])
+        for i, value in zip(pending, remote):
+            if value is None:
+                missing.append(i)
+            else:
+                self.redis_hits += 1
+                self.memory.set(keys[i], value)
+                yield i, value
+
+        if not missing:
+            return
+
+        self.misses += len(missing)
+        fresh = {}
+        async for position, value in self.provider.batch_translate_stream(
+            [texts[i] for i in missing],
+            source_language,
+            target_language
+        ):
+            i = missing[position]
+            self.memory.set(keys[i], value)
+            fresh[keys[i]] = value
+            yield i, value
+        await self._redis_set(fresh)
+
+    async def translate_stream(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> AsyncIterator[Tuple[str, int]]:
+        """Yield a cached translation whole, otherwise stream and cache it"""
+        key = self._key(text, source_language, target_language)
+        cached = self.memory.get(key)
+        if cached is not None:
+            self.memory_hits += 1
+            yield cached, 0
+            return
+
+        cached = (await self._redis_get([key]))[0]
+        if cached is not None:
+            self.redis_hits += 1
+            self.memory.set(key, cached)
+            yield cached, 0
+            return
+
+        self.misses += 1
+        parts = []
+        async for delta, tokens in self.provider.translate_stream(
+            text,
+            source_language,
+            target_language
+        ):
+            parts.append(delta)
+            yield delta, tokens
+
+        translated = "".join(parts)
+        self.memory.set(key, translated)
+        await self._redis_set({key: translated})
+
+    async def get_supported_languages(self) -> Dict[str, str]:
+        return await self.provider.get_supported_languages()
+
+    def validate_language_pair(
+        self,
+        source_language: str,
+        target_language: str
+    ) -> bool:
+        return self.provider.validate_language_pair(source_language, target_language)
+
+    async def health_check(self) -> bool:
+        return await self.provider.health_check()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters merged with the wrapped provider's statistics"""
+        lookups = self.memory_hits + self.redis_hits + self.misses
+        stats = dict(self.provider.get_stats())
+        stats["cache"] = {
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": round((lookups - self.misses) / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.current_bytes,
+            "redis_errors": self.redis_errors,
+        }
+        return stats
+
+    def _key(self, text: str, source_language: str, target_language: str) -> str:
+        return make_cache_key(
+            self.provider.cache_identity(),
+            source_language,
+            target_language,
+            text
+        )
+
+    def _redis_available(self) -> bool:
+        return self.redis is not None and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, e: Exception):
+        self.redis_errors += 1
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        logger.warning(f"Redis cache unavailable, using in-process cache only: {str(e)}")
+
+    async def _redis_get(self, keys: List[str]) -> List[Optional[str]]:
+        """Look up keys in Redis with a single MGET"""
+        if not keys or not self._redis_available():
+            return [None] * len(keys)
+        try:
+            values = await self.redis.mget(keys)
+        except Exception as e:
+            self._redis_failed(e)
+            return [None] * len(keys)
+        return [
+            value.decode("utf-8") if isinstance(value, bytes) else value
+            for value in values
+        ]
+
+    async def _redis_set(self, entries: Dict[str, str]):
+        """Write entries to Redis with TTL in a single pipeline"""
+        if not entries or not self._redis_available():
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in entries.items():
+                    pipe.set(key, value, ex=self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
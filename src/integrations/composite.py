@@ -0,0 +1,390 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.core.config import get_settings
+from src.core.exceptions import (
+    InvalidLanguageException,
+    PartialBatchTranslationException,
+    TranslationEngineException
+)
+from src.integrations.base import TranslationProvider
+from src.integrations.batching import percentile
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Latency samples kept per engine for the hedging percentile
+LATENCY_WINDOW = 256
+
+
+@dataclass
+class EngineState:
+    """Observed latency and health of one routed engine"""
+    name: str
+    provider: TranslationProvider
+    ewma_latency: Optional[float] = None
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    consecutive_failures: int = 0
+    unhealthy_until: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    hedges_started: int = 0
+    hedges_won: int = 0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def record_success(self, latency: float):
+        alpha = settings.ROUTER_EWMA_ALPHA
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = alpha * latency + (1 - alpha) * self.ewma_latency
+        self.latencies.append(latency)
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+
+    def record_failure(self):
+        self.errors += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= settings.ROUTER_MAX_FAILURES:
+            self.unhealthy_until = time.monotonic() + settings.ROUTER_UNHEALTHY_COOLDOWN
+            logger.warning(
+                f"Engine {self.name} marked unhealthy for "
+                f"{settings.ROUTER_UNHEALTHY_COOLDOWN}s after "
+                f"{self.consecutive_failures} consecutive failures"
+            )
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait on this engine before sending a hedged request; None = don't hedge"""
+        floor = settings.ROUTER_HEDGE_MIN_DELAY_MS / 1000
+        if self.ewma_latency is None:
+            # Nothing to compare against yet: hedging now would duplicate
+            # every cold-start call on a paid engine
+            initial = settings.ROUTER_HEDGE_INITIAL_DELAY_MS / 1000
+            return max(initial, floor) if initial > 0 else None
+        if len(self.latencies) < settings.ROUTER_HEDGE_MIN_SAMPLES:
+            return max(2 * self.ewma_latency, floor)
+        return max(percentile(self.latencies, settings.ROUTER_HEDGE_PERCENTILE), floor)
+
+
+class CompositeTranslationProvider(TranslationProvider):
+    """
+    Routes each request across several engines
+
+    Engines that support the language pair are ranked healthy first, then by
+    EWMA latency. An engine without latency samples is ranked at the average
+    of the others: among equals, engines never tried go first (so each gets
+    measured) and engines that have only failed go last. A failed call
+    fails over to the next engine; an engine failing ROUTER_MAX_FAILURES
+    times in a row is ranked last for ROUTER_UNHEALTHY_COOLDOWN seconds. With
+    hedging enabled, a single translation still running after the primary
+    engine's p95 latency is duplicated on the next engine and whichever
+    answer arrives first wins.
+    """
+
+    def __init__(self, providers: Dict[str, TranslationProvider]):
+        """
+        Initialize the router
+
+        Args:
+            providers: Engines to route across, by name, in preference order
+        """
+        if not providers:
+            raise TranslationEngineException("No engines to route across", "composite")
+        self.engines = [EngineState(name, provider) for name, provider in providers.items()]
+        self.hedged_requests = 0
+        self.failovers = 0
+
+    async def translate(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> str:
+        """Translate on the fastest healthy engine, hedging slow calls"""
+        return await self._route(
+            self._rank(source_language, target_language),
+            lambda provider: provider.translate(text, source_language, target_language),
+            hedge=settings.ROUTER_HEDGE_ENABLED
+        )
+
+    async def batch_translate(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[str]:
+        """
+        Batch translate on the fastest healthy engine
+
+        Texts an engine failed to translate are retried on the next engine.
+        Batches are not hedged, since that would double their cost.
+
+        Raises:
+            PartialBatchTranslationException: If some texts failed on every engine
+        """
+        ranked = self._rank(source_language, target_language)
+        results: List[Optional[str]] = [None] * len(texts)
+        pending = list(range(len(texts)))
+        errors: Dict[int, str] = {}
+
+        while pending and ranked:
+            engine = ranked.pop(0)
+            batch = [texts[i] for i in pending]
+            try:
+                translated = await self._timed(
+                    engine,
+                    lambda provider: provider.batch_translate(batch, source_language, target_language)
+                )
+                failed = {}
+            except PartialBatchTranslationException as e:
+                translated = e.results
+                failed = e.errors
+            except Exception as e:
+                logger.warning(f"Engine {engine.name} failed: {str(e)}")
+                if ranked:
+                    self.failovers += 1
+                    continue
+                if len(pending) == len(texts):
+                    # Nothing succeeded on any engine
+                    raise
+                translated = [None] * len(pending)
+                failed = {position: getattr(e, "message", str(e)) for position in range(len(pending))}
+
+            still_pending = []
+            for position, index in enumerate(pending):
+                if position in failed:
+                    errors[index] = failed[position]
+                    still_pending.append(index)
+                else:
+                    results[index] = translated[position]
+                    errors.pop(index, None)
+            pending = still_pending
+            if pending and ranked:
+                self.failovers += 1
+
+        if errors:
+            raise PartialBatchTranslationException(results, errors, "composite")
+        return results
+
+    async def batch_translate_stream(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """Stream from the best engine, failing over until the first result"""
+        ranked = self._rank(source_language, target_language)
+        for position, engine in enumerate(ranked):
+            started = False
+            try:
+                async for item in engine.provider.batch_translate_stream(
+                    texts, source_language, target_language
+                ):
+                    started = True
+                    yield item
+                return
+            except Exception as e:
+                engine.record_failure()
+                if started or position == len(ranked) - 1:
+                    raise
+                self.failovers += 1
+                logger.warning(f"Engine {engine.name} failed, failing over: {str(e)}")
+
+    async def translate_stream(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> AsyncIterator[Tuple[str, int]]:
+        """Stream tokens from the best engine, failing over until the first delta"""
+        ranked = self._rank(source_language, target_language)
+        for position, engine in enumerate(ranked):
+            started = False
+            try:
+                async for item in engine.provider.translate_stream(
+                    text, source_language, target_language
+                ):
+                    started = True
+                    yield item
+                return
+            except Exception as e:
+                engine.record_failure()
+                if started or position == len(ranked) - 1:
+                    raise
+                self.failovers += 1
+                logger.warning(f"Engine {engine.name} failed, failing over: {str(e)}")
+
+    async def get_supported_languages(self) -> Dict[str, str]:
+        """Union of the languages of every engine that answers"""
+        languages: Dict[str, str] = {}
+        for engine in self.engines:
+            try:
+                for code, name in (await engine.provider.get_supported_languages()).items():
+                    languages.setdefault(code, name)
+            except Exception as e:
+                logger.warning(f"Could not list languages of {engine.name}: {str(e)}")
+        return languages
+
+    def validate_language_pair(
+        self,
+        source_language: str,
+        target_language: str
+    ) -> bool:
+        """A pair is supported if any engine supports it"""
+        return any(
+            engine.provider.validate_language_pair(source_language, target_language)
+            for engine in self.engines
+        )
+
+    async def health_check(self) -> bool:
+        """Healthy while at least one engine is healthy"""
+        results = await asyncio.gather(
+            *(engine.provider.health_check() for engine in self.engines),
+            return_exceptions=True
+        )
+        healthy = False
+        for engine, result in zip(self.engines, results):
+            if result is True:
+                healthy = True
+            else:
+                engine.record_failure()
+        return healthy
+
+    def cache_identity(self) -> str:
+        return "composite:" + ",".join(
+            engine.provider.cache_identity() for engine in self.engines
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get routing statistics and every engine's own statistics"""
+        return {
+            "hedged_requests": self.hedged_requests,
+            "failovers": self.failovers,
+            "engines": {
+                engine.name: {
+                    "healthy": engine.healthy,
+                    "ewma_latency_ms": (
+                        round(engine.ewma_latency * 1000, 2)
+                        if engine.ewma_latency is not None else None
+                    ),
+                    "p95_latency_ms": round(percentile(engine.latencies, 95) * 1000, 2),
+                    "requests": engine.requests,
+                    "errors": engine.errors,
+                    "hedges_started": engine.hedges_started,
+                    "hedges_won": engine.hedges_won,
+                    "stats": engine.provider.get_stats(),
+                }
+                for engine in self.engines
+            },
+        }
+
+    def _rank(self, source_language: str, target_language: str) -> List[EngineState]:
+        """
+        Engines supporting the pair, best first
+
+        Raises:
+            InvalidLanguageException: If no engine supports the pair
+        """
+        candidates = [
+            engine for engine in self.engines
+            if engine.provider.validate_language_pair(source_language, target_language)
+        ]
+        if not candidates:
+            raise InvalidLanguageException(
+                f"Language pair {source_language}->{target_language} not supported"
+            )
+        sampled = [engine.ewma_latency for engine in candidates if engine.ewma_latency is not None]
+        neutral = sum(sampled) / len(sampled) if sampled else 0.0
+
+        def key(engine: EngineState):
+            if engine.ewma_latency is not None:
+                return (not engine.healthy, engine.ewma_latency, 1)
+            return (not engine.healthy, neutral, 0 if engine.requests == 0 else 2)
+
+        return sorted(candidates, key=key)
+
+    async def _timed(
+        self,
+        engine: EngineState,
+        call: Callable[[TranslationProvider], Awaitable[Any]]
+    ) -> Any:
+        """Run a call on an engine, recording its latency or failure"""
+        engine.requests += 1
+        start = time.monotonic()
+        try:
+            result = await call(engine.provider)
+        except asyncio.CancelledError:
+            raise
+        except PartialBatchTranslationException:
+            engine.record_success(time.monotonic() - start)
+            raise
+        except Exception:
+            engine.record_failure()
+            raise
+        engine.record_success(time.monotonic() - start)
+        return result
+
+    async def _route(
+        self,
+        ranked: List[EngineState],
+        call: Callable[[TranslationProvider], Awaitable[Any]],
+        hedge: bool
+    ) -> Any:
+        """
+        Run a call on the ranked engines with failover and optional hedging
+
+        The first engine to succeed wins and any other call still running is
+        cancelled. At most one hedged duplicate is sent per request.
+        """
+        remaining = list(ranked)
+        running: Dict[asyncio.Task, EngineState] = {}
+        hedge_engine: Optional[EngineState] = None
+        last_error: Optional[BaseException] = None
+
+        def start(engine: EngineState):
+            running[asyncio.ensure_future(self._timed(engine, call))] = engine
+
+        start(remaining.pop(0))
+        try:
+            while running:
+                timeout = None
+                if hedge and hedge_engine is None and remaining and len(running) == 1:
+                    timeout = next(iter(running.values())).hedge_delay()
+
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Primary is slower than its p95: race a duplicate
+                    self.hedged_requests += 1
+                    hedge_engine = remaining.pop(0)
+                    hedge_engine.hedges_started += 1
+                    start(hedge_engine)
+                    continue
+
+                for task in done:
+                    engine = running.pop(task)
+                    if task.exception() is None:
+                        if engine is hedge_engine:
+                            engine.hedges_won += 1
+                        return task.result()
+                    last_error = task.exception()
+                    logger.warning(f"Engine {engine.name} failed: {str(last_error)}")
+
+                if not running and remaining:
+                    self.failovers += 1
+                    start(remaining.pop(0))
+        finally:
+            for task in running:
+                task.cancel()
+
+        raise last_error
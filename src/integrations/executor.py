@@ -0,0 +1,367 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from src.core.config import get_settings
+from src.core.exceptions import InferenceQueueFullException
+from src.core.metrics import EXECUTOR_QUEUE_WAIT, REGISTRY
+from src.core.timing import record_stage
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class InferenceExecutor:
+    """
+    Bounded worker pool that runs blocking model work off the event loop
+
+    Calls are queued on a thread pool of ``max_workers`` threads and awaited
+    through asyncio futures. When ``max_queue_size`` calls are already queued
+    or running, new calls are rejected instead of piling up unbounded.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue_size: int = 0):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"{name}-worker"
+        )
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the pool and await its result
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Return value of fn
+
+        Raises:
+            InferenceQueueFullException: If the queue bound is reached
+        """
+        with self._lock:
+            if self.max_queue_size and self._outstanding >= self.max_queue_size:
+                self._rejected += 1
+                raise InferenceQueueFullException(self.name)
+            self._outstanding += 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            # Run in a copy of the caller's context so stage timers reach its request
+            return await loop.run_in_executor(
+                self._pool,
+                contextvars.copy_context().run,
+                functools.partial(self._call, time.perf_counter(), fn, *args, **kwargs)
+            )
+        finally:
+            with self._lock:
+                self._outstanding -= 1
+                self._completed += 1
+
+    def _call(self, enqueued_at: float, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run fn on a worker thread, tracking busy workers"""
+        wait = time.perf_counter() - enqueued_at
+        EXECUTOR_QUEUE_WAIT.labels(self.name).observe(wait)
+        record_stage(f"{self.name}_queue", wait)
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get queue and worker statistics"""
+        return {
+            "workers": self.max_workers,
+            "running": self._running,
+            "queued": max(self._outstanding - self._running, 0),
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and release the worker threads"""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def available_cores() -> List[int]:
+    """CPU cores this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _init_replica_thread(threads: int, cores: Sequence[int]):
+    """Limit (and optionally pin) the intra-op threads started from this thread"""
+    if cores:
+        # Linux applies affinity per thread; OpenMP threads inherit it
+        os.sched_setaffinity(0, cores)
+    try:
+        import torch
+
+        # With the OpenMP backend this sets the calling thread's OpenMP
+        # thread count, so each replica keeps its own budget instead of the
+        # count it inherited. MKL's count, set alongside, is process-wide but
+        # equal for every replica. Other backends have one process-wide pool
+        # (see intra_op_threads_are_per_thread)
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+
+def intra_op_threads_are_per_thread() -> bool:
+    """
+    Whether torch.set_num_threads applies to the calling thread only (OpenMP backend)
+
+    A thread that never sets its own count does not get the library default:
+    torch also keeps the count most recently set by any thread and applies it
+    when a thread first runs torch code. Threads started after a replica pool
+    (or a CLI worker's set_num_threads) therefore get that pool's budget,
+    while threads already running keep theirs.
+    """
+    try:
+        import torch
+    except ImportError:
+        return False
+    return "parallel backend: OpenMP" in torch.__config__.parallel_info()
+
+
+class ReplicaPool:
+    """
+    Inference replicas with their own intra-op thread budgets
+
+    One large generate() call scales poorly across many cores, so the cores
+    are split between ``replicas`` single-threaded lanes, each running one
+    batch at a time with ``threads_per_replica`` intra-op threads (optionally
+    pinned to their own cores). The lanes share the loaded weights, which are
+    read-only during inference, and the provider's tokenizer thread. Calls go
+    to the replica with the fewest calls in flight.
+
+    Exposes the same ``run``/``stats``/``shutdown`` interface as
+    InferenceExecutor.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        replicas: int,
+        threads_per_replica: int = 0,
+        max_queue_size: int = 0,
+        pin_cores: bool = False
+    ):
+        self.name = name
+        self.replicas = max(1, replicas)
+        cores = available_cores()
+        self.threads_per_replica = threads_per_replica or max(1, len(cores) // self.replicas)
+        self.max_queue_size = max(0, max_queue_size)
+        if self.replicas > 1 and not intra_op_threads_are_per_thread():
+            logger.warning(
+                f"torch's intra-op thread pool is process-wide in this build: the "
+                f"{self.replicas} replicas share {self.threads_per_replica} intra-op threads"
+            )
+
+        self.cores: List[List[int]] = [[] for _ in range(self.replicas)]
+        if pin_cores:
+            if len(cores) >= self.replicas * self.threads_per_replica:
+                self.cores = [
+                    cores[i * self.threads_per_replica:(i + 1) * self.threads_per_replica]
+                    for i in range(self.replicas)
+                ]
+            else:
+                logger.warning(
+                    f"{self.replicas} replicas x {self.threads_per_replica} threads exceed "
+                    f"{len(cores)} cores, not pinning"
+                )
+
+        self._pools = [
+            ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"{name}-replica{i}",
+                initializer=_init_replica_thread,
+                initargs=(self.threads_per_replica, self.cores[i])
+            )
+            for i in range(self.replicas)
+        ]
+        self._lock = threading.Lock()
+        self._in_flight = [0] * self.replicas
+        self._completed = [0] * self.replicas
+        self._next = 0
+        self._rejected = 0
+
+    def _acquire(self) -> int:
+        """Pick the least-loaded replica, rotating between ties"""
+        with self._lock:
+            if self.max_queue_size and sum(self._in_flight) >= self.max_queue_size:
+                self._rejected += 1
+                raise InferenceQueueFullException(self.name)
+            order = [(self._next + i) % self.replicas for i in range(self.replicas)]
+            replica = min(order, key=lambda i: self._in_flight[i])
+            self._next = (replica + 1) % self.replicas
+            self._in_flight[replica] += 1
+            return replica
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the least-loaded replica and await its result
+
+        Raises:
+            InferenceQueueFullException: If the queue bound is reached
+        """
+        replica = self._acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._pools[replica],
+                contextvars.copy_context().run,
+                functools.partial(self._call, time.perf_counter(), fn, *args, **kwargs)
+            )
+        finally:
+            with self._lock:
+                self._in_flight[replica] -= 1
+                self._completed[replica] += 1
+
+    def _call(self, enqueued_at: float, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        wait = time.perf_counter() - enqueued_at
+        EXECUTOR_QUEUE_WAIT.labels(self.name).observe(wait)
+        record_stage(f"{self.name}_queue", wait)
+        return fn(*args, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue statistics, overall and per replica"""
+        in_flight = list(self._in_flight)
+        running = sum(min(count, 1) for count in in_flight)
+        return {
+            "workers": self.replicas,
+            "running": running,
+            "queued": sum(in_flight) - running,
+            "completed": sum(self._completed),
+            "rejected": self._rejected,
+            "threads_per_replica": self.threads_per_replica,
+            "replicas": [
+                {"in_flight": count, "completed": completed, "cores": cores}
+                for count, completed, cores in zip(in_flight, self._completed, self.cores)
+            ],
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and release the replica threads"""
+        for pool in self._pools:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global executor instances
+_inference_executor: Optional[Union[InferenceExecutor, ReplicaPool]] = None
+_preprocess_executor: Optional[InferenceExecutor] = None
+
+
+def get_inference_executor() -> Union[InferenceExecutor, ReplicaPool]:
+    """
+    Get the executor used for model forward passes / generation
+
+    A ReplicaPool when INFERENCE_REPLICAS > 1, else a plain pool of
+    INFERENCE_WORKERS threads.
+    """
+    global _inference_executor
+
+    if _inference_executor is None:
+        if settings.INFERENCE_REPLICAS > 1:
+            _inference_executor = ReplicaPool(
+                "inference",
+                replicas=settings.INFERENCE_REPLICAS,
+                threads_per_replica=settings.INFERENCE_REPLICA_THREADS,
+                max_queue_size=settings.INFERENCE_QUEUE_SIZE,
+                pin_cores=settings.INFERENCE_PIN_CORES
+            )
+        else:
+            _inference_executor = InferenceExecutor(
+                "inference",
+                max_workers=settings.INFERENCE_WORKERS,
+                max_queue_size=settings.INFERENCE_QUEUE_SIZE
+            )
+    return _inference_executor
+
+
+def get_preprocess_executor() -> InferenceExecutor:
+    """
+    Get the executor used for tokenization and decoding
+
+    Runs on a single thread: fast tokenizers are not safe to call
+    concurrently, and keeping them on their own thread lets one batch be
+    tokenized while another is generating.
+    """
+    global _preprocess_executor
+
+    if _preprocess_executor is None:
+        _preprocess_executor = InferenceExecutor("preprocess", max_workers=1)
+    return _preprocess_executor
+
+
+def shutdown_executors():
+    """Shut down the global executors"""
+    global _inference_executor, _preprocess_executor
+
+    for executor in (_inference_executor, _preprocess_executor):
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    _inference_executor = None
+    _preprocess_executor = None
+    logger.info("Inference executors shut down")
+
+
+def _collect_executor_metrics():
+    """Queue depth and busy workers of the global executors, read at scrape time"""
+    executors = [e for e in (_inference_executor, _preprocess_executor) if e is not None]
+    stats = [(executor.name, executor.stats()) for executor in executors]
+    yield (
+        "executor_queue_depth",
+        "gauge",
+        "Calls waiting for an executor thread",
+        [({"executor": name}, executor_stats["queued"]) for name, executor_stats in stats]
+    )
+    yield (
+        "executor_running",
+        "gauge",
+        "Calls running on executor threads",
+        [({"executor": name}, executor_stats["running"]) for name, executor_stats in stats]
+    )
+    yield (
+        "executor_rejected_total",
+        "counter",
+        "Calls rejected because the executor queue was full",
+        [({"executor": name}, executor_stats["rejected"]) for name, executor_stats in stats]
+    )
+
+
+REGISTRY.register_collector(_collect_executor_metrics)
+
+
+def reset_executors_after_fork():
+    """
+    Forget executors inherited from a parent process
+
+    Worker threads do not survive fork, so a forked server worker must build
+    its own executors instead of queueing work on the parent's dead threads.
+    """
+    global _inference_executor, _preprocess_executor
+
+    _inference_executor = None
+    _preprocess_executor = None
@@ -1,18 +1,37 @@
+import importlib
 import logging
-from typing import Optional
+import sys
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from src.core.config import get_settings
 from src.core.enums import TranslationEngine
 from src.integrations.base import TranslationProvider
-from src.integrations.google_translate import GoogleTranslateProvider
-from src.integrations.openai_translate import OpenAITranslateProvider
-from src.integrations.local_translate import LocalTranslateProvider
+from src.integrations.cache import CachedTranslationProvider
+from src.integrations.composite import CompositeTranslationProvider
+from src.integrations.executor import reset_executors_after_fork
 from src.core.exceptions import TranslationEngineException
+from src.core.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from src.integrations.local_translate import LocalTranslateProvider
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Engine modules are imported only when their engine is created, so e.g. a
+# google deployment never imports torch
+_ENGINES: Dict[TranslationEngine, Tuple[str, str]] = {
+    TranslationEngine.GOOGLE: ("src.integrations.google_translate", "GoogleTranslateProvider"),
+    TranslationEngine.OPENAI: ("src.integrations.openai_translate", "OpenAITranslateProvider"),
+    TranslationEngine.LOCAL: ("src.integrations.local_translate", "LocalTranslateProvider"),
+    TranslationEngine.ONNX: ("src.integrations.onnx_translate", "OnnxTranslateProvider"),
+}
+
+_LOCAL_MODULE = "src.integrations.local_translate"
+
 # Global provider instance
 _provider: Optional[TranslationProvider] = None
+_provider_lock = threading.Lock()
 
 
 def get_translation_provider() -> TranslationProvider:
@@ -30,36 +49,138 @@ def get_translation_provider() -> TranslationProvider:
     if _provider is not None:
         return _provider
     
-    engine = settings.TRANSLATION_ENGINE
-    logger.info(f"Initializing translation engine: {engine}")
-    
-    try:
-        if engine == TranslationEngine.GOOGLE:
-            _provider = GoogleTranslateProvider()
-        elif engine == TranslationEngine.OPENAI:
-            _provider = OpenAITranslateProvider()
-        elif engine == TranslationEngine.LOCAL:
-            _provider = LocalTranslateProvider()
-        else:
-            raise TranslationEngineException(
-                f"Unknown translation engine: {engine}"
-            )
+    # The startup preload initializes from a worker thread
+    with _provider_lock:
+        if _provider is not None:
+            return _provider
         
-        logger.info(f"Translation engine initialized successfully: {engine}")
-        return _provider
-    except Exception as e:
-        logger.error(f"Failed to initialize translation engine: {str(e)}")
-        raise
+        engine = settings.TRANSLATION_ENGINE
+        logger.info(f"Initializing translation engine: {engine}")
+        
+        try:
+            if engine == TranslationEngine.COMPOSITE:
+                provider = _create_composite_provider()
+            else:
+                provider = _create_provider(engine)
+            
+            if settings.CACHE_ENABLED:
+                provider = CachedTranslationProvider(provider)
+            
+            _provider = provider
+            logger.info(f"Translation engine initialized successfully: {engine}")
+            return _provider
+        except Exception as e:
+            logger.error(f"Failed to initialize translation engine: {str(e)}")
+            raise
+
+
+def register_engine(engine: TranslationEngine, module: str, class_name: str):
+    """
+    Register the provider class for an engine, imported on first use
+    
+    Args:
+        engine: Engine the provider serves
+        module: Dotted module path of the provider
+        class_name: Provider class in that module
+    """
+    _ENGINES[engine] = (module, class_name)
+
+
+def _create_provider(engine: TranslationEngine) -> TranslationProvider:
+    """Create a single-engine provider, importing its module"""
+    if engine not in _ENGINES:
+        raise TranslationEngineException(
+            f"Unknown translation engine: {engine}"
+        )
+    module, class_name = _ENGINES[engine]
+    provider_class = getattr(importlib.import_module(module), class_name)
+    return provider_class()
+
+
+def _create_composite_provider() -> CompositeTranslationProvider:
+    """Create a router over every ROUTER_ENGINES engine that initializes"""
+    providers = {}
+    for name in settings.ROUTER_ENGINES.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        try:
+            providers[name] = _create_provider(TranslationEngine(name))
+        except Exception as e:
+            logger.warning(f"Skipping engine {name} for routing: {str(e)}")
+    return CompositeTranslationProvider(providers)
+
+
+def local_providers(provider: Optional[TranslationProvider]) -> List["LocalTranslateProvider"]:
+    """Local (and ONNX) engines behind a provider, through the cache and router"""
+    local_module = sys.modules.get(_LOCAL_MODULE)
+    if local_module is None:
+        # Never imported, so no local engine exists
+        return []
+    if isinstance(provider, CachedTranslationProvider):
+        provider = provider.provider
+    providers = [provider]
+    if isinstance(provider, CompositeTranslationProvider):
+        providers = [engine.provider for engine in provider.engines]
+    return [p for p in providers if isinstance(p, local_module.LocalTranslateProvider)]
+
+
+def preload_translation_provider() -> TranslationProvider:
+    """
+    Initialize the provider in a pre-fork server master
+    
+    Workers forked afterwards inherit the loaded weights and share their
+    pages copy-on-write instead of each loading a copy. Each worker must call
+    reinit_after_fork() before serving.
+    """
+    provider = get_translation_provider()
+    logger.info(f"Translation provider preloaded in process for sharing: {provider.engine_name}")
+    return provider
+
+
+def reinit_after_fork():
+    """Rebuild per-process provider state in a forked server worker"""
+    reset_executors_after_fork()
+    for provider in local_providers(_provider):
+        provider.after_fork()
+
+
+def _collect_provider_metrics():
+    """Cache and model residency metrics of the current provider, read at scrape time"""
+    provider = _provider
+    if isinstance(provider, CachedTranslationProvider):
+        cache = provider.get_stats()["cache"]
+        yield (
+            "translation_cache_hits_total",
+            "counter",
+            "Translations served from the cache",
+            [({"tier": "memory"}, cache["memory_hits"]), ({"tier": "redis"}, cache["redis_hits"])]
+        )
+        yield ("translation_cache_misses_total", "counter", "Cache lookups that missed", [({}, cache["misses"])])
+        yield ("translation_cache_hit_ratio", "gauge", "Share of cache lookups that hit", [({}, cache["hit_ratio"])])
+    
+    load_seconds = []
+    memory_bytes = []
+    for local in local_providers(provider):
+        for name, model in local.registry.stats()["resident"].items():
+            labels = {"engine": local.engine_name, "model": name, "precision": model["precision"]}
+            load_seconds.append((labels, model["load_seconds"]))
+            memory_bytes.append((labels, model["memory_mb"] * 2 ** 20))
+    if load_seconds:
+        yield ("model_load_seconds", "gauge", "Time taken to load each resident model", load_seconds)
+        yield ("model_memory_bytes", "gauge", "Weight memory of each resident model", memory_bytes)
+
+
+REGISTRY.register_collector(_collect_provider_metrics)
 
 
 def reset_translation_provider():
     """Reset the global provider instance"""
     global _provider
     
-    if _provider is not None:
-        # Clean up if needed
-        if isinstance(_provider, LocalTranslateProvider):
-            _provider.unload_model()
+    # Clean up if needed
+    for provider in local_providers(_provider):
+        provider.unload_model()
     
     _provider = None
     logger.info("Translation provider reset")
@@ -0,0 +1,198 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+from src.core.exceptions import PartialBatchTranslationException
+
+logger = logging.getLogger(__name__)
+
+
+async def bounded_fan_out(
+    items: List[Any],
+    translate_fn: Callable[[Any], Awaitable[Any]],
+    max_concurrency: int,
+    engine: str
+) -> List[Any]:
+    """
+    Translate items (texts, or packs of texts) concurrently, keeping results
+    in input order
+
+    Each provider call should additionally hold the provider's own semaphore,
+    which bounds outbound calls across all requests; max_concurrency bounds
+    how many items of this batch are started at once.
+
+    Args:
+        items: Items to translate
+        translate_fn: Coroutine function translating one item
+        max_concurrency: Max items of this batch in flight (0 = unbounded)
+        engine: Engine name for error reporting
+
+    Returns:
+        Results in input order
+
+    Raises:
+        PartialBatchTranslationException: If some (but not all) items failed
+        Exception: The first error, if every item failed
+    """
+    limit = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+
+    async def run(item: Any) -> Any:
+        if limit is None:
+            return await translate_fn(item)
+        async with limit:
+            return await translate_fn(item)
+
+    outcomes = await asyncio.gather(
+        *(run(item) for item in items),
+        return_exceptions=True
+    )
+
+    results: List[Optional[Any]] = []
+    errors = {}
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, asyncio.CancelledError):
+            raise outcome
+        if isinstance(outcome, BaseException):
+            errors[index] = getattr(outcome, "message", str(outcome))
+            results.append(None)
+        else:
+            results.append(outcome)
+
+    if not errors:
+        return results
+    if len(errors) == len(items):
+        raise next(o for o in outcomes if isinstance(o, BaseException))
+
+    logger.warning(f"{engine} batch: {len(errors)} of {len(items)} items failed")
+    raise PartialBatchTranslationException(results, errors, engine)
+
+
+async def fan_out_packs(
+    texts: List[str],
+    packs: List[List[int]],
+    translate_pack: Callable[[List[str]], Awaitable[List[str]]],
+    max_concurrency: int,
+    engine: str
+) -> List[str]:
+    """
+    Translate packs of texts concurrently and map results back to the texts
+
+    Args:
+        texts: Texts to translate
+        packs: Lists of indices into texts, one provider call each
+        translate_pack: Coroutine function translating one pack of texts,
+            returning exactly one result per text
+        max_concurrency: Max packs of this batch in flight (0 = unbounded)
+        engine: Engine name for error reporting
+
+    Returns:
+        Translated texts in input order
+
+    Raises:
+        PartialBatchTranslationException: If some (but not all) packs failed
+        Exception: The first error, if every pack failed
+    """
+    async def run(pack: List[int]) -> List[str]:
+        return await _translate_checked(texts, pack, translate_pack)
+
+    pack_errors = {}
+    try:
+        pack_results = await bounded_fan_out(packs, run, max_concurrency, engine)
+    except PartialBatchTranslationException as e:
+        pack_results = e.results
+        pack_errors = e.errors
+
+    results: List[Optional[str]] = [None] * len(texts)
+    errors = {}
+    for position, pack in enumerate(packs):
+        if position in pack_errors:
+            for index in pack:
+                errors[index] = pack_errors[position]
+        else:
+            for index, translated in zip(pack, pack_results[position]):
+                results[index] = translated
+
+    if errors:
+        raise PartialBatchTranslationException(results, errors, engine)
+    return results
+
+
+async def stream_packs(
+    texts: List[str],
+    packs: List[List[int]],
+    translate_pack: Callable[[List[str]], Awaitable[List[str]]],
+    max_concurrency: int,
+    engine: str
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Translate packs of texts concurrently, yielding each text as soon as its
+    pack finishes
+
+    Failed packs do not stop the others; their errors are raised once every
+    pack has finished. Closing the iterator early cancels unfinished packs.
+
+    Args:
+        texts: Texts to translate
+        packs: Lists of indices into texts, one provider call each
+        translate_pack: Coroutine function translating one pack of texts,
+            returning exactly one result per text
+        max_concurrency: Max packs of this batch in flight (0 = unbounded)
+        engine: Engine name for error reporting
+
+    Yields:
+        Tuples of (index into texts, translated text), in completion order
+
+    Raises:
+        PartialBatchTranslationException: If some (but not all) packs failed
+        Exception: The first error, if every pack failed
+    """
+    limit = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+
+    async def run(pack: List[int]) -> Tuple[List[int], Optional[List[str]], Optional[Exception]]:
+        try:
+            if limit is None:
+                return pack, await _translate_checked(texts, pack, translate_pack), None
+            async with limit:
+                return pack, await _translate_checked(texts, pack, translate_pack), None
+        except Exception as e:
+            return pack, None, e
+
+    tasks = [asyncio.ensure_future(run(pack)) for pack in packs]
+    results: List[Optional[str]] = [None] * len(texts)
+    errors = {}
+    first_error: Optional[Exception] = None
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            pack, translated, error = await next_done
+            if error is not None:
+                first_error = first_error or error
+                for index in pack:
+                    errors[index] = getattr(error, "message", str(error))
+                continue
+            for index, text in zip(pack, translated):
+                results[index] = text
+                yield index, text
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if not errors:
+        return
+    if len(errors) == len(texts):
+        raise first_error
+
+    logger.warning(f"{engine} batch: {len(errors)} of {len(texts)} texts failed")
+    raise PartialBatchTranslationException(results, errors, engine)
+
+
+async def _translate_checked(
+    texts: List[str],
+    pack: List[int],
+    translate_pack: Callable[[List[str]], Awaitable[List[str]]]
+) -> List[str]:
+    """Translate one pack, checking it returned one result per text"""
+    translated = await translate_pack([texts[i] for i in pack])
+    if len(translated) != len(pack):
+        raise ValueError(f"Expected {len(pack)} translations, got {len(translated)}")
+    return translated
@@ -1,8 +1,17 @@
-from typing import List, Dict
+from typing import Any, AsyncIterator, List, Dict, Tuple
+import asyncio
 import logging
 from src.integrations.base import TranslationProvider
-from src.core.exceptions import GoogleTranslateException, InvalidLanguageException
+from src.integrations.batching import pack_by_budget
+from src.integrations.fanout import fan_out_packs, stream_packs
+from src.integrations.rate_limit import RateLimitScheduler
+from src.core.exceptions import (
+    GoogleTranslateException,
+    InvalidLanguageException,
+    RateLimitException
+)
 from src.core.config import get_settings
+from src.core.timing import stage
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -14,15 +23,43 @@ class GoogleTranslateProvider(TranslationProvider):
     def __init__(self):
         """Initialize Google Translate client"""
         try:
+            import google.auth
+            from google.auth.transport.requests import AuthorizedSession
             from google.cloud import translate_v2
+            from requests.adapters import HTTPAdapter
             
             # Initialize with credentials path
             if settings.GOOGLE_CREDENTIALS_PATH:
                 import os
                 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = settings.GOOGLE_CREDENTIALS_PATH
             
-            self.client = translate_v2.Client(project_id=settings.GOOGLE_PROJECT_ID)
+            credentials, _ = google.auth.default(scopes=translate_v2.Client.SCOPE)
+            
+            # One keep-alive pool sized for every concurrent call
+            self.session = AuthorizedSession(credentials)
+            adapter = HTTPAdapter(pool_maxsize=settings.GOOGLE_MAX_CONCURRENCY)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            
+            client_options = None
+            if settings.GOOGLE_API_ENDPOINT:
+                client_options = {"api_endpoint": settings.GOOGLE_API_ENDPOINT}
+            
+            self.client = translate_v2.Client(
+                credentials=credentials,
+                _http=self.session,
+                client_options=client_options
+            )
             self.supported_langs = None
+            # Bounds API calls across all requests sharing this provider
+            self.semaphore = asyncio.Semaphore(settings.GOOGLE_MAX_CONCURRENCY)
+            # Google quotas count characters rather than tokens
+            self.scheduler = RateLimitScheduler(
+                "google",
+                settings.GOOGLE_RATE_LIMIT_RPM,
+                settings.GOOGLE_RATE_LIMIT_CPM,
+                settings.RATE_LIMIT_MAX_WAIT
+            )
             logger.info("Google Translate provider initialized")
         except ImportError:
             raise GoogleTranslateException("google-cloud-translate not installed")
@@ -42,13 +79,13 @@ class GoogleTranslateProvider(TranslationProvider):
                     f"Language pair {source_language}->{target_language} not supported"
                 )
             
-            result = self.client.translate_text(
-                text,
-                source_language_code=source_language,
-                target_language_code=target_language
-            )
-            
-            return result['translatedText']
+            return (await self._translate_segments(
+                [text],
+                source_language,
+                target_language
+            ))[0]
+        except (GoogleTranslateException, RateLimitException):
+            raise
         except Exception as e:
             logger.error(f"Google Translate error: {str(e)}")
             raise GoogleTranslateException(str(e))
@@ -59,21 +96,99 @@ class GoogleTranslateProvider(TranslationProvider):
         source_language: str,
         target_language: str
     ) -> List[str]:
-        """Batch translate multiple texts"""
-        results = []
-        for text in texts:
-            translated = await self.translate(text, source_language, target_language)
-            results.append(translated)
-        return results
+        """
+        Batch translate multiple texts in as few API calls as possible
+        
+        Texts are packed in order into requests of at most
+        GOOGLE_MAX_SEGMENTS_PER_REQUEST segments and
+        GOOGLE_MAX_CHARS_PER_REQUEST characters; the requests run concurrently.
+        
+        Raises:
+            PartialBatchTranslationException: If only some requests failed
+        """
+        if not self.validate_language_pair(source_language, target_language):
+            raise InvalidLanguageException(
+                f"Language pair {source_language}->{target_language} not supported"
+            )
+        
+        return await fan_out_packs(
+            texts,
+            self._pack(texts),
+            lambda pack: self._translate_segments(pack, source_language, target_language),
+            settings.REMOTE_BATCH_CONCURRENCY,
+            "google"
+        )
+    
+    async def batch_translate_stream(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Batch translate with the packing of batch_translate, yielding each
+        text as soon as its request finishes
+        
+        Raises:
+            PartialBatchTranslationException: Once every request has finished,
+                if only some of them failed
+        """
+        if not self.validate_language_pair(source_language, target_language):
+            raise InvalidLanguageException(
+                f"Language pair {source_language}->{target_language} not supported"
+            )
+        
+        async for item in stream_packs(
+            texts,
+            self._pack(texts),
+            lambda pack: self._translate_segments(pack, source_language, target_language),
+            settings.REMOTE_BATCH_CONCURRENCY,
+            "google"
+        ):
+            yield item
+    
+    def _pack(self, texts: List[str]) -> List[List[int]]:
+        """Group text indices into requests within the per-request limits"""
+        return pack_by_budget(
+            [len(text) for text in texts],
+            settings.GOOGLE_MAX_SEGMENTS_PER_REQUEST,
+            settings.GOOGLE_MAX_CHARS_PER_REQUEST
+        )
+    
+    async def _translate_segments(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[str]:
+        """Translate a list of segments with one API call"""
+        with stage("rate_limit"):
+            await self.scheduler.acquire(sum(len(text) for text in texts))
+        try:
+            async with self.semaphore:
+                # The client is blocking; keep it off the event loop
+                with stage("google"):
+                    results = await asyncio.to_thread(
+                        self.client.translate,
+                        texts,
+                        target_language=target_language,
+                        source_language=source_language,
+                        format_="text"
+                    )
+        except Exception as e:
+            logger.error(f"Google Translate error: {str(e)}")
+            raise GoogleTranslateException(str(e))
+        
+        return [result['translatedText'] for result in results]
     
     async def get_supported_languages(self) -> Dict[str, str]:
         """Get supported languages from Google Translate"""
         try:
             if self.supported_langs is None:
-                langs = self.client.get_languages()
+                langs = await asyncio.to_thread(self.client.get_languages)
                 self.supported_langs = {
                     lang['language']: lang.get('name', lang['language'])
-                    for lang in langs.get('languages', [])
+                    for lang in langs
                 }
             return self.supported_langs
         except Exception as e:
@@ -95,16 +210,20 @@ class GoogleTranslateProvider(TranslationProvider):
             len(target_language) == 2
         )
     
+    def cache_identity(self) -> str:
+        """Identify engine and API version"""
+        return "google:v2"
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limit statistics"""
+        return {"rate_limit": self.scheduler.stats()}
+    
     async def health_check(self) -> bool:
         """Check if Google Translate is accessible"""
         try:
             # Try a simple translation
-            result = self.client.translate_text(
-                "hello",
-                source_language_code="en",
-                target_language_code="es"
-            )
-            return 'translatedText' in result
+            result = await self._translate_segments(["hello"], "en", "es")
+            return bool(result[0])
         except Exception as e:
             logger.error(f"Health check failed: {str(e)}")
             return False
@@ -1,16 +1,75 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Any, Tuple, AsyncIterator
+import asyncio
 import logging
+import threading
 import torch
 from src.integrations.base import TranslationProvider
-from src.core.exceptions import LocalTranslateException, ModelLoadException, InvalidLanguageException
+from src.integrations.batching import MicroBatcher, plan_token_batches
+from src.integrations.segmentation import SegmentedText, split_sentences, pack_sentences
+from src.integrations.executor import get_inference_executor, get_preprocess_executor
+from src.integrations.precision import apply_precision, load_dtype, resolve_precision
+from src.integrations.staged_model import is_staged_model, load_staged_model, staged_checkpoint
+from src.integrations.model_registry import (
+    LoadedModel,
+    ModelRegistry,
+    model_memory_bytes,
+    parse_pair_models
+)
+from src.core.exceptions import (
+    LocalTranslateException,
+    ModelLoadException,
+    InvalidLanguageException,
+    TranslationEngineException
+)
 from src.core.config import get_settings
+from src.core.metrics import (
+    LOCAL_BATCH_SIZE,
+    LOCAL_INPUT_TOKENS,
+    LOCAL_OUTPUT_TOKENS,
+    LOCAL_PADDING_EFFICIENCY
+)
+from src.core.timing import stage
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Language and end-of-sequence tokens added around a tokenized text
+SPECIAL_TOKEN_ALLOWANCE = 4
+
+
+class _TokenStreamer:
+    """
+    Streamer for model.generate() that forwards new token ids to the event loop
+    
+    Decoding happens on the loop side so the tokenizer is only ever used from
+    the preprocess executor.
+    """
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        self.loop = loop
+        self.queue = queue
+        self.prompt_seen = False
+    
+    def put(self, value):
+        # The first call carries the decoder start token(s)
+        if not self.prompt_seen:
+            self.prompt_seen = True
+            return
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, value.reshape(-1).tolist())
+    
+    def end(self):
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, None)
+
 
 class LocalTranslateProvider(TranslationProvider):
-    """Local GPU-based translation provider using transformers"""
+    """
+    Local GPU-based translation provider using transformers
+    
+    LOCAL_MODEL_NAME is the multilingual fallback and stays loaded. Language
+    pairs listed in LOCAL_PAIR_MODELS are served by their own (usually much
+    smaller) model once it is resident; until then a cold pair is served by
+    the fallback while its model loads in the background.
+    """
     
     SUPPORTED_MODELS = {
         "facebook/nllb-200-distilled-600M": {
@@ -34,9 +93,7 @@ class LocalTranslateProvider(TranslationProvider):
     def __init__(self):
         """Initialize local translation model"""
         try:
-            from transformers import AutoTokenizer, AutoModelForSeq2SeqLM, pipeline
-            
-            self.model_name = settings.LOCAL_MODEL_NAME
+            self.model_name, pair_models = self._configured_models()
             self.device = settings.LOCAL_DEVICE
             self.batch_size = settings.LOCAL_BATCH_SIZE
             
@@ -45,22 +102,109 @@ class LocalTranslateProvider(TranslationProvider):
                 logger.warning("CUDA not available, falling back to CPU")
                 self.device = "cpu"
             
-            logger.info(f"Loading model: {self.model_name} on device: {self.device}")
+            self.precision = resolve_precision(settings.LOCAL_MODEL_PRECISION, self.device)
+            logger.info(
+                f"Loading model: {self.model_name} on device: {self.device} "
+                f"({self.precision})"
+            )
+            
+            # Per-pair models load lazily; the fallback is loaded now and pinned
+            self.pair_models = parse_pair_models(pair_models)
+            self.registry = ModelRegistry(
+                self._load_model,
+                memory_budget_bytes=settings.LOCAL_MODEL_MEMORY_BUDGET_MB * 2 ** 20,
+                pinned=[self.model_name]
+            )
+            self.fallback = self.registry.load(self.model_name)
+            self.fallback_served = 0
             
-            # Load model and tokenizer
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
-            self.model = self.model.to(self.device)
+            # Padding efficiency of the batched path
+            self._real_tokens = 0
+            self._padded_tokens = 0
             
-            # Set model to evaluation mode
-            self.model.eval()
+            # Tokenization and generation run off the event loop
+            self.inference_executor = get_inference_executor()
+            self.preprocess_executor = get_preprocess_executor()
+            
+            # Coalesce concurrent single-text requests into batches
+            self.batcher: Optional[MicroBatcher] = None
+            if settings.LOCAL_MICROBATCH_ENABLED:
+                self.batcher = MicroBatcher(
+                    self._run_batch,
+                    max_batch_size=settings.LOCAL_MICROBATCH_MAX_SIZE,
+                    max_wait_ms=settings.LOCAL_MICROBATCH_MAX_WAIT_MS
+                )
             
             logger.info(f"Model loaded successfully: {self.model_name}")
         except ImportError as e:
             raise LocalTranslateException(f"Required library not installed: {str(e)}")
         except Exception as e:
             logger.error(f"Failed to load model: {str(e)}")
-            raise ModelLoadException(settings.LOCAL_MODEL_NAME)
+            raise ModelLoadException(self.model_name)
+    
+    def _configured_models(self) -> Tuple[str, str]:
+        """Fallback model and LOCAL_PAIR_MODELS-style pair spec to serve"""
+        return settings.LOCAL_MODEL_NAME, settings.LOCAL_PAIR_MODELS
+    
+    def _load_model(self, model_name: str) -> LoadedModel:
+        """Load a tokenizer and model onto the target device in the configured precision (blocking)"""
+        from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+        
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        if settings.LOCAL_MODEL_MMAP and is_staged_model(model_name):
+            # Map the staged weights instead of copying them
+            model = load_staged_model(model_name, load_dtype(self.precision))
+        else:
+            model = AutoModelForSeq2SeqLM.from_pretrained(
+                model_name,
+                torch_dtype=load_dtype(self.precision)
+            )
+        model = model.to(self.device)
+        
+        # Set model to evaluation mode
+        model.eval()
+        model = apply_precision(model, self.precision)
+        return LoadedModel(
+            name=model_name,
+            tokenizer=tokenizer,
+            model=model,
+            precision=self.precision,
+            memory_bytes=model_memory_bytes(model)
+        )
+    
+    def _resident(self, source_language: str, target_language: str) -> LoadedModel:
+        """The pair's own model if it is resident, else the fallback"""
+        model_name = self.pair_models.get((source_language, target_language))
+        if model_name is None or model_name == self.model_name:
+            return self.fallback
+        return self.registry.get(model_name) or self.fallback
+    
+    async def _resolve(self, source_language: str, target_language: str) -> LoadedModel:
+        """
+        Pick the model serving a language pair
+        
+        A pair whose model is not resident starts loading it in the background
+        and is served by the fallback meanwhile. Only pairs the fallback
+        cannot translate wait for their model.
+        """
+        model_name = self.pair_models.get((source_language, target_language))
+        if model_name is None or model_name == self.model_name:
+            return self.fallback
+        
+        entry = self.registry.get(model_name)
+        if entry is not None:
+            return entry
+        
+        if self._fallback_supports(source_language, target_language):
+            if not self.registry.has_failed(model_name):
+                self.registry.load_in_background(model_name)
+            self.fallback_served += 1
+            return self.fallback
+        
+        try:
+            return await self.registry.ensure_loaded(model_name)
+        except Exception:
+            raise ModelLoadException(model_name)
     
     async def translate(
         self,
@@ -75,16 +219,54 @@ class LocalTranslateProvider(TranslationProvider):
                     f"Language pair {source_language}->{target_language} not supported"
                 )
             
-            translated = self._translate_internal(
+            # Texts over the segment budget take the segmenting batched path
+            if await self._exceeds_segment_budget(text, source_language, target_language):
+                return (await self.batch_translate(
+                    [text],
+                    source_language,
+                    target_language
+                ))[0]
+            
+            if self.batcher is not None:
+                return await self.batcher.submit(
+                    text,
+                    source_language,
+                    target_language
+                )
+            
+            entry = await self._resolve(source_language, target_language)
+            translated = await self.inference_executor.run(
+                self._translate_internal,
+                entry,
                 text,
                 source_language,
                 target_language
             )
             return translated
+        except TranslationEngineException:
+            raise
         except Exception as e:
             logger.error(f"Local translation error: {str(e)}")
             raise LocalTranslateException(str(e))
     
+    async def _exceeds_segment_budget(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> bool:
+        """Whether a text is longer than LOCAL_SEGMENT_MAX_TOKENS tokens of the model serving its pair"""
+        if not settings.LOCAL_SEGMENTATION_ENABLED:
+            return False
+        budget = settings.LOCAL_SEGMENT_MAX_TOKENS
+        # Besides a few special tokens, every token covers at least one UTF-8
+        # byte of the text, so short texts skip the tokenizer
+        if len(text.encode("utf-8")) + SPECIAL_TOKEN_ALLOWANCE <= budget:
+            return False
+        entry = await self._resolve(source_language, target_language)
+        input_ids = await self.preprocess_executor.run(self._tokenize, entry, [text])
+        return len(input_ids[0]) > budget
+    
     async def batch_translate(
         self,
         texts: List[str],
@@ -93,90 +275,400 @@ class LocalTranslateProvider(TranslationProvider):
     ) -> List[str]:
         """Batch translate multiple texts"""
         try:
-            if not self.validate_language_pair(source_language, target_language):
-                raise InvalidLanguageException(
-                    f"Language pair {source_language}->{target_language} not supported"
-                )
-            
-            results = []
-            # Process in batches
-            for i in range(0, len(texts), self.batch_size):
-                batch = texts[i:i + self.batch_size]
-                batch_results = self._batch_translate_internal(
-                    batch,
-                    source_language,
-                    target_language
-                )
-                results.extend(batch_results)
-            
+            results: List[Optional[str]] = [None] * len(texts)
+            async for index, translated in self.batch_translate_stream(
+                texts,
+                source_language,
+                target_language
+            ):
+                results[index] = translated
             return results
+        except TranslationEngineException:
+            raise
         except Exception as e:
             logger.error(f"Batch translation error: {str(e)}")
             raise LocalTranslateException(str(e))
     
-    def _translate_internal(
+    async def batch_translate_stream(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """Batch translate, yielding each text as soon as its sub-batches finish"""
+        if not self.validate_language_pair(source_language, target_language):
+            raise InvalidLanguageException(
+                f"Language pair {source_language}->{target_language} not supported"
+            )
+        
+        if not texts:
+            return
+        
+        entry = await self._resolve(source_language, target_language)
+        
+        # Tokenize once, then split long texts into sentence chunks
+        input_ids = await self.preprocess_executor.run(self._tokenize, entry, texts)
+        units, unit_ids, layouts = await self.preprocess_executor.run(
+            self._segment,
+            entry,
+            texts,
+            input_ids
+        )
+        
+        # Map every unit back to the text it belongs to
+        owners: List[int] = []
+        starts: List[int] = []
+        remaining: List[int] = []
+        for index, layout in enumerate(layouts):
+            count = 1 if layout is None else len(layout.chunks)
+            starts.append(len(owners))
+            owners.extend([index] * count)
+            remaining.append(count)
+            if count == 0:
+                yield index, layout.reassemble([])
+        
+        translated_units: List[Optional[str]] = [None] * len(unit_ids)
+        async for batch, translated in self._iter_token_batches(
+            entry,
+            unit_ids,
+            target_language
+        ):
+            for unit, text in zip(batch, translated):
+                translated_units[unit] = text
+                index = owners[unit]
+                remaining[index] -= 1
+                if remaining[index]:
+                    continue
+                
+                layout = layouts[index]
+                if layout is None:
+                    yield index, text
+                else:
+                    start = starts[index]
+                    yield index, layout.reassemble(
+                        translated_units[start:start + len(layout.chunks)]
+                    )
+    
+    async def translate_stream(
         self,
         text: str,
         source_language: str,
         target_language: str
-    ) -> str:
-        """Internal translation method"""
-        # Prepare input
-        inputs = self.tokenizer(
-            text,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=settings.LOCAL_MAX_LENGTH
-        ).to(self.device)
-        
-        # Translate
-        with torch.no_grad():
-            translated_tokens = self.model.generate(
-                **inputs,
-                forced_bos_token_id=self.tokenizer.get_lang_id(target_language),
-                max_length=settings.LOCAL_MAX_LENGTH
+    ) -> AsyncIterator[Tuple[str, int]]:
+        """
+        Translate text, yielding decoded text as tokens are generated
+        
+        Long texts are segmented as in batch_translate and their chunks are
+        streamed one after another, separated by the original whitespace.
+        """
+        if not self.validate_language_pair(source_language, target_language):
+            raise InvalidLanguageException(
+                f"Language pair {source_language}->{target_language} not supported"
+            )
+        
+        entry = await self._resolve(source_language, target_language)
+        input_ids = await self.preprocess_executor.run(self._tokenize, entry, [text])
+        _, unit_ids, layouts = await self.preprocess_executor.run(
+            self._segment,
+            entry,
+            [text],
+            input_ids
+        )
+        layout = layouts[0]
+        separators = [""] if layout is None else layout.separators
+        if layout is not None and layout.prefix:
+            yield layout.prefix, 0
+        
+        for ids, separator in zip(unit_ids, separators):
+            async for delta, tokens in self._stream_tokens(entry, ids, target_language):
+                yield delta, tokens
+            if separator:
+                yield separator, 0
+    
+    async def _stream_tokens(
+        self,
+        entry: LoadedModel,
+        input_ids: List[int],
+        target_language: str
+    ) -> AsyncIterator[Tuple[str, int]]:
+        """Generate one sequence, yielding (text delta, new token count) pairs"""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop_event = threading.Event()
+        
+        inputs = await self.preprocess_executor.run(self._pad, entry, [input_ids])
+        generation = asyncio.ensure_future(self.inference_executor.run(
+            self._generate,
+            entry,
+            inputs,
+            target_language,
+            streamer=_TokenStreamer(loop, queue),
+            stop_event=stop_event
+        ))
+        # _generate only ends the stream once it runs; end it as well when the
+        # call fails before that (full queue, cancellation) so the loop below
+        # wakes up and re-raises the failure from the awaited task
+        generation.add_done_callback(lambda _: queue.put_nowait(None))
+        
+        generated: List[int] = []
+        emitted = ""
+        pending_tokens = 0
+        try:
+            while True:
+                token_ids = await queue.get()
+                if token_ids is None:
+                    break
+                generated.extend(token_ids)
+                pending_tokens += len(token_ids)
+                
+                text = await self.preprocess_executor.run(self._decode_ids, entry, generated)
+                # Wait for the rest of a multi-token character
+                if text.endswith("\ufffd"):
+                    continue
+                delta = text[len(emitted):]
+                if delta:
+                    yield delta, pending_tokens
+                    emitted = text
+                    pending_tokens = 0
+            
+            await generation
+            text = await self.preprocess_executor.run(self._decode_ids, entry, generated)
+            if text[len(emitted):] or pending_tokens:
+                yield text[len(emitted):], pending_tokens
+        finally:
+            # Stop generating if the consumer went away early, and wait for the
+            # stopped call so its executor slot is released and errors retrieved
+            stop_event.set()
+            await asyncio.gather(generation, return_exceptions=True)
+    
+    async def _iter_token_batches(
+        self,
+        entry: LoadedModel,
+        input_ids: List[List[int]],
+        target_language: str
+    ) -> AsyncIterator[Tuple[List[int], List[str]]]:
+        """
+        Translate pre-tokenized inputs in length-bucketed batches
+        
+        Args:
+            entry: Model the inputs were tokenized for
+            input_ids: Unpadded token ids per input
+            target_language: Target language code
+            
+        Yields:
+            Tuples of (input indices, translations) as each batch finishes
+        """
+        if not input_ids:
+            return
+        
+        # Group by length so rows pad to similar sizes
+        if settings.LOCAL_MAX_BATCH_TOKENS > 0:
+            batches = plan_token_batches(
+                [len(ids) for ids in input_ids],
+                settings.LOCAL_MAX_BATCH_TOKENS,
+                self.batch_size
             )
+        else:
+            batches = [
+                list(range(i, min(i + self.batch_size, len(input_ids))))
+                for i in range(0, len(input_ids), self.batch_size)
+            ]
         
-        # Decode
-        translated_text = self.tokenizer.batch_decode(
-            translated_tokens,
-            skip_special_tokens=True
+        # Pad the next batch while the current one is generating
+        next_inputs = asyncio.ensure_future(
+            self.preprocess_executor.run(self._pad, entry, [input_ids[i] for i in batches[0]])
         )
+        try:
+            for n, batch in enumerate(batches):
+                inputs = await next_inputs
+                if n + 1 < len(batches):
+                    next_inputs = asyncio.ensure_future(
+                        self.preprocess_executor.run(
+                            self._pad,
+                            entry,
+                            [input_ids[i] for i in batches[n + 1]]
+                        )
+                    )
+                
+                translated_tokens = await self.inference_executor.run(
+                    self._generate,
+                    entry,
+                    inputs,
+                    target_language
+                )
+                translated = await self.preprocess_executor.run(
+                    self._decode,
+                    entry,
+                    translated_tokens
+                )
+                yield batch, translated
+        finally:
+            if not next_inputs.done():
+                next_inputs.cancel()
+    
+    def _segment(
+        self,
+        entry: LoadedModel,
+        texts: List[str],
+        input_ids: List[List[int]]
+    ) -> Tuple[List[str], List[List[int]], List[Optional[SegmentedText]]]:
+        """
+        Split texts longer than the segment budget into sentence chunks
+        
+        Returns:
+            Tuple of (units to translate, their token ids, per-text layout);
+            the layout is None for texts translated whole
+        """
+        budget = settings.LOCAL_SEGMENT_MAX_TOKENS
+        units: List[str] = []
+        unit_ids: List[List[int]] = []
+        layouts: List[Optional[SegmentedText]] = []
+        for text, ids in zip(texts, input_ids):
+            if not settings.LOCAL_SEGMENTATION_ENABLED or len(ids) <= budget:
+                units.append(text)
+                unit_ids.append(ids)
+                layouts.append(None)
+                continue
+            
+            prefix, sentences, separators = split_sentences(text)
+            lengths = [len(ids) for ids in self._tokenize(entry, sentences)] if sentences else []
+            layout = pack_sentences(prefix, sentences, separators, lengths, budget)
+            units.extend(layout.chunks)
+            if layout.chunks:
+                unit_ids.extend(self._tokenize(entry, layout.chunks))
+            layouts.append(layout)
         
+        return units, unit_ids, layouts
+    
+    async def _run_batch(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[str]:
+        """Translate a coalesced micro-batch off the event loop"""
+        entry = await self._resolve(source_language, target_language)
+        inputs = await self.preprocess_executor.run(self._encode, entry, texts)
+        translated_tokens = await self.inference_executor.run(
+            self._generate,
+            entry,
+            inputs,
+            target_language
+        )
+        return await self.preprocess_executor.run(self._decode, entry, translated_tokens)
+    
+    def _translate_internal(
+        self,
+        entry: LoadedModel,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> str:
+        """Internal translation method"""
+        translated_text = self._batch_translate_internal(
+            entry,
+            [text],
+            source_language,
+            target_language
+        )
         return translated_text[0] if translated_text else text
     
     def _batch_translate_internal(
         self,
+        entry: LoadedModel,
         texts: List[str],
         source_language: str,
         target_language: str
     ) -> List[str]:
         """Internal batch translation method"""
-        # Prepare inputs
-        inputs = self.tokenizer(
-            texts,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=settings.LOCAL_MAX_LENGTH
-        ).to(self.device)
-        
-        # Translate
-        with torch.no_grad():
-            translated_tokens = self.model.generate(
-                **inputs,
-                forced_bos_token_id=self.tokenizer.get_lang_id(target_language),
+        inputs = self._encode(entry, texts)
+        translated_tokens = self._generate(entry, inputs, target_language)
+        return self._decode(entry, translated_tokens)
+    
+    def _encode(self, entry: LoadedModel, texts: List[str]):
+        """Tokenize texts into padded model inputs on the target device"""
+        return self._pad(entry, self._tokenize(entry, texts))
+    
+    def _tokenize(self, entry: LoadedModel, texts: List[str]) -> List[List[int]]:
+        """Tokenize texts to unpadded token id lists"""
+        with stage("tokenize"):
+            return entry.tokenizer(
+                texts,
+                truncation=True,
                 max_length=settings.LOCAL_MAX_LENGTH
+            )["input_ids"]
+    
+    def _pad(self, entry: LoadedModel, input_ids: List[List[int]]):
+        """Pad pre-tokenized inputs into model tensors on the target device"""
+        with stage("tokenize"):
+            inputs = entry.tokenizer.pad(
+                {"input_ids": input_ids},
+                padding=True,
+                return_tensors="pt"
             )
+        real_tokens = sum(len(ids) for ids in input_ids)
+        padded_tokens = inputs["input_ids"].numel()
+        self._real_tokens += real_tokens
+        self._padded_tokens += padded_tokens
+        LOCAL_INPUT_TOKENS.labels(self.engine_name).inc(real_tokens)
+        LOCAL_BATCH_SIZE.labels(self.engine_name).observe(len(input_ids))
+        if padded_tokens:
+            LOCAL_PADDING_EFFICIENCY.labels(self.engine_name).observe(real_tokens / padded_tokens)
+        return inputs.to(self.device)
+    
+    def _generate(
+        self,
+        entry: LoadedModel,
+        inputs,
+        target_language: str,
+        streamer: Optional[_TokenStreamer] = None,
+        stop_event: Optional[threading.Event] = None
+    ):
+        """Run generation for tokenized inputs"""
+        generate_kwargs = {}
+        if streamer is not None:
+            generate_kwargs["streamer"] = streamer
+        if stop_event is not None:
+            from transformers import StoppingCriteriaList
+            
+            generate_kwargs["stopping_criteria"] = StoppingCriteriaList([
+                lambda input_ids, scores, **kwargs: torch.full(
+                    (input_ids.shape[0],),
+                    stop_event.is_set(),
+                    dtype=torch.bool,
+                    device=input_ids.device
+                )
+            ])
         
-        # Decode
-        translated_texts = self.tokenizer.batch_decode(
-            translated_tokens,
-            skip_special_tokens=True
-        )
-        
-        return translated_texts
+        try:
+            with torch.no_grad(), stage("generate"):
+                generated = entry.model.generate(
+                    **inputs,
+                    forced_bos_token_id=entry.forced_bos_token_id(target_language),
+                    max_length=settings.LOCAL_MAX_LENGTH,
+                    **generate_kwargs
+                )
+            pad_token_id = getattr(entry.tokenizer, "pad_token_id", None)
+            LOCAL_OUTPUT_TOKENS.labels(self.engine_name).inc(
+                generated.numel() if pad_token_id is None else int((generated != pad_token_id).sum())
+            )
+            return generated
+        finally:
+            if streamer is not None:
+                streamer.end()
+    
+    def _decode_ids(self, entry: LoadedModel, token_ids: List[int]) -> str:
+        """Decode a single sequence of token ids"""
+        with stage("decode"):
+            return entry.tokenizer.decode(token_ids, skip_special_tokens=True)
+    
+    def _decode(self, entry: LoadedModel, translated_tokens) -> List[str]:
+        """Decode generated token ids into text"""
+        with stage("decode"):
+            return entry.tokenizer.batch_decode(
+                translated_tokens,
+                skip_special_tokens=True
+            )
     
     async def get_supported_languages(self) -> Dict[str, str]:
         """Get supported languages for loaded model"""
@@ -205,7 +697,28 @@ class LocalTranslateProvider(TranslationProvider):
         target_language: str
     ) -> bool:
         """Validate language pair"""
-        model_info = self.SUPPORTED_MODELS.get(self.model_name)
+        if (source_language, target_language) in self.pair_models:
+            return True
+        return self._fallback_supports(source_language, target_language)
+    
+    async def preload(self, source_language: str, target_language: str):
+        """Load the model serving a language pair and wait for it"""
+        model_name = self.pair_models.get((source_language, target_language))
+        if model_name is not None and model_name != self.model_name:
+            await self.registry.ensure_loaded(model_name)
+    
+    def _fallback_supports(self, source_language: str, target_language: str) -> bool:
+        """Whether the fallback model translates a language pair"""
+        return self._model_supports(self.model_name, source_language, target_language)
+    
+    def _model_supports(
+        self,
+        checkpoint: str,
+        source_language: str,
+        target_language: str
+    ) -> bool:
+        """Whether a known checkpoint translates a language pair"""
+        model_info = self.SUPPORTED_MODELS.get(staged_checkpoint(checkpoint) or checkpoint)
         if not model_info:
             return True  # Unknown model, allow any pair
         
@@ -220,7 +733,9 @@ class LocalTranslateProvider(TranslationProvider):
         """Check if model is loaded and working"""
         try:
             # Try a simple translation
-            result = self._translate_internal(
+            result = await self.inference_executor.run(
+                self._translate_internal,
+                self.fallback,
                 "hello",
                 "en",
                 "es"
@@ -230,13 +745,54 @@ class LocalTranslateProvider(TranslationProvider):
             logger.error(f"Health check failed: {str(e)}")
             return False
     
+    def cache_identity(self) -> str:
+        """Identify engine, models and precision"""
+        identity = f"local:{self.model_name}:{self.precision}"
+        if self.pair_models:
+            identity += ":" + ",".join(
+                f"{source}-{target}={name}"
+                for (source, target), name in sorted(self.pair_models.items())
+            )
+        return identity
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get micro-batching, executor and model residency statistics"""
+        stats = {
+            "inference_executor": self.inference_executor.stats(),
+            "preprocess_executor": self.preprocess_executor.stats(),
+            "input_tokens": self._real_tokens,
+            "padding_efficiency": round(
+                self._real_tokens / self._padded_tokens, 3
+            ) if self._padded_tokens else 1.0,
+            "models": {**self.registry.stats(), "fallback_served": self.fallback_served},
+        }
+        if self.batcher is not None:
+            stats["microbatch"] = self.batcher.stats.snapshot()
+        return stats
+    
+    def after_fork(self):
+        """
+        Rebuild per-process state in a forked server worker
+        
+        Loaded weights are inherited from the parent and shared copy-on-write;
+        only the threads (executors, model loader) and the micro-batcher are
+        recreated. Call reset_executors_after_fork() first.
+        """
+        self.registry.after_fork()
+        self.inference_executor = get_inference_executor()
+        self.preprocess_executor = get_preprocess_executor()
+        if self.batcher is not None:
+            self.batcher = MicroBatcher(
+                self._run_batch,
+                max_batch_size=settings.LOCAL_MICROBATCH_MAX_SIZE,
+                max_wait_ms=settings.LOCAL_MICROBATCH_MAX_WAIT_MS
+            )
+    
     def unload_model(self):
         """Unload model to free memory"""
         try:
-            if self.model:
-                del self.model
-            if self.tokenizer:
-                del self.tokenizer
+            self.registry.clear()
+            self.fallback = None
             torch.cuda.empty_cache()
             logger.info("Model unloaded successfully")
         except Exception as e:
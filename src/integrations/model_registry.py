@@ -0,0 +1,343 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A model that failed to load is not retried for this many seconds
+LOAD_RETRY_SECONDS = 60.0
+
+# FLORES-200 codes, NLLB's language tokens, of the supported ISO 639-1 codes
+NLLB_LANGUAGE_CODES = {
+    "en": "eng_Latn",
+    "es": "spa_Latn",
+    "fr": "fra_Latn",
+    "de": "deu_Latn",
+    "zh": "zho_Hans",
+    "ja": "jpn_Jpan",
+    "ko": "kor_Hang",
+    "ru": "rus_Cyrl",
+    "pt": "por_Latn",
+    "hi": "hin_Deva",
+    "ar": "arb_Arab",
+    "it": "ita_Latn",
+}
+
+
+@dataclass
+class LoadedModel:
+    """A resident model with its tokenizer"""
+    name: str
+    tokenizer: Any
+    model: Any
+    precision: str = "float32"
+    memory_bytes: int = 0
+    load_seconds: float = 0.0
+
+    def forced_bos_token_id(self, target_language: str) -> Optional[int]:
+        """
+        Target language token generation starts with
+
+        None for single-pair (Marian-style) models, whose tokenizers have no
+        language tokens. Multilingual tokenizers resolve the ISO code through
+        ``get_lang_id`` (M2M-100) or their language tokens (NLLB).
+
+        Raises:
+            ValueError: If a multilingual tokenizer has no token for the language
+        """
+        tokenizer = self.tokenizer
+        get_lang_id = getattr(tokenizer, "get_lang_id", None)
+        if get_lang_id is not None:
+            return get_lang_id(target_language)
+        lang_code_to_id = getattr(tokenizer, "lang_code_to_id", None)
+        if lang_code_to_id is None and not hasattr(tokenizer, "src_lang"):
+            return None
+
+        for code in (target_language, NLLB_LANGUAGE_CODES.get(target_language)):
+            if code is None:
+                continue
+            if lang_code_to_id and code in lang_code_to_id:
+                return lang_code_to_id[code]
+            token_id = tokenizer.convert_tokens_to_ids(code)
+            if token_id is not None and token_id != tokenizer.unk_token_id:
+                return token_id
+        raise ValueError(f"{self.name} has no language token for {target_language!r}")
+
+
+def model_memory_bytes(model: Any) -> int:
+    """
+    Bytes held by a torch model's weights and buffers
+
+    Reads the state dict rather than parameters() so the packed weights of
+    quantized layers are counted, and counts tied weights once.
+    """
+    import torch
+
+    seen = set()
+    total = 0
+
+    def add(value):
+        nonlocal total
+        if isinstance(value, torch.Tensor):
+            key = (value.data_ptr(), value.numel(), value.dtype)
+            if key not in seen:
+                seen.add(key)
+                total += value.numel() * value.element_size()
+        elif isinstance(value, (tuple, list)):
+            for item in value:
+                add(item)
+
+    for value in model.state_dict(keep_vars=True).values():
+        add(value)
+    return total
+
+
+def parse_pair_models(spec: str) -> Dict[Tuple[str, str], str]:
+    """
+    Parse a language pair to model mapping
+
+    Args:
+        spec: Comma-separated ``src-tgt=model`` entries,
+            e.g. ``"en-es=Helsinki-NLP/opus-mt-en-es,en-fr=Helsinki-NLP/opus-mt-en-fr"``
+
+    Returns:
+        Dict of (source, target) to model name
+    """
+    mapping = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        pair, _, model_name = entry.partition("=")
+        source, _, target = pair.strip().partition("-")
+        if not (source and target and model_name.strip()):
+            raise ValueError(f"Invalid pair model entry: {entry!r}")
+        mapping[(source.strip(), target.strip())] = model_name.strip()
+    return mapping
+
+
+class ModelRegistry:
+    """
+    Memory-budgeted LRU of resident models
+
+    Models are loaded on a dedicated loader thread, one at a time, so a cold
+    model never occupies the inference workers serving other pairs. After
+    each load, least recently used models are evicted until the resident
+    total fits in ``memory_budget_bytes``; pinned models and the model just
+    loaded are never evicted. A model too large to fit next to the pinned
+    models is dropped and not loaded again.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], LoadedModel],
+        memory_budget_bytes: int = 0,
+        pinned: Iterable[str] = ()
+    ):
+        """
+        Initialize the registry
+
+        Args:
+            loader: Blocking function loading a model by name
+            memory_budget_bytes: Max bytes of resident models (0 = unbounded)
+            pinned: Model names that are never evicted
+        """
+        self.loader = loader
+        self.memory_budget_bytes = memory_budget_bytes
+        self.pinned = set(pinned)
+        self._models: "OrderedDict[str, LoadedModel]" = OrderedDict()
+        self._loading: Dict[str, Future] = {}
+        self._failed: Dict[str, Tuple[float, BaseException]] = {}
+        # Models that can never fit in the budget; budget and pins are fixed
+        self._unfittable: Dict[str, BaseException] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_failures = 0
+        self.evictions = 0
+
+    def get(self, name: str) -> Optional[LoadedModel]:
+        """Get a resident model and mark it as recently used"""
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._models.move_to_end(name)
+            self.hits += 1
+            return entry
+
+    def load(self, name: str) -> LoadedModel:
+        """Load a model on the calling thread (blocking) and make it resident"""
+        return self._load_future(name).result()
+
+    async def ensure_loaded(self, name: str) -> LoadedModel:
+        """Get a model, waiting for it to load if it is not resident"""
+        entry = self.get(name)
+        if entry is not None:
+            return entry
+        return await asyncio.wrap_future(self._load_future(name))
+
+    def load_in_background(self, name: str):
+        """Start loading a model without waiting for it"""
+        self._load_future(name)
+
+    def is_loading(self, name: str) -> bool:
+        with self._lock:
+            return name in self._loading
+
+    def has_failed(self, name: str) -> bool:
+        """Whether the last load of a model failed within LOAD_RETRY_SECONDS, or it cannot fit"""
+        with self._lock:
+            if name in self._unfittable:
+                return True
+            failed = self._failed.get(name)
+            return failed is not None and time.monotonic() - failed[0] < LOAD_RETRY_SECONDS
+
+    def evict(self, name: str):
+        """Drop a model from the registry"""
+        with self._lock:
+            if self._models.pop(name, None) is not None:
+                self.evictions += 1
+                logger.info(f"Evicted model {name}")
+
+    def after_fork(self):
+        """Recreate the loader thread and lock in a forked child; resident models are kept"""
+        self._lock = threading.Lock()
+        self._loading = {}
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+
+    def clear(self):
+        """Drop every model and stop the loader thread"""
+        with self._lock:
+            self._models.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def memory_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.memory_bytes for entry in self._models.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Get residency, load and eviction statistics"""
+        with self._lock:
+            resident = {
+                name: {
+                    "memory_mb": round(entry.memory_bytes / 2 ** 20, 1),
+                    "load_seconds": round(entry.load_seconds, 2),
+                    "precision": entry.precision,
+                    "pinned": name in self.pinned,
+                }
+                for name, entry in self._models.items()
+            }
+            loading = list(self._loading)
+            failed = list(self._failed)
+            unfittable = list(self._unfittable)
+        return {
+            "resident": resident,
+            "loading": loading,
+            "failed": failed,
+            "unfittable": unfittable,
+            "memory_mb": round(sum(e["memory_mb"] for e in resident.values()), 1),
+            "memory_budget_mb": round(self.memory_budget_bytes / 2 ** 20, 1),
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "load_failures": self.load_failures,
+            "evictions": self.evictions,
+        }
+
+    def _load_future(self, name: str) -> Future:
+        """Return the in-flight load of a model, starting one if needed"""
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is not None:
+                future: Future = Future()
+                future.set_result(entry)
+                return future
+            future = self._loading.get(name)
+            if future is None and name in self._unfittable:
+                future = Future()
+                future.set_exception(self._unfittable[name])
+                return future
+            failed = self._failed.get(name)
+            if future is None and failed and time.monotonic() - failed[0] < LOAD_RETRY_SECONDS:
+                future = Future()
+                future.set_exception(failed[1])
+                return future
+            if future is None:
+                future = self._pool.submit(self._load, name)
+                self._loading[name] = future
+            return future
+
+    def _load(self, name: str) -> LoadedModel:
+        """Load a model on the loader thread and admit it"""
+        logger.info(f"Loading model {name}")
+        start = time.monotonic()
+        try:
+            entry = self.loader(name)
+        except Exception as e:
+            with self._lock:
+                self.load_failures += 1
+                self._loading.pop(name, None)
+                self._failed[name] = (time.monotonic(), e)
+            logger.error(f"Failed to load model {name}: {str(e)}")
+            raise
+        entry.load_seconds = time.monotonic() - start
+
+        with self._lock:
+            self._loading.pop(name, None)
+            error = self._admission_error(name, entry)
+            if error is not None:
+                self._unfittable[name] = error
+                self.load_failures += 1
+            else:
+                self._models[name] = entry
+                self._failed.pop(name, None)
+                self.loads += 1
+                self._evict_over_budget(keep=name)
+        if error is not None:
+            logger.warning(f"Not keeping model {name}: {str(error)}")
+            raise error
+        logger.info(
+            f"Loaded model {name} in {entry.load_seconds:.1f}s "
+            f"({entry.memory_bytes / 2 ** 20:.0f} MB)"
+        )
+        return entry
+
+    def _admission_error(self, name: str, entry: LoadedModel) -> Optional[MemoryError]:
+        """Why a loaded model cannot be kept, or None if it fits next to the pinned models"""
+        if not self.memory_budget_bytes or name in self.pinned:
+            return None
+        pinned_bytes = sum(
+            resident.memory_bytes for resident_name, resident in self._models.items()
+            if resident_name in self.pinned
+        )
+        if pinned_bytes + entry.memory_bytes <= self.memory_budget_bytes:
+            return None
+        return MemoryError(
+            f"{entry.memory_bytes / 2 ** 20:.0f} MB does not fit in the "
+            f"{self.memory_budget_bytes / 2 ** 20:.0f} MB budget next to "
+            f"{pinned_bytes / 2 ** 20:.0f} MB of pinned models"
+        )
+
+    def _evict_over_budget(self, keep: str):
+        """Evict least recently used unpinned models, except ``keep``, until within budget"""
+        if not self.memory_budget_bytes:
+            return
+        total = sum(entry.memory_bytes for entry in self._models.values())
+        for name in list(self._models):
+            if total <= self.memory_budget_bytes:
+                break
+            if name in self.pinned or name == keep:
+                continue
+            total -= self._models.pop(name).memory_bytes
+            self.evictions += 1
+            logger.info(f"Evicted model {name} to stay within the memory budget")
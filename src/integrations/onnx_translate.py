@@ -0,0 +1,199 @@
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from src.core.config import get_settings
+from src.integrations.local_translate import LocalTranslateProvider
+from src.integrations.model_registry import LoadedModel
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Written by src.tools.export_onnx next to the graphs
+MANIFEST_FILE = "manifest.json"
+ENCODER_FILE = "encoder.onnx"
+DECODER_FILE = "decoder.onnx"
+
+
+class OnnxSeq2SeqModel:
+    """
+    Greedy encoder-decoder generation on ONNX Runtime
+
+    The encoder graph returns every decoder layer's cross-attention keys and
+    values, computed once per batch. The decoder graph takes one token per
+    row plus the self-attention cache and returns the next-token logits and
+    the grown cache, so each step only runs the new position. ``generate``
+    mirrors the subset of ``PreTrainedModel.generate`` that
+    LocalTranslateProvider uses.
+    """
+
+    def __init__(self, model_dir: str, providers: List[str], intra_op_threads: int = 0):
+        """
+        Load an exported artifact
+
+        Args:
+            model_dir: Directory written by src.tools.export_onnx
+            providers: ONNX Runtime execution providers, in preference order
+            intra_op_threads: Threads per session (0 = ONNX Runtime default)
+        """
+        import onnxruntime as ort
+
+        with open(os.path.join(model_dir, MANIFEST_FILE), encoding="utf-8") as manifest_file:
+            self.manifest: Dict[str, Any] = json.load(manifest_file)
+        self.model_dir = model_dir
+        self.checkpoint = self.manifest["checkpoint"]
+        self.precision = self.manifest["precision"]
+        self.num_layers = self.manifest["num_layers"]
+        self.num_heads = self.manifest["num_heads"]
+        self.head_dim = self.manifest["head_dim"]
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = 1
+        self.encoder = ort.InferenceSession(
+            os.path.join(model_dir, ENCODER_FILE),
+            sess_options=options,
+            providers=providers
+        )
+        self.decoder = ort.InferenceSession(
+            os.path.join(model_dir, DECODER_FILE),
+            sess_options=options,
+            providers=providers
+        )
+
+    def memory_bytes(self) -> int:
+        """Size of the graphs and their weights on disk"""
+        return sum(
+            os.path.getsize(os.path.join(self.model_dir, name))
+            for name in os.listdir(self.model_dir)
+            if name.endswith((".onnx", ".data"))
+        )
+
+    def generate(
+        self,
+        input_ids: torch.Tensor,
+        attention_mask: torch.Tensor,
+        forced_bos_token_id: Optional[int] = None,
+        max_length: int = 200,
+        streamer: Optional[Any] = None,
+        stopping_criteria: Optional[List[Any]] = None,
+        **kwargs
+    ) -> torch.Tensor:
+        """
+        Greedily decode a padded batch
+
+        Returns:
+            Generated token ids, starting with the decoder start token; rows
+            that finished early are padded with the pad token
+        """
+        input_ids = input_ids.cpu().numpy().astype(np.int64)
+        attention_mask = attention_mask.cpu().numpy().astype(np.int64)
+        batch_size = input_ids.shape[0]
+        pad_token_id = self.manifest["pad_token_id"]
+        eos_token_id = self.manifest["eos_token_id"]
+
+        cross = self.encoder.run(None, {"input_ids": input_ids, "attention_mask": attention_mask})
+        feed = {"encoder_attention_mask": attention_mask}
+        past = []
+        for layer in range(self.num_layers):
+            feed[f"cross_key.{layer}"] = cross[2 * layer]
+            feed[f"cross_value.{layer}"] = cross[2 * layer + 1]
+            past.extend([np.zeros((batch_size, self.num_heads, 0, self.head_dim), dtype=np.float32)] * 2)
+
+        tokens = np.full((batch_size, 1), self.manifest["decoder_start_token_id"], dtype=np.int64)
+        sequences = [tokens]
+        finished = np.zeros(batch_size, dtype=bool)
+        if streamer is not None:
+            streamer.put(torch.from_numpy(tokens))
+
+        for step in range(max_length - 1):
+            feed["input_ids"] = tokens
+            for layer in range(self.num_layers):
+                feed[f"past_key.{layer}"] = past[2 * layer]
+                feed[f"past_value.{layer}"] = past[2 * layer + 1]
+            logits, *past = self.decoder.run(None, feed)
+
+            if step == 0 and forced_bos_token_id is not None:
+                next_tokens = np.full(batch_size, forced_bos_token_id, dtype=np.int64)
+            else:
+                next_tokens = logits.argmax(axis=-1)
+            next_tokens = np.where(finished, pad_token_id, next_tokens)
+            finished |= next_tokens == eos_token_id
+
+            tokens = next_tokens[:, None].astype(np.int64)
+            sequences.append(tokens)
+            if streamer is not None:
+                streamer.put(torch.from_numpy(tokens))
+            if finished.all():
+                break
+            if stopping_criteria and self._should_stop(stopping_criteria, sequences):
+                break
+
+        return torch.from_numpy(np.concatenate(sequences, axis=1))
+
+    @staticmethod
+    def _should_stop(stopping_criteria: List[Any], sequences: List[np.ndarray]) -> bool:
+        generated = torch.from_numpy(np.concatenate(sequences, axis=1))
+        return any(bool(criterion(generated, None).all()) for criterion in stopping_criteria)
+
+
+class OnnxTranslateProvider(LocalTranslateProvider):
+    """
+    Local translation on ONNX Runtime
+
+    Serves artifacts exported by ``python -m src.tools.export_onnx`` with the
+    same batching, segmentation, streaming and per-pair model registry as
+    LocalTranslateProvider; only generation runs on ONNX Runtime instead of
+    PyTorch eager. Decoding is greedy.
+    """
+
+    def __init__(self):
+        """Initialize ONNX Runtime sessions for the fallback artifact"""
+        super().__init__()
+        # Precision is fixed when the artifact is exported
+        self.precision = self.fallback.precision
+
+    def _configured_models(self) -> Tuple[str, str]:
+        """ONNX_MODEL_DIR and ONNX_PAIR_MODELS artifact directories"""
+        return settings.ONNX_MODEL_DIR, settings.ONNX_PAIR_MODELS
+
+    def _load_model(self, model_dir: str) -> LoadedModel:
+        """Load an exported artifact and its tokenizer (blocking)"""
+        from transformers import AutoTokenizer
+
+        model = OnnxSeq2SeqModel(
+            model_dir,
+            providers=[p.strip() for p in settings.ONNX_EXECUTION_PROVIDERS.split(",") if p.strip()],
+            intra_op_threads=settings.ONNX_INTRA_OP_THREADS
+        )
+        return LoadedModel(
+            name=model_dir,
+            tokenizer=AutoTokenizer.from_pretrained(model_dir),
+            model=model,
+            precision=model.precision,
+            memory_bytes=model.memory_bytes()
+        )
+
+    def _fallback_supports(self, source_language: str, target_language: str) -> bool:
+        """Languages follow the checkpoint the fallback artifact was exported from"""
+        return self._model_supports(
+            self.fallback.model.checkpoint,
+            source_language,
+            target_language
+        )
+
+    def cache_identity(self) -> str:
+        """Identify engine, exported checkpoints and precision"""
+        identity = f"onnx:{self.fallback.model.checkpoint}:{self.fallback.precision}"
+        if self.pair_models:
+            identity += ":" + ",".join(
+                f"{source}-{target}={name}"
+                for (source, target), name in sorted(self.pair_models.items())
+            )
+        return identity
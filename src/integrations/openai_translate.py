@@ -1,13 +1,68 @@
-from typing import List, Dict
+from typing import Any, AsyncIterator, List, Dict, Tuple
+import asyncio
+import json
 import logging
 from src.integrations.base import TranslationProvider
-from src.core.exceptions import OpenAITranslateException, InvalidLanguageException
+from src.integrations.batching import pack_by_budget
+from src.integrations.fanout import fan_out_packs, stream_packs
+from src.integrations.rate_limit import RateLimitScheduler
+from src.integrations.retry import backoff_delay, retry_after_seconds
+from src.core.exceptions import (
+    OpenAITranslateException,
+    InvalidLanguageException,
+    RateLimitException
+)
 from src.core.config import get_settings
+from src.core.timing import stage
 from src.core.enums import SupportedLanguage
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Rough characters-per-token ratio used to size packs without a tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def request_timeout():
+    """Per-call deadline for OpenAI requests"""
+    import httpx
+    
+    return httpx.Timeout(settings.OPENAI_TIMEOUT, connect=settings.OPENAI_CONNECT_TIMEOUT)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens a text costs in a prompt"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def parse_translation_array(content: str, expected: int) -> List[str]:
+    """
+    Parse a packed completion into exactly one translation per input
+    
+    Args:
+        content: Completion text, expected to be a JSON array of strings
+        expected: Number of texts in the pack
+        
+    Returns:
+        Translations in pack order
+        
+    Raises:
+        ValueError: If the content is not a JSON array of the expected length
+    """
+    content = content.strip()
+    # Tolerate a markdown code fence around the array
+    if content.startswith("```"):
+        content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
+    
+    translations = json.loads(content)
+    if not isinstance(translations, list) or not all(
+        isinstance(t, str) for t in translations
+    ):
+        raise ValueError("expected a JSON array of strings")
+    if len(translations) != expected:
+        raise ValueError(f"expected {expected} translations, got {len(translations)}")
+    return [t.strip() for t in translations]
+
 
 class OpenAITranslateProvider(TranslationProvider):
     """OpenAI API-based translation provider"""
@@ -30,10 +85,17 @@ class OpenAITranslateProvider(TranslationProvider):
     def __init__(self):
         """Initialize OpenAI client"""
         try:
-            from openai import OpenAI
-            
-            self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            self._build_client()
             self.model = settings.OPENAI_MODEL
+            self.packed_calls = 0
+            self.pack_splits = 0
+            self.retries = 0
+            self.scheduler = RateLimitScheduler(
+                "openai",
+                settings.OPENAI_RATE_LIMIT_RPM,
+                settings.OPENAI_RATE_LIMIT_TPM,
+                settings.RATE_LIMIT_MAX_WAIT
+            )
             logger.info(f"OpenAI provider initialized with model: {self.model}")
         except ImportError:
             raise OpenAITranslateException("openai library not installed")
@@ -68,9 +130,8 @@ class OpenAITranslateProvider(TranslationProvider):
                 f"Text: {text}"
             )
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
+            response = await self._complete(
+                [
                     {
                         "role": "system",
                         "content": f"You are a professional translator. Translate text accurately from {source_lang_name} to {target_lang_name}."
@@ -80,11 +141,12 @@ class OpenAITranslateProvider(TranslationProvider):
                         "content": prompt
                     }
                 ],
-                temperature=0.3,
                 max_tokens=2048
             )
             
             return response.choices[0].message.content.strip()
+        except (OpenAITranslateException, RateLimitException):
+            raise
         except Exception as e:
             logger.error(f"OpenAI translation error: {str(e)}")
             raise OpenAITranslateException(str(e))
@@ -95,12 +157,240 @@ class OpenAITranslateProvider(TranslationProvider):
         source_language: str,
         target_language: str
     ) -> List[str]:
-        """Batch translate multiple texts"""
-        results = []
-        for text in texts:
-            translated = await self.translate(text, source_language, target_language)
-            results.append(translated)
-        return results
+        """
+        Batch translate multiple texts with packed prompts
+        
+        Texts are packed in order, up to OPENAI_PACK_MAX_TEXTS texts and
+        OPENAI_PACK_MAX_TOKENS estimated tokens per pack. Each pack is one
+        completion that returns a JSON array. Packs run concurrently.
+        
+        Raises:
+            PartialBatchTranslationException: If only some packs failed
+        """
+        if not self.validate_language_pair(source_language, target_language):
+            raise InvalidLanguageException(
+                f"Language pair {source_language}->{target_language} not supported"
+            )
+        
+        return await fan_out_packs(
+            texts,
+            self._pack(texts),
+            lambda pack: self._translate_pack(pack, source_language, target_language),
+            settings.REMOTE_BATCH_CONCURRENCY,
+            "openai"
+        )
+    
+    async def batch_translate_stream(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Batch translate with the packing of batch_translate, yielding each
+        text as soon as its request finishes
+        
+        Raises:
+            PartialBatchTranslationException: Once every request has finished,
+                if only some of them failed
+        """
+        if not self.validate_language_pair(source_language, target_language):
+            raise InvalidLanguageException(
+                f"Language pair {source_language}->{target_language} not supported"
+            )
+        
+        async for item in stream_packs(
+            texts,
+            self._pack(texts),
+            lambda pack: self._translate_pack(pack, source_language, target_language),
+            settings.REMOTE_BATCH_CONCURRENCY,
+            "openai"
+        ):
+            yield item
+    
+    def _pack(self, texts: List[str]) -> List[List[int]]:
+        """Group text indices into requests within the per-request limits"""
+        return pack_by_budget(
+            [estimate_tokens(text) for text in texts],
+            settings.OPENAI_PACK_MAX_TEXTS,
+            settings.OPENAI_PACK_MAX_TOKENS
+        )
+    
+    async def _translate_pack(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[str]:
+        """
+        Translate a pack of texts with one completion
+        
+        If the response is not a JSON array with one translation per text,
+        the pack is split in half and each half is retried; single texts fall
+        back to the plain prompt.
+        """
+        if len(texts) == 1:
+            return [await self.translate(texts[0], source_language, target_language)]
+        
+        source_lang_name = self.SUPPORTED_LANGUAGES.get(source_language, source_language)
+        target_lang_name = self.SUPPORTED_LANGUAGES.get(target_language, target_language)
+        input_tokens = sum(estimate_tokens(text) for text in texts)
+        
+        self.packed_calls += 1
+        response = await self._complete(
+            [
+                {
+                    "role": "system",
+                    "content": (
+                        f"You are a professional translator. Translate each string of the "
+                        f"JSON array from {source_lang_name} to {target_lang_name}. Respond "
+                        f"with only a JSON array of exactly {len(texts)} translated strings, "
+                        f"in the same order."
+                    )
+                },
+                {
+                    "role": "user",
+                    "content": json.dumps(texts, ensure_ascii=False)
+                }
+            ],
+            # Translations can run longer than their source, plus JSON quoting
+            max_tokens=min(2 * input_tokens + 4 * len(texts) + 16, 4096)
+        )
+        
+        try:
+            return parse_translation_array(
+                response.choices[0].message.content or "",
+                len(texts)
+            )
+        except ValueError as e:
+            logger.warning(f"Splitting OpenAI pack of {len(texts)} texts: {str(e)}")
+            self.pack_splits += 1
+            middle = len(texts) // 2
+            left, right = await asyncio.gather(
+                self._translate_pack(texts[:middle], source_language, target_language),
+                self._translate_pack(texts[middle:], source_language, target_language)
+            )
+            return left + right
+    
+    def _build_client(self):
+        """Create the async client with a shared keep-alive connection pool"""
+        import httpx
+        from openai import AsyncOpenAI
+        
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            base_url=settings.OPENAI_BASE_URL or None,
+            # Retries are handled by _complete
+            max_retries=0,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_POOL_SIZE,
+                    max_keepalive_connections=settings.OPENAI_POOL_SIZE
+                )
+            )
+        )
+        # Bounds API calls across all requests sharing this provider
+        self.semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+        self._client_loop = None
+    
+    def _get_client(self):
+        """
+        Get the async client for the running event loop
+        
+        The client's connections and the semaphore are bound to the loop they
+        are first used on. The API server and each job worker run a single
+        long-lived loop; should the provider still move to another loop, both
+        are rebuilt and the old client's connection pool is closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not None and self._client_loop is not loop:
+            self._close_client(self.client, self._client_loop)
+            self._build_client()
+        self._client_loop = loop
+        return self.client
+    
+    @staticmethod
+    def _close_client(client: Any, loop: asyncio.AbstractEventLoop):
+        """Close a client on the loop its connections belong to"""
+        if loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.close(), loop)
+        else:
+            # Its connections cannot be closed gracefully any more
+            logger.warning("Dropping an OpenAI client whose event loop has stopped")
+    
+    async def _complete(self, messages: List[Dict[str, str]], max_tokens: int) -> Any:
+        """
+        Run one chat completion within the rate limits and the provider-wide
+        concurrency limit
+        
+        Each attempt first waits for request and token budget from the
+        scheduler. Rate limits, timeouts, connection errors and 5xx responses
+        are retried up to OPENAI_MAX_RETRIES times with jittered exponential
+        backoff, waiting at least as long as the server's Retry-After.
+        
+        Raises:
+            RateLimitException: If the call would queue longer than RATE_LIMIT_MAX_WAIT
+        """
+        import openai
+        
+        client = self._get_client()
+        timeout = request_timeout()
+        # Prompt plus a translation of similar length
+        cost = 2 * sum(estimate_tokens(message["content"]) for message in messages)
+        attempt = 0
+        while True:
+            with stage("rate_limit"):
+                await self.scheduler.acquire(cost)
+            try:
+                async with self.semaphore:
+                    with stage("openai"):
+                        raw = await client.chat.completions.with_raw_response.create(
+                            model=self.model,
+                            messages=messages,
+                            temperature=0.3,
+                            max_tokens=max_tokens,
+                            timeout=timeout
+                        )
+                self.scheduler.update_from_headers(raw.headers)
+                return raw.parse()
+            except (
+                openai.RateLimitError,
+                openai.InternalServerError,
+                openai.APITimeoutError,
+                openai.APIConnectionError
+            ) as e:
+                if attempt >= settings.OPENAI_MAX_RETRIES:
+                    logger.error(f"OpenAI translation error after {attempt} retries: {str(e)}")
+                    raise OpenAITranslateException(str(e))
+                
+                delay = backoff_delay(
+                    attempt,
+                    settings.OPENAI_BACKOFF_BASE,
+                    settings.OPENAI_BACKOFF_MAX
+                )
+                response = getattr(e, "response", None)
+                retry_after = retry_after_seconds(
+                    response.headers if response is not None else None
+                )
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                if isinstance(e, openai.RateLimitError):
+                    # Hold back every caller, not just this retry
+                    self.scheduler.penalize(delay)
+                    self.scheduler.update_from_headers(
+                        response.headers if response is not None else None
+                    )
+                
+                attempt += 1
+                self.retries += 1
+                logger.warning(
+                    f"OpenAI call failed ({e.__class__.__name__}), "
+                    f"retry {attempt} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error(f"OpenAI translation error: {str(e)}")
+                raise OpenAITranslateException(str(e))
     
     async def get_supported_languages(self) -> Dict[str, str]:
         """Get supported languages"""
@@ -118,12 +408,24 @@ class OpenAITranslateProvider(TranslationProvider):
             source_language != target_language
         )
     
+    def cache_identity(self) -> str:
+        """Identify engine and model"""
+        return f"openai:{self.model}"
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get packed-prompt, retry and rate limit statistics"""
+        return {
+            "packed_calls": self.packed_calls,
+            "pack_splits": self.pack_splits,
+            "retries": self.retries,
+            "rate_limit": self.scheduler.stats(),
+        }
+    
     async def health_check(self) -> bool:
         """Check if OpenAI API is accessible"""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": "hello"}],
+            response = await self._complete(
+                [{"role": "user", "content": "hello"}],
                 max_tokens=10
             )
             return bool(response.choices[0].message.content)
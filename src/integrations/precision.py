@@ -0,0 +1,64 @@
+import logging
+from typing import Any, Dict
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+# Weight dtype each precision mode loads the model in
+PRECISION_DTYPES: Dict[str, torch.dtype] = {
+    "float32": torch.float32,
+    "bfloat16": torch.bfloat16,
+    "float16": torch.float16,
+    "int8": torch.float32,  # Loaded in float32, then Linear layers are quantized
+}
+
+
+def resolve_precision(precision: str, device: str) -> str:
+    """
+    Pick the precision mode to run on a device
+
+    float16 kernels are incomplete on CPU, so CPU float16 runs as bfloat16.
+    Dynamic int8 quantization only has CPU kernels, so on CUDA it runs as
+    float16.
+
+    Raises:
+        ValueError: If the precision mode is unknown
+    """
+    precision = precision.lower()
+    if precision not in PRECISION_DTYPES:
+        raise ValueError(
+            f"Unknown precision {precision!r}, expected one of {', '.join(PRECISION_DTYPES)}"
+        )
+    if device == "cpu" and precision == "float16":
+        logger.warning("float16 is not supported on CPU, using bfloat16")
+        return "bfloat16"
+    if device != "cpu" and precision == "int8":
+        logger.warning("int8 dynamic quantization runs on CPU only, using float16")
+        return "float16"
+    return precision
+
+
+def load_dtype(precision: str) -> torch.dtype:
+    """Dtype to pass to from_pretrained for a precision mode"""
+    return PRECISION_DTYPES[precision]
+
+
+def apply_precision(model: Any, precision: str) -> Any:
+    """
+    Convert a loaded float model to a precision mode
+
+    int8 replaces every nn.Linear with a dynamically quantized one: weights
+    are stored as int8 and activations are quantized per batch, which cuts
+    the memory traffic of the matmuls that dominate CPU generation.
+    """
+    if precision == "int8":
+        return torch.ao.quantization.quantize_dynamic(
+            model,
+            {torch.nn.Linear},
+            dtype=torch.qint8
+        )
+    dtype = PRECISION_DTYPES[precision]
+    if next(model.parameters()).dtype != dtype:
+        model = model.to(dtype)
+    return model
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Mapping, Optional
+
+from src.core.exceptions import RateLimitException
+from src.integrations.batching import percentile
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Per-minute budget refilled continuously
+
+    The level may go negative: callers reserve their cost up front and then
+    wait until the bucket has refilled past zero, which keeps waiters in
+    arrival order without a lock.
+    """
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.level = per_minute
+        self._updated_at = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """Refill rate per second"""
+        return self.per_minute / 60.0
+
+    def refill(self):
+        now = time.monotonic()
+        self.level = min(
+            self.per_minute,
+            self.level + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def wait_for(self, cost: float) -> float:
+        """Seconds until cost could be spent, after reservations already made"""
+        self.refill()
+        deficit = min(cost, self.per_minute) - self.level
+        return max(deficit, 0.0) / self.rate
+
+    def reserve(self, cost: float):
+        self.level -= min(cost, self.per_minute)
+
+
+class RateLimitScheduler:
+    """
+    Request and token budgets for an API-backed engine
+
+    Calls that would exceed the requests-per-minute or tokens-per-minute
+    budget are queued until the budget refills instead of being sent to fail
+    with a 429. A call whose wait would exceed ``max_wait`` is rejected with
+    RateLimitException. Limits follow the ``x-ratelimit-*`` response headers
+    when the API sends them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        max_wait: float
+    ):
+        """
+        Initialize the scheduler
+
+        Args:
+            name: Engine name for logs and statistics
+            requests_per_minute: Request budget (0 = unlimited)
+            tokens_per_minute: Estimated token budget (0 = unlimited)
+            max_wait: Max seconds a call may be queued before it is rejected
+        """
+        self.name = name
+        self.max_wait = max_wait
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.acquired = 0
+        self.queued = 0
+        self.rejected = 0
+        self._wait_times: Deque[float] = deque(maxlen=1024)
+
+    async def acquire(self, tokens: int = 0):
+        """
+        Wait until a call costing tokens fits in the budgets, then spend them
+
+        Raises:
+            RateLimitException: If the call would wait longer than max_wait
+        """
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_for(1))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.wait_for(tokens))
+
+        if wait > self.max_wait:
+            self.rejected += 1
+            logger.warning(
+                f"{self.name} rate limit queue full: {wait:.1f}s wait exceeds {self.max_wait}s"
+            )
+            raise RateLimitException()
+
+        # Reserve now so later callers queue behind this one
+        if self.requests is not None:
+            self.requests.reserve(1)
+        if self.tokens is not None:
+            self.tokens.reserve(tokens)
+        self.acquired += 1
+        self._wait_times.append(wait)
+
+        if wait > 0:
+            self.queued += 1
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self.queue_depth -= 1
+
+    def update_from_headers(self, headers: Optional[Mapping[str, str]]):
+        """
+        Follow the limits reported by the API
+
+        Reads ``x-ratelimit-limit-{requests,tokens}`` to set the budgets and
+        ``x-ratelimit-remaining-{requests,tokens}`` to account for usage this
+        process cannot see (other workers sharing the same key).
+        """
+        if not headers:
+            return
+        for kind, bucket in (("requests", self.requests), ("tokens", self.tokens)):
+            if bucket is None:
+                continue
+            limit = _header_float(headers, f"x-ratelimit-limit-{kind}")
+            remaining = _header_float(headers, f"x-ratelimit-remaining-{kind}")
+            bucket.refill()
+            if limit:
+                bucket.per_minute = limit
+            if remaining is not None:
+                bucket.level = min(bucket.level, remaining)
+
+    def penalize(self, seconds: float):
+        """Hold back new calls for seconds after the API rejected one (429)"""
+        if self.requests is not None:
+            self.requests.refill()
+            self.requests.level = min(self.requests.level, -seconds * self.requests.rate)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue depth, wait time and budget statistics"""
+        return {
+            "requests_per_minute": self.requests.per_minute if self.requests else None,
+            "tokens_per_minute": self.tokens.per_minute if self.tokens else None,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "acquired": self.acquired,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "wait_p50_ms": round(percentile(self._wait_times, 50) * 1000, 2),
+            "wait_p99_ms": round(percentile(self._wait_times, 99) * 1000, 2),
+        }
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
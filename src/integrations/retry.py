@@ -0,0 +1,52 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Exponential backoff with full jitter
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay ceiling of the first retry, in seconds
+        cap: Maximum delay ceiling, in seconds
+
+    Returns:
+        Seconds to wait, uniformly drawn from [0, min(cap, base * 2^attempt)]
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Read the server-requested delay from rate-limit response headers
+
+    Supports ``retry-after-ms`` and ``retry-after`` given either as seconds
+    or as an HTTP date.
+
+    Returns:
+        Seconds to wait, or None if the headers carry no usable hint
+    """
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(float(value) / 1000, 0.0)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
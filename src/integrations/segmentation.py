@@ -0,0 +1,151 @@
+import re
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# Whitespace after sentence-final punctuation (optionally followed by a
+# closing quote or bracket), after CJK full stops, or around line breaks
+SENTENCE_BOUNDARY = re.compile(
+    r"((?:(?<=[.!?…])|(?<=[.!?…][\"'”’)\]]))\s+"
+    r"|(?<=[。！？])\s*"
+    r"|\s*\n\s*)"
+)
+
+
+@dataclass
+class SegmentedText:
+    """A text split into translatable chunks and the whitespace between them"""
+    prefix: str
+    chunks: List[str]
+    separators: List[str]
+
+    def reassemble(self, translations: List[str]) -> str:
+        """
+        Rebuild the full text from translated chunks
+
+        Args:
+            translations: One translation per chunk, in order
+
+        Returns:
+            Translated text with the original whitespace and line breaks
+        """
+        return self.prefix + "".join(
+            translation + separator
+            for translation, separator in zip(translations, self.separators)
+        )
+
+
+def split_sentences(text: str) -> Tuple[str, List[str], List[str]]:
+    """
+    Split text into sentences, keeping the exact whitespace between them
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Tuple of (leading whitespace, sentences, whitespace after each sentence)
+    """
+    stripped = text.lstrip()
+    prefix = text[:len(text) - len(stripped)]
+
+    parts = SENTENCE_BOUNDARY.split(stripped)
+    sentences: List[str] = []
+    separators: List[str] = []
+    for i in range(0, len(parts), 2):
+        sentence = parts[i]
+        separator = parts[i + 1] if i + 1 < len(parts) else ""
+        if sentence:
+            sentences.append(sentence)
+            separators.append(separator)
+        elif separators:
+            separators[-1] += separator
+        else:
+            prefix += separator
+
+    # Trailing whitespace of the last sentence belongs to its separator
+    if sentences:
+        body = sentences[-1].rstrip()
+        separators[-1] = sentences[-1][len(body):] + separators[-1]
+        sentences[-1] = body
+    return prefix, sentences, separators
+
+
+def pack_sentences(
+    prefix: str,
+    sentences: List[str],
+    separators: List[str],
+    lengths: List[int],
+    max_tokens: int
+) -> SegmentedText:
+    """
+    Pack consecutive sentences into chunks of at most max_tokens tokens
+
+    Sentences are never joined across line breaks, so paragraph structure
+    survives translation. A sentence longer than the budget is split on
+    whitespace into roughly budget-sized pieces.
+
+    Args:
+        prefix: Leading whitespace of the text
+        sentences: Sentences from split_sentences
+        separators: Whitespace following each sentence
+        lengths: Token length of each sentence
+        max_tokens: Token budget per chunk
+
+    Returns:
+        SegmentedText describing the chunks
+    """
+    chunks: List[str] = []
+    chunk_separators: List[str] = []
+    current = ""
+    current_tokens = 0
+    pending_separator = ""
+
+    def close(separator: str):
+        nonlocal current, current_tokens
+        chunks.append(current)
+        chunk_separators.append(separator)
+        current = ""
+        current_tokens = 0
+
+    for i, (sentence, separator, length) in enumerate(zip(sentences, separators, lengths)):
+        pieces = [(sentence, length)]
+        if length > max_tokens:
+            pieces = _split_long_sentence(sentence, length, max_tokens)
+
+        for j, (piece, piece_tokens) in enumerate(pieces):
+            if current and current_tokens + piece_tokens > max_tokens:
+                close(pending_separator)
+            if current:
+                current += pending_separator
+            current += piece
+            current_tokens += piece_tokens
+            pending_separator = separator if j == len(pieces) - 1 else " "
+
+        if "\n" in separator or i == len(sentences) - 1:
+            close(separator)
+
+    return SegmentedText(prefix=prefix, chunks=chunks, separators=chunk_separators)
+
+
+def _split_long_sentence(
+    sentence: str,
+    length: int,
+    max_tokens: int
+) -> List[Tuple[str, int]]:
+    """Split an over-budget sentence on whitespace, estimating piece lengths"""
+    words = sentence.split()
+    tokens_per_char = length / max(len(sentence), 1)
+
+    pieces: List[Tuple[str, int]] = []
+    current: List[str] = []
+    current_tokens = 0
+    for word in words:
+        word_tokens = max(1, round(len(word) * tokens_per_char))
+        if current and current_tokens + word_tokens > max_tokens:
+            pieces.append((" ".join(current), current_tokens))
+            current = []
+            current_tokens = 0
+        current.append(word)
+        current_tokens += word_tokens
+    if current:
+        pieces.append((" ".join(current), current_tokens))
+    return pieces
@@ -0,0 +1,137 @@
+"""
+Memory-mapped loading of locally staged checkpoints
+
+``python -m src.tools.stage_model`` writes a checkpoint's config, tokenizer
+and safetensors weights, already in the serving dtype, to a local
+directory. Loading it maps the safetensors files and assigns the mapped
+tensors to an uninitialized model: no random initialization, no
+intermediate state dict copy, and the weight pages are file-backed, so they
+are paged in on demand and shared through the page cache by every process
+serving the same artifact.
+"""
+import json
+import logging
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STAGED_MANIFEST_FILE = "staged.json"
+SAFETENSORS_FILE = "model.safetensors"
+SAFETENSORS_INDEX_FILE = "model.safetensors.index.json"
+
+
+def is_staged_model(path: str) -> bool:
+    """Whether a model name is a local directory with safetensors weights"""
+    return os.path.isdir(path) and bool(_weight_files(path))
+
+
+@lru_cache(maxsize=None)
+def staged_checkpoint(path: str) -> Optional[str]:
+    """The checkpoint a staged directory was written from, if recorded"""
+    manifest = os.path.join(path, STAGED_MANIFEST_FILE)
+    if not os.path.isfile(manifest):
+        return None
+    with open(manifest, encoding="utf-8") as manifest_file:
+        return json.load(manifest_file).get("checkpoint")
+
+
+def _weight_files(path: str) -> List[str]:
+    index = os.path.join(path, SAFETENSORS_INDEX_FILE)
+    if os.path.isfile(index):
+        with open(index, encoding="utf-8") as index_file:
+            shards = sorted(set(json.load(index_file)["weight_map"].values()))
+        return [os.path.join(path, shard) for shard in shards]
+    single = os.path.join(path, SAFETENSORS_FILE)
+    return [single] if os.path.isfile(single) else []
+
+
+@contextmanager
+def _skip_init() -> Iterator[None]:
+    """Build modules without initializing weights that are about to be replaced"""
+    import torch
+
+    def keep(tensor: Any, *args, **kwargs) -> Any:
+        return tensor
+
+    names = [
+        name for name in dir(torch.nn.init)
+        if name.endswith("_") and not name.startswith("_")
+    ]
+    originals = {name: getattr(torch.nn.init, name) for name in names}
+    try:
+        from transformers.modeling_utils import no_init_weights
+    except ImportError:
+        from transformers.initialization import no_init_weights
+    try:
+        for name in names:
+            setattr(torch.nn.init, name, keep)
+        with no_init_weights():
+            yield
+    finally:
+        for name, function in originals.items():
+            setattr(torch.nn.init, name, function)
+
+
+def load_staged_model(path: str, dtype: Any) -> Any:
+    """
+    Load a staged seq2seq checkpoint without copying its weights
+
+    Args:
+        path: Directory written by src.tools.stage_model
+        dtype: torch dtype to serve in; weights stored in another dtype are
+            converted, which costs a copy
+
+    Returns:
+        The model in eval mode, on CPU, with memory-mapped weights
+
+    Raises:
+        ValueError: If weights are missing from the artifact
+    """
+    from safetensors.torch import load_file
+    from transformers import AutoConfig, AutoModelForSeq2SeqLM
+
+    config = AutoConfig.from_pretrained(path)
+    with _skip_init():
+        model = AutoModelForSeq2SeqLM.from_config(config)
+
+    state: Dict[str, Any] = {}
+    for weight_file in _weight_files(path):
+        # Tensors are views of the mapped file
+        state.update(load_file(weight_file, device="cpu"))
+
+    converted = 0
+    for name, tensor in state.items():
+        if tensor.is_floating_point() and tensor.dtype != dtype:
+            state[name] = tensor.to(dtype)
+            converted += 1
+    if converted:
+        logger.warning(
+            f"Converted {converted} tensors of {path} to {dtype}; "
+            f"stage the model in that dtype to load without copying"
+        )
+
+    result = model.load_state_dict(state, strict=False, assign=True)
+    if result.unexpected_keys:
+        logger.warning(f"Ignoring unexpected weights in {path}: {result.unexpected_keys[:5]}")
+    # Shared weights (embeddings, lm_head) are stored once
+    model.tie_weights()
+
+    loaded = {tensor.data_ptr() for tensor in state.values()}
+    parameters = dict(model.named_parameters(remove_duplicate=False))
+    untied = [
+        name for name in result.missing_keys
+        if name in parameters and parameters[name].data_ptr() not in loaded
+    ]
+    if untied:
+        raise ValueError(f"Weights missing from staged model {path}: {untied[:5]}")
+
+    # Buffers the artifact does not store (e.g. sinusoidal positions) are
+    # rebuilt at construction time in float32
+    for module in model.modules():
+        for name, buffer in module.named_buffers(recurse=False):
+            if buffer is not None and buffer.is_floating_point() and buffer.dtype != dtype:
+                setattr(module, name, buffer.to(dtype))
+    return model.eval()
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from src.core.config import get_settings
+from src.integrations.base import TranslationProvider
+from src.integrations.factory import get_translation_provider, local_providers
+
+if TYPE_CHECKING:
+    from src.integrations.local_translate import LocalTranslateProvider
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+WARMUP_SENTENCE = (
+    "The quick brown fox jumps over the lazy dog while the committee reviews "
+    "the quarterly report and schedules a follow-up meeting for next week."
+)
+
+
+@dataclass
+class Readiness:
+    """Startup progress of the translation provider"""
+    status: str = "starting"  # starting, loading, warming, ready or failed
+    error: Optional[str] = None
+    started_at: float = 0.0
+    load_seconds: Optional[float] = None
+    warmup_seconds: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "status": self.status,
+            "error": self.error,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+        }
+
+
+# Global readiness state, reported by /ready
+readiness = Readiness()
+
+
+def warmup_text(words: int) -> str:
+    """A text of roughly the given number of words"""
+    vocabulary = WARMUP_SENTENCE.split()
+    return " ".join(vocabulary[i % len(vocabulary)] for i in range(words))
+
+
+def parse_language_pairs(spec: str) -> List[Tuple[str, str]]:
+    """Parse comma-separated ``src-tgt`` pairs"""
+    pairs = []
+    for entry in spec.split(","):
+        source, _, target = entry.strip().partition("-")
+        if source and target:
+            pairs.append((source, target))
+    return pairs
+
+
+def warmup_targets(provider: TranslationProvider) -> List["LocalTranslateProvider"]:
+    """
+    Local engines behind a provider
+
+    Only local engines are warmed up: they are the ones with cold kernels and
+    allocator pools, and exercising remote engines would spend API quota.
+    """
+    return local_providers(provider)
+
+
+async def warm_up(provider: "LocalTranslateProvider"):
+    """
+    Run warmup batches on a local engine
+
+    For every WARMUP_LANGUAGE_PAIRS pair, loads the pair's model and
+    translates WARMUP_PASSES batches of WARMUP_BATCH_SIZE texts at each of
+    the WARMUP_SEQUENCE_LENGTHS, so the first user requests do not pay for
+    kernel selection and memory pool growth.
+    """
+    lengths = [int(length) for length in settings.WARMUP_SEQUENCE_LENGTHS.split(",") if length.strip()]
+    for source_language, target_language in parse_language_pairs(settings.WARMUP_LANGUAGE_PAIRS):
+        if not provider.validate_language_pair(source_language, target_language):
+            logger.warning(f"Skipping warmup of unsupported pair {source_language}->{target_language}")
+            continue
+        await provider.preload(source_language, target_language)
+        for length in lengths:
+            texts = [warmup_text(length)] * settings.WARMUP_BATCH_SIZE
+            for _ in range(settings.WARMUP_PASSES):
+                await provider.batch_translate(texts, source_language, target_language)
+
+
+async def start_up(state: Readiness = readiness):
+    """
+    Initialize the configured provider and warm it up
+
+    Runs in the background from the application lifespan. Initialization is
+    retried every STARTUP_RETRY_SECONDS until it succeeds; the state turns
+    ready only after warmup has finished.
+    """
+    state.started_at = time.monotonic()
+    while True:
+        try:
+            state.status = "loading"
+            start = time.monotonic()
+            # Model downloads and loads block, keep them off the event loop
+            provider = await asyncio.to_thread(get_translation_provider)
+            state.load_seconds = round(time.monotonic() - start, 2)
+
+            state.status = "warming"
+            start = time.monotonic()
+            for target in warmup_targets(provider):
+                await warm_up(target)
+            state.warmup_seconds = round(time.monotonic() - start, 2)
+
+            state.status = "ready"
+            state.error = None
+            logger.info(
+                f"Translation provider ready: loaded in {state.load_seconds}s, "
+                f"warmed up in {state.warmup_seconds}s"
+            )
+            return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            state.status = "failed"
+            state.error = str(e)
+            logger.error(
+                f"Provider startup failed, retrying in {settings.STARTUP_RETRY_SECONDS}s: {str(e)}"
+            )
+            await asyncio.sleep(settings.STARTUP_RETRY_SECONDS)
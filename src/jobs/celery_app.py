@@ -0,0 +1,21 @@
+from celery import Celery
+from src.core.config import get_settings
+
+settings = get_settings()
+
+celery_app = Celery(
+    "translation_jobs",
+    broker=settings.CELERY_BROKER_URL or settings.REDIS_URL,
+    include=["src.jobs.tasks"]
+)
+
+celery_app.conf.update(
+    # Run tasks in-process (tests / local development without a broker)
+    task_always_eager=settings.CELERY_TASK_ALWAYS_EAGER,
+    task_eager_propagates=True,
+    # Redeliver a job if its worker dies; the job resumes from its checkpoint
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+    task_ignore_result=True,
+)
@@ -0,0 +1,76 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.exceptions import PartialBatchTranslationException
+from src.integrations.base import TranslationProvider
+
+
+async def translate_chunk(
+    provider: TranslationProvider,
+    lines: List[bytes],
+    first_index: int,
+    source_language: str,
+    target_language: str
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Translate one chunk of JSONL input
+
+    Lines are grouped by language pair so each pair goes to the provider as a
+    single batch, letting it pack full model batches. Records may override
+    the job's languages with their own ``source_language`` /
+    ``target_language`` fields.
+
+    Returns:
+        Tuple of (output records in input order, number of failed records)
+    """
+    records: List[Optional[Dict[str, Any]]] = [None] * len(lines)
+    groups: Dict[Tuple[str, str], List[int]] = {}
+    failed = 0
+
+    for position, line in enumerate(lines):
+        if not line.strip():
+            continue
+        index = first_index + position
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict) or not isinstance(record.get("text"), str):
+                raise ValueError("expected an object with a string 'text' field")
+        except ValueError as e:
+            records[position] = {"index": index, "error": f"Invalid line: {str(e)}"}
+            failed += 1
+            continue
+
+        record["index"] = index
+        records[position] = record
+        pair = (
+            record.get("source_language", source_language),
+            record.get("target_language", target_language)
+        )
+        groups.setdefault(pair, []).append(position)
+
+    for (source, target), positions in groups.items():
+        if not provider.validate_language_pair(source, target):
+            for p in positions:
+                records[p]["error"] = f"Language pair {source}->{target} not supported"
+            failed += len(positions)
+            continue
+
+        errors = {}
+        try:
+            translated = await provider.batch_translate(
+                [records[p]["text"] for p in positions],
+                source,
+                target
+            )
+        except PartialBatchTranslationException as e:
+            translated = e.results
+            errors = e.errors
+
+        for i, (p, text) in enumerate(zip(positions, translated)):
+            if i in errors:
+                records[p]["error"] = errors[i]
+            else:
+                records[p]["translated_text"] = text
+        failed += len(errors)
+
+    return [record for record in records if record is not None], failed
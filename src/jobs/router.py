@@ -0,0 +1,72 @@
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import FileResponse
+from src.jobs.service import JobService
+from src.jobs.schemas import JobStatusResponse
+from src.core.exceptions import TranslationException
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+@router.post("/", response_model=JobStatusResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_job(request: Request, source_language: str, target_language: str):
+    """
+    Submit a JSONL corpus for bulk translation
+    
+    Send the corpus as the request body (`Content-Type: application/x-ndjson`),
+    one JSON object per line with a `text` field. Lines may override the job
+    languages with their own `source_language` / `target_language`.
+    
+    **Parameters:**
+    - **source_language**: Default source language code
+    - **target_language**: Default target language code
+    """
+    try:
+        return await JobService.create_job(
+            request.stream(),
+            source_language,
+            target_language
+        )
+    except TranslationException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.message
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str):
+    """Get bulk translation job status and progress"""
+    try:
+        return await JobService.get_job(job_id)
+    except TranslationException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.message
+        )
+
+
+@router.get("/{job_id}/results")
+async def get_job_results(job_id: str):
+    """Download a completed job's results as JSONL, in input order"""
+    try:
+        path = await JobService.get_results_path(job_id)
+    except TranslationException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.message
+        )
+    
+    return FileResponse(
+        path,
+        media_type="application/x-ndjson",
+        filename=f"{job_id}.jsonl"
+    )
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class JobStatusResponse(BaseModel):
+    """Bulk translation job status"""
+    job_id: str
+    status: str
+    source_language: str
+    target_language: str
+    total: int
+    processed: int
+    failed: int
+    progress: float
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
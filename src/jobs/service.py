@@ -0,0 +1,119 @@
+import asyncio
+import json
+import logging
+import os
+from typing import AsyncIterator, Dict, Any
+
+from src.core.enums import JobStatus
+from src.core.exceptions import InvalidJobInputException, JobNotReadyException
+from src.jobs.schemas import JobStatusResponse
+from src.jobs.store import JobStore
+from src.jobs.tasks import process_job
+
+logger = logging.getLogger(__name__)
+
+
+class JobService:
+    """Bulk translation job service"""
+    
+    @staticmethod
+    async def create_job(
+        body: AsyncIterator[bytes],
+        source_language: str,
+        target_language: str
+    ) -> JobStatusResponse:
+        """
+        Store an uploaded JSONL corpus and queue it for translation
+        
+        The body is streamed to disk line by line, so corpus size is not
+        limited by memory. Every non-blank line must be a JSON object with a
+        string ``text`` field.
+        """
+        store = JobStore()
+        state = store.create(source_language, target_language)
+        job_id = state["job_id"]
+        
+        try:
+            total = await JobService._write_input(body, store.input_path(job_id))
+        except InvalidJobInputException:
+            store.update(job_id, status=JobStatus.FAILED.value, error="Invalid input")
+            raise
+        
+        if total == 0:
+            store.update(job_id, status=JobStatus.FAILED.value, error="Empty input")
+            raise InvalidJobInputException("Corpus contains no lines")
+        
+        store.update(job_id, total=total)
+        # Publishing may block on the broker (or run the job, in eager mode)
+        await asyncio.to_thread(process_job.delay, job_id)
+        logger.info(f"Job {job_id} queued: {total} lines {source_language}->{target_language}")
+        return JobService._to_response(store.load(job_id))
+    
+    @staticmethod
+    async def get_job(job_id: str) -> JobStatusResponse:
+        """Get job status and progress"""
+        return JobService._to_response(JobStore().load(job_id))
+    
+    @staticmethod
+    async def get_results_path(job_id: str) -> str:
+        """
+        Get the path of a completed job's output
+        
+        Raises:
+            JobNotReadyException: If the job has not completed
+        """
+        store = JobStore()
+        state = store.load(job_id)
+        if state["status"] != JobStatus.COMPLETED.value:
+            raise JobNotReadyException(job_id, state["status"])
+        return store.output_path(job_id)
+    
+    @staticmethod
+    async def _write_input(body: AsyncIterator[bytes], path: str) -> int:
+        """Stream the request body to disk, validating and counting lines"""
+        total = 0
+        buffer = b""
+        
+        def write(f, line: bytes):
+            nonlocal total
+            if not line.strip():
+                return
+            total += 1
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict) or not isinstance(record.get("text"), str):
+                raise InvalidJobInputException(
+                    f"Line {total} is not a JSON object with a string 'text' field"
+                )
+            f.write(line.rstrip(b"\r") + b"\n")
+        
+        # Blank lines are dropped so that progress counts translatable lines
+        with open(path, "wb") as f:
+            async for chunk in body:
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    write(f, line)
+            write(f, buffer)
+            f.flush()
+            os.fsync(f.fileno())
+        return total
+    
+    @staticmethod
+    def _to_response(state: Dict[str, Any]) -> JobStatusResponse:
+        total = state["total"]
+        return JobStatusResponse(
+            job_id=state["job_id"],
+            status=state["status"],
+            source_language=state["source_language"],
+            target_language=state["target_language"],
+            total=total,
+            processed=state["processed"],
+            failed=state["failed"],
+            progress=round(state["processed"] / total, 4) if total else 0.0,
+            error=state["error"],
+            created_at=state["created_at"],
+            updated_at=state["updated_at"]
+        )
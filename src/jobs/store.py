@@ -0,0 +1,105 @@
+import json
+import logging
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.core.config import get_settings
+from src.core.enums import JobStatus
+from src.core.exceptions import JobNotFoundException
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class JobStore:
+    """
+    Filesystem store for bulk translation jobs
+
+    Each job lives in its own directory holding the uploaded ``input.jsonl``,
+    the ``output.jsonl`` written so far and a ``state.json`` checkpoint. The
+    checkpoint records how many input lines have been processed and the size
+    of the output at that point, so a restarted worker can discard any
+    partially written chunk and resume exactly where it stopped.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or settings.JOBS_DIR
+
+    def create(self, source_language: str, target_language: str) -> Dict[str, Any]:
+        """
+        Create a new pending job
+
+        Args:
+            source_language: Default source language for the corpus
+            target_language: Default target language for the corpus
+
+        Returns:
+            Initial job state
+        """
+        job_id = uuid.uuid4().hex
+        os.makedirs(self.job_dir(job_id))
+        now = datetime.utcnow().isoformat()
+        state = {
+            "job_id": job_id,
+            "status": JobStatus.PENDING.value,
+            "source_language": source_language,
+            "target_language": target_language,
+            "total": 0,
+            "processed": 0,
+            "failed": 0,
+            "input_offset": 0,
+            "output_bytes": 0,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        self.save(state)
+        return state
+
+    def load(self, job_id: str) -> Dict[str, Any]:
+        """
+        Load a job's state
+
+        Raises:
+            JobNotFoundException: If the job does not exist
+        """
+        try:
+            with open(self.state_path(job_id), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            raise JobNotFoundException(job_id)
+
+    def save(self, state: Dict[str, Any]):
+        """Atomically write a job's state"""
+        state["updated_at"] = datetime.utcnow().isoformat()
+        path = self.state_path(state["job_id"])
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def update(self, job_id: str, **fields) -> Dict[str, Any]:
+        """Load, modify and save a job's state"""
+        state = self.load(job_id)
+        state.update(fields)
+        self.save(state)
+        return state
+
+    def job_dir(self, job_id: str) -> str:
+        # Job ids are generated hex strings; reject anything else
+        if not job_id.isalnum():
+            raise JobNotFoundException(job_id)
+        return os.path.join(self.root, job_id)
+
+    def state_path(self, job_id: str) -> str:
+        return os.path.join(self.job_dir(job_id), "state.json")
+
+    def input_path(self, job_id: str) -> str:
+        return os.path.join(self.job_dir(job_id), "input.jsonl")
+
+    def output_path(self, job_id: str) -> str:
+        return os.path.join(self.job_dir(job_id), "output.jsonl")
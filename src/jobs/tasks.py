@@ -0,0 +1,142 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+from itertools import islice
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+from src.core.config import get_settings
+from src.core.enums import JobStatus
+from src.core.exceptions import (
+    JobNotFoundException,
+    RateLimitException,
+    TranslationEngineException
+)
+from src.integrations.base import TranslationProvider
+from src.integrations.factory import get_translation_provider
+from src.jobs.celery_app import celery_app
+from src.jobs.corpus import translate_chunk
+from src.jobs.store import JobStore
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+_job_loop: Optional[asyncio.AbstractEventLoop] = None
+_job_loop_pid: Optional[int] = None
+_job_loop_lock = threading.Lock()
+
+
+def _get_job_loop() -> asyncio.AbstractEventLoop:
+    """The worker process's job loop, started on first use in each process"""
+    global _job_loop, _job_loop_pid
+
+    with _job_loop_lock:
+        if _job_loop is None or _job_loop_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="job-loop", daemon=True).start()
+            _job_loop, _job_loop_pid = loop, os.getpid()
+        return _job_loop
+
+
+def run_on_job_loop(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine on the worker's long-lived job loop and wait for its result
+
+    Providers and the cache keep loop-bound resources created on first use
+    (semaphores, HTTP connection pools, the Redis client), so every job of a
+    worker runs on the same loop rather than a fresh ``asyncio.run()`` loop.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_job_loop())
+    try:
+        return future.result()
+    except BaseException:
+        # e.g. a Celery time limit interrupting the wait
+        future.cancel()
+        raise
+
+
+@celery_app.task(bind=True, name="jobs.process_job", max_retries=settings.JOBS_MAX_RETRIES)
+def process_job(self, job_id: str):
+    """Translate a bulk job, resuming from its last checkpoint"""
+    store = JobStore()
+    try:
+        run_on_job_loop(run_job(store, job_id, get_translation_provider()))
+    except JobNotFoundException:
+        logger.error(f"Job {job_id} no longer exists")
+    except (TranslationEngineException, RateLimitException) as e:
+        if self.request.retries < self.max_retries:
+            logger.warning(f"Job {job_id} interrupted, retrying: {e.message}")
+            store.update(job_id, error=e.message)
+            raise self.retry(exc=e, countdown=2 ** self.request.retries)
+        store.update(job_id, status=JobStatus.FAILED.value, error=e.message)
+        raise
+    except Exception as e:
+        logger.error(f"Job {job_id} failed: {str(e)}")
+        store.update(job_id, status=JobStatus.FAILED.value, error=str(e))
+        raise
+
+
+async def run_job(
+    store: JobStore,
+    job_id: str,
+    provider: TranslationProvider,
+    chunk_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Stream through a job's input in chunks, checkpointing after each one
+
+    Args:
+        store: Job store
+        job_id: Job to run
+        provider: Translation provider
+        chunk_size: Input lines per chunk (defaults to JOBS_CHUNK_SIZE)
+
+    Returns:
+        Final job state
+    """
+    chunk_size = chunk_size or settings.JOBS_CHUNK_SIZE
+    state = store.load(job_id)
+    if state["status"] == JobStatus.COMPLETED.value:
+        return state
+
+    state.update(status=JobStatus.RUNNING.value, error=None)
+    store.save(state)
+    if state["processed"]:
+        logger.info(f"Resuming job {job_id} at line {state['processed']}")
+
+    with open(store.input_path(job_id), "rb") as source, \
+            open(store.output_path(job_id), "ab") as output:
+        # Drop anything written after the last checkpoint
+        output.truncate(state["output_bytes"])
+        source.seek(state["input_offset"])
+
+        while True:
+            lines = list(islice(source, chunk_size))
+            if not lines:
+                break
+
+            records, failed = await translate_chunk(
+                provider,
+                lines,
+                state["processed"],
+                state["source_language"],
+                state["target_language"]
+            )
+            for record in records:
+                output.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+            output.flush()
+            os.fsync(output.fileno())
+
+            state["processed"] += len(lines)
+            state["failed"] += failed
+            state["input_offset"] = source.tell()
+            state["output_bytes"] = output.tell()
+            store.save(state)
+
+    state["status"] = JobStatus.COMPLETED.value
+    store.save(state)
+    logger.info(f"Job {job_id} completed: {state['processed']} lines, {state['failed']} failed")
+    return state
@@ -1,14 +1,23 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 import logging.config
 import os
 from datetime import datetime
+from typing import Optional
 
 from src.core.config import get_settings
 from src.translation.router import router as translation_router
+from src.jobs.router import router as jobs_router
 from src.core.exceptions import TranslationException
+from src.core.metrics import CONTENT_TYPE, REGISTRY, MetricsMiddleware
+from src.core.profiler import get_profiler
+from src.core.timing import TimingMiddleware
+from src.integrations.executor import shutdown_executors
+from src.integrations.warmup import readiness, start_up
 
 # Setup logging
 if os.path.exists("logging.ini"):
@@ -26,9 +35,21 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Translation engine: {settings.TRANSLATION_ENGINE}")
+    startup_task = None
+    if settings.STARTUP_PRELOAD:
+        # Load and warm up in the background; /ready reports progress
+        startup_task = asyncio.create_task(start_up())
+    else:
+        readiness.status = "ready"
+    if settings.PROFILER_ENABLED:
+        get_profiler().start()
     yield
     # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME}")
+    if startup_task is not None:
+        startup_task.cancel()
+    await asyncio.to_thread(get_profiler().stop)
+    shutdown_executors()
 
 
 app = FastAPI(
@@ -48,6 +69,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Latency per route and requests in flight
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Per-stage Server-Timing header; also feeds the sampling profiler
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(TimingMiddleware, profiler=get_profiler())
+
 
 # Exception handler
 @app.exception_handler(TranslationException)
@@ -62,7 +91,7 @@ async def translation_exception_handler(request, exc: TranslationException):
 # Health check
 @app.get("/health")
 async def health_check():
-    """Service health check"""
+    """Service liveness check"""
     return {
         "status": "healthy",
         "service": settings.APP_NAME,
@@ -72,8 +101,62 @@ async def health_check():
     }
 
 
+# Readiness check
+@app.get("/ready")
+async def readiness_check():
+    """Service readiness check: 503 until the provider is loaded and warmed up"""
+    return JSONResponse(
+        status_code=200 if readiness.ready else 503,
+        content={
+            **readiness.snapshot(),
+            "service": settings.APP_NAME,
+            "translation_engine": settings.TRANSLATION_ENGINE,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    )
+
+
+# Prometheus metrics
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Performance metrics in the Prometheus text format"""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+# Sampling profiler control
+@app.get("/debug/profiler", include_in_schema=False)
+async def profiler_status():
+    """Sampling profiler settings and the slowest requests profiled so far"""
+    if not settings.PROFILER_CONTROL_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiler control is disabled")
+    return get_profiler().status()
+
+
+@app.post("/debug/profiler", include_in_schema=False)
+async def profiler_toggle(
+    enabled: bool,
+    slowest: Optional[int] = None,
+    interval_ms: Optional[float] = None
+):
+    """Start or stop the sampling profiler"""
+    if not settings.PROFILER_CONTROL_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiler control is disabled")
+    if not settings.SERVER_TIMING_ENABLED:
+        raise HTTPException(status_code=409, detail="The profiler needs SERVER_TIMING_ENABLED")
+    profiler = get_profiler()
+    # Stopping joins the sampler and waits for pending profile writes
+    if enabled:
+        await asyncio.to_thread(profiler.start, slowest=slowest, interval_ms=interval_ms)
+    else:
+        await asyncio.to_thread(profiler.stop)
+    return profiler.status()
+
+
 # Include routers
 app.include_router(translation_router)
+app.include_router(jobs_router)
 
 
 # Root endpoint
@@ -0,0 +1,136 @@
+"""
+Benchmark the ONNX engine against the PyTorch local engine
+
+Runs the same corpus through LocalTranslateProvider (the checkpoint the
+artifact was exported from) and OnnxTranslateProvider, and reports for each
+engine the resident memory, batch throughput and single-sentence latency,
+plus how closely the ONNX translations match PyTorch's (exact match, chrF).
+
+Usage:
+    python -m src.tools.benchmark_onnx --device cpu \\
+        --onnx-dir models/onnx/nllb-200-distilled-600M -s en -t es
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from src.integrations.batching import percentile
+from src.tools.precision_report import DEFAULT_CORPUS, compare_outputs
+
+logger = logging.getLogger(__name__)
+
+
+async def _measure(
+    provider: Any,
+    corpus: List[str],
+    source_language: str,
+    target_language: str,
+    repeats: int
+) -> Dict[str, Any]:
+    """Time batch passes and one-at-a-time translations of a corpus"""
+    # Untimed pass: session/kernel warmup
+    translations = await provider.batch_translate(corpus, source_language, target_language)
+
+    tokens_before = provider.get_stats()["input_tokens"]
+    start = time.perf_counter()
+    for _ in range(repeats):
+        await provider.batch_translate(corpus, source_language, target_language)
+    elapsed = time.perf_counter() - start
+    tokens = provider.get_stats()["input_tokens"] - tokens_before
+
+    latencies = []
+    for text in corpus:
+        started = time.perf_counter()
+        await provider.translate(text, source_language, target_language)
+        latencies.append(time.perf_counter() - started)
+
+    return {
+        "engine": provider.engine_name,
+        "precision": provider.precision,
+        "memory_mb": provider.get_stats()["models"]["memory_mb"],
+        "sentences_per_second": round(len(corpus) * repeats / elapsed, 2),
+        "tokens_per_second": round(tokens / elapsed, 2),
+        "latency_p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "latency_p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "translations": translations,
+    }
+
+
+def benchmark(
+    corpus: List[str],
+    source_language: str,
+    target_language: str,
+    repeats: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark the configured ONNX artifact and its source checkpoint
+
+    Returns:
+        One result per engine; the ONNX one carries a ``quality`` entry
+        comparing its translations to PyTorch's
+    """
+    from src.core.config import get_settings
+    from src.integrations.local_translate import LocalTranslateProvider
+    from src.integrations.onnx_translate import OnnxTranslateProvider
+
+    settings = get_settings()
+    results = []
+
+    onnx_provider = OnnxTranslateProvider()
+    try:
+        # Compare against the exact checkpoint the artifact was exported from
+        settings.LOCAL_MODEL_NAME = onnx_provider.fallback.model.checkpoint
+        results.append(asyncio.run(_measure(onnx_provider, corpus, source_language, target_language, repeats)))
+    finally:
+        onnx_provider.unload_model()
+
+    local_provider = LocalTranslateProvider()
+    try:
+        results.insert(0, asyncio.run(_measure(local_provider, corpus, source_language, target_language, repeats)))
+    finally:
+        local_provider.unload_model()
+
+    results[1]["quality"] = compare_outputs(results[0]["translations"], results[1]["translations"])
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark the ONNX engine against PyTorch")
+    parser.add_argument("--onnx-dir", default=None, help="Override ONNX_MODEL_DIR")
+    parser.add_argument("--source-language", "-s", default="en")
+    parser.add_argument("--target-language", "-t", default="es")
+    parser.add_argument("--corpus", default=None, help="JSONL file with a 'text' field per line")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed batch passes over the corpus")
+    parser.add_argument("--device", default=None, help="Override LOCAL_DEVICE for PyTorch (e.g. cpu)")
+    parser.add_argument("--show-translations", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    from src.core.config import get_settings
+
+    settings = get_settings()
+    # Measure the engines themselves, one request at a time
+    settings.LOCAL_MICROBATCH_ENABLED = False
+    settings.LOCAL_PAIR_MODELS = ""
+    settings.ONNX_PAIR_MODELS = ""
+    if args.onnx_dir:
+        settings.ONNX_MODEL_DIR = args.onnx_dir
+    if args.device:
+        settings.LOCAL_DEVICE = args.device
+
+    corpus = DEFAULT_CORPUS
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as source:
+            corpus = [json.loads(line)["text"] for line in source if line.strip()]
+
+    for result in benchmark(corpus, args.source_language, args.target_language, args.repeats):
+        if not args.show_translations:
+            result.pop("translations")
+        print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
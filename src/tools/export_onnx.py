@@ -0,0 +1,301 @@
+"""
+Export a Hugging Face translation checkpoint for the ONNX engine
+
+Writes an encoder graph (returning the cross-attention keys/values of every
+decoder layer) and a single-step decoder graph with self-attention KV cache
+inputs/outputs, optimizes both offline with ONNX Runtime, optionally applies
+dynamic int8 quantization, and saves the tokenizer and a manifest next to
+them. Point ONNX_MODEL_DIR at the output directory.
+
+Usage:
+    python -m src.tools.export_onnx facebook/nllb-200-distilled-600M \\
+        models/onnx/nllb-200-distilled-600M --quantize
+"""
+import argparse
+import inspect
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import torch
+
+from src.integrations.onnx_translate import DECODER_FILE, ENCODER_FILE, MANIFEST_FILE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OPSET = 17
+
+
+def _decoder_cache(layers: tuple) -> Any:
+    """Past key values in the form the installed transformers expects"""
+    try:
+        from transformers.cache_utils import EncoderDecoderCache
+    except ImportError:
+        # Older releases take legacy per-layer tuples
+        return layers
+    if hasattr(EncoderDecoderCache, "from_legacy_cache"):
+        return EncoderDecoderCache.from_legacy_cache(layers)
+    return EncoderDecoderCache(layers)
+
+
+def _self_attention_tensors(cache: Any) -> List[torch.Tensor]:
+    """Flatten the self-attention part of a returned cache to [key, value] per layer"""
+    if isinstance(cache, tuple):
+        return [tensor for layer in cache for tensor in layer[:2]]
+    cache = cache.self_attention_cache
+    if hasattr(cache, "layers"):
+        return [tensor for layer in cache.layers for tensor in (layer.keys, layer.values)]
+    return [
+        tensor
+        for keys, values in zip(cache.key_cache, cache.value_cache)
+        for tensor in (keys, values)
+    ]
+
+
+class _EncoderWrapper(torch.nn.Module):
+    """Encoder plus the per-layer cross-attention projections of the decoder"""
+
+    def __init__(self, model: Any):
+        super().__init__()
+        self.model = model
+        self.head_dim = model.config.d_model // model.config.decoder_attention_heads
+
+    def forward(self, input_ids: torch.Tensor, attention_mask: torch.Tensor):
+        hidden = self.model.get_encoder()(
+            input_ids=input_ids,
+            attention_mask=attention_mask
+        ).last_hidden_state
+        batch_size, length, _ = hidden.shape
+        outputs = []
+        for layer in self.model.get_decoder().layers:
+            attention = layer.encoder_attn
+            for projection in (attention.k_proj, attention.v_proj):
+                outputs.append(
+                    projection(hidden).view(batch_size, length, -1, self.head_dim).transpose(1, 2)
+                )
+        return tuple(outputs)
+
+
+class _DecoderStepWrapper(torch.nn.Module):
+    """One decoder step over cached self- and cross-attention keys/values"""
+
+    def __init__(self, model: Any):
+        super().__init__()
+        self.model = model
+        self.num_layers = model.config.decoder_layers
+
+    def forward(self, input_ids: torch.Tensor, encoder_attention_mask: torch.Tensor, *past: torch.Tensor):
+        layers = tuple(tuple(past[4 * i:4 * i + 4]) for i in range(self.num_layers))
+        # Cross-attention reads its cached keys; the hidden states only give
+        # the decoder the encoder length for the cross-attention mask
+        cross_key = past[2]
+        encoder_hidden_states = cross_key.transpose(1, 2).reshape(
+            cross_key.shape[0], cross_key.shape[2], -1
+        )
+        outputs = self.model.get_decoder()(
+            input_ids=input_ids,
+            encoder_hidden_states=encoder_hidden_states,
+            encoder_attention_mask=encoder_attention_mask,
+            past_key_values=_decoder_cache(layers),
+            use_cache=True
+        )
+        logits = self.model.lm_head(outputs.last_hidden_state[:, -1])
+        if getattr(self.model, "final_logits_bias", None) is not None:
+            logits = logits + self.model.final_logits_bias[0]
+        return (logits, *_self_attention_tensors(outputs.past_key_values))
+
+
+def _onnx_export(module: torch.nn.Module, args: tuple, path: str, **kwargs):
+    """torch.onnx.export with the TorchScript exporter on every torch version"""
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        kwargs["dynamo"] = False
+    torch.onnx.export(module, args, path, do_constant_folding=True, **kwargs)
+
+
+def _optimize(source: str, target: str):
+    """Apply ONNX Runtime's offline graph optimizations and save the result"""
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    # EXTENDED fusions are portable; layout-specific ones are applied at load time
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    options.optimized_model_filepath = target
+    options.add_session_config_entry(
+        "session.optimized_model_external_initializers_file_name",
+        os.path.basename(target) + ".data"
+    )
+    options.add_session_config_entry(
+        "session.optimized_model_external_initializers_min_size_in_bytes",
+        "1024"
+    )
+    ort.InferenceSession(source, sess_options=options, providers=["CPUExecutionProvider"])
+
+
+def _quantize(source: str, target: str):
+    """Dynamic int8 quantization of the MatMul/Gemm weights"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(
+        source,
+        target,
+        weight_type=QuantType.QInt8,
+        use_external_data_format=True
+    )
+
+
+def export_model(
+    model: Any,
+    output_dir: str,
+    checkpoint: str,
+    tokenizer: Optional[Any] = None,
+    quantize: bool = False,
+    opset: int = DEFAULT_OPSET
+) -> Dict[str, Any]:
+    """
+    Export a seq2seq model to an ONNX engine artifact
+
+    Args:
+        model: Encoder-decoder model (M2M-100, NLLB, Marian, ...) in float32
+        output_dir: Directory to write the artifact to
+        checkpoint: Name of the source checkpoint, recorded in the manifest
+        tokenizer: Tokenizer to save with the artifact
+        quantize: Apply dynamic int8 quantization
+        opset: ONNX opset version
+
+    Returns:
+        The manifest written to the artifact
+    """
+    config = model.config
+    generation_config = getattr(model, "generation_config", None)
+    num_layers = config.decoder_layers
+    num_heads = config.decoder_attention_heads
+    head_dim = config.d_model // num_heads
+    model = model.float().eval()
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Dummy inputs: a padded row and a non-empty cache so no shape is special-cased
+    batch_size, length, past_length = 2, 8, 3
+    input_ids = torch.randint(4, config.vocab_size, (batch_size, length))
+    attention_mask = torch.ones_like(input_ids)
+    attention_mask[1, -2:] = 0
+    cross_names = []
+    for layer in range(num_layers):
+        cross_names += [f"cross_key.{layer}", f"cross_value.{layer}"]
+
+    with tempfile.TemporaryDirectory() as workdir, torch.no_grad():
+        encoder = _EncoderWrapper(model)
+        _onnx_export(
+            encoder,
+            (input_ids, attention_mask),
+            os.path.join(workdir, ENCODER_FILE),
+            input_names=["input_ids", "attention_mask"],
+            output_names=cross_names,
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "source"},
+                "attention_mask": {0: "batch", 1: "source"},
+                **{name: {0: "batch", 2: "source"} for name in cross_names},
+            },
+            opset_version=opset
+        )
+
+        cross = encoder(input_ids, attention_mask)
+        input_names = ["input_ids", "encoder_attention_mask"]
+        output_names = ["logits"]
+        dynamic_axes = {
+            "input_ids": {0: "batch"},
+            "encoder_attention_mask": {0: "batch", 1: "source"},
+            "logits": {0: "batch"},
+        }
+        past = []
+        for layer in range(num_layers):
+            names = [f"past_key.{layer}", f"past_value.{layer}", f"cross_key.{layer}", f"cross_value.{layer}"]
+            input_names += names
+            output_names += [f"present_key.{layer}", f"present_value.{layer}"]
+            dynamic_axes.update({
+                names[0]: {0: "batch", 2: "past"},
+                names[1]: {0: "batch", 2: "past"},
+                names[2]: {0: "batch", 2: "source"},
+                names[3]: {0: "batch", 2: "source"},
+                f"present_key.{layer}": {0: "batch", 2: "present"},
+                f"present_value.{layer}": {0: "batch", 2: "present"},
+            })
+            past += [
+                torch.zeros(batch_size, num_heads, past_length, head_dim),
+                torch.zeros(batch_size, num_heads, past_length, head_dim),
+                cross[2 * layer],
+                cross[2 * layer + 1],
+            ]
+        _onnx_export(
+            _DecoderStepWrapper(model),
+            (torch.ones(batch_size, 1, dtype=torch.long), attention_mask, *past),
+            os.path.join(workdir, DECODER_FILE),
+            input_names=input_names,
+            output_names=output_names,
+            dynamic_axes=dynamic_axes,
+            opset_version=opset
+        )
+
+        for name in (ENCODER_FILE, DECODER_FILE):
+            exported = os.path.join(workdir, name)
+            if quantize:
+                # Quantize the fused graph so fused MatMuls get int8 weights
+                optimized = os.path.join(workdir, f"optimized-{name}")
+                _optimize(exported, optimized)
+                _quantize(optimized, os.path.join(output_dir, name))
+            else:
+                _optimize(exported, os.path.join(output_dir, name))
+
+    def token_id(name: str) -> Optional[int]:
+        value = getattr(generation_config, name, None) if generation_config is not None else None
+        return value if value is not None else getattr(config, name, None)
+
+    manifest = {
+        "checkpoint": checkpoint,
+        "precision": "int8" if quantize else "float32",
+        "opset": opset,
+        "num_layers": num_layers,
+        "num_heads": num_heads,
+        "head_dim": head_dim,
+        "decoder_start_token_id": token_id("decoder_start_token_id"),
+        "eos_token_id": token_id("eos_token_id"),
+        "pad_token_id": token_id("pad_token_id"),
+    }
+    with open(os.path.join(output_dir, MANIFEST_FILE), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    if tokenizer is not None:
+        tokenizer.save_pretrained(output_dir)
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Export a translation checkpoint for the ONNX engine")
+    parser.add_argument("checkpoint", help="Hugging Face checkpoint, e.g. facebook/nllb-200-distilled-600M")
+    parser.add_argument("output_dir", help="Artifact directory (ONNX_MODEL_DIR)")
+    parser.add_argument("--quantize", action="store_true", help="Dynamic int8 quantization")
+    parser.add_argument("--opset", type=int, default=DEFAULT_OPSET)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+    start = time.time()
+    tokenizer = AutoTokenizer.from_pretrained(args.checkpoint)
+    model = AutoModelForSeq2SeqLM.from_pretrained(args.checkpoint)
+    manifest = export_model(
+        model,
+        args.output_dir,
+        args.checkpoint,
+        tokenizer=tokenizer,
+        quantize=args.quantize,
+        opset=args.opset
+    )
+    logger.info(f"Exported {args.checkpoint} to {args.output_dir} in {time.time() - start:.0f}s")
+    print(json.dumps(manifest), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
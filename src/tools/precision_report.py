@@ -0,0 +1,206 @@
+"""
+Local engine precision report
+
+Loads the local model in each precision mode, translates a fixed corpus and
+reports the resident model memory, throughput and how closely each mode's
+output matches float32 (exact matches and chrF). Exits with status 1 when a
+mode's mean chrF against float32 falls below --min-chrf, so it can gate a
+LOCAL_MODEL_PRECISION change.
+
+Usage:
+    python -m src.tools.precision_report --device cpu \\
+        --precisions float32,bfloat16,int8 -s en -t es
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Fixed regression corpus: short, medium and long sentences
+DEFAULT_CORPUS = [
+    "Hello, how are you?",
+    "Thank you very much for your help.",
+    "Where is the nearest train station?",
+    "The meeting has been moved to Thursday afternoon.",
+    "Please send me the invoice by the end of the week.",
+    "Our servers will be down for maintenance on Sunday night.",
+    "The weather forecast predicts heavy rain in the northern regions tomorrow.",
+    "She has been working at the hospital for more than ten years.",
+    "If you have any questions, do not hesitate to contact our support team.",
+    "The committee approved the new budget after a long discussion about priorities.",
+    "Customers who ordered before noon will receive their packages the next day.",
+    "Researchers found that regular exercise improves both memory and concentration.",
+    "The museum is open every day except Monday, and admission is free for children.",
+    "After the update, the application starts faster and uses less memory than before.",
+    "The city plans to build three new bridges over the river during the next decade, "
+    "which should reduce traffic congestion in the historic center.",
+    "Although the project was delayed by several months, the team delivered every feature "
+    "that had been promised in the original proposal.",
+]
+
+
+def chrf(hypothesis: str, reference: str, max_order: int = 6, beta: float = 2.0) -> float:
+    """
+    Character n-gram F-score (chrF) of a hypothesis against a reference
+
+    Returns:
+        Score between 0 and 100
+    """
+    hypothesis = hypothesis.replace(" ", "")
+    reference = reference.replace(" ", "")
+    if hypothesis == reference:
+        return 100.0
+
+    precisions = []
+    recalls = []
+    for n in range(1, max_order + 1):
+        hyp_ngrams = Counter(hypothesis[i:i + n] for i in range(len(hypothesis) - n + 1))
+        ref_ngrams = Counter(reference[i:i + n] for i in range(len(reference) - n + 1))
+        if not hyp_ngrams or not ref_ngrams:
+            continue
+        matches = sum((hyp_ngrams & ref_ngrams).values())
+        precisions.append(matches / sum(hyp_ngrams.values()))
+        recalls.append(matches / sum(ref_ngrams.values()))
+    if not precisions:
+        return 0.0
+
+    precision = sum(precisions) / len(precisions)
+    recall = sum(recalls) / len(recalls)
+    if precision + recall == 0:
+        return 0.0
+    return 100 * (1 + beta ** 2) * precision * recall / (beta ** 2 * precision + recall)
+
+
+def compare_outputs(reference: List[str], candidate: List[str]) -> Dict[str, float]:
+    """Exact match rate and mean chrF of candidate translations against reference ones"""
+    scores = [chrf(hyp, ref) for hyp, ref in zip(candidate, reference)]
+    exact = sum(hyp == ref for hyp, ref in zip(candidate, reference))
+    return {
+        "exact_match": round(exact / len(reference), 3) if reference else 1.0,
+        "chrf": round(sum(scores) / len(scores), 2) if scores else 100.0,
+        "min_chrf": round(min(scores), 2) if scores else 100.0,
+    }
+
+
+def measure_precision(
+    precision: str,
+    corpus: List[str],
+    source_language: str,
+    target_language: str,
+    repeats: int
+) -> Dict[str, Any]:
+    """Load the local model in one precision mode and time the corpus"""
+    from src.core.config import get_settings
+    from src.integrations.local_translate import LocalTranslateProvider
+
+    settings = get_settings()
+    settings.LOCAL_MODEL_PRECISION = precision
+    provider = LocalTranslateProvider()
+    try:
+        # Untimed pass: kernel selection and allocator warmup
+        translations = asyncio.run(
+            provider.batch_translate(corpus, source_language, target_language)
+        )
+        tokens_before = provider.get_stats()["input_tokens"]
+        start = time.perf_counter()
+        for _ in range(repeats):
+            asyncio.run(provider.batch_translate(corpus, source_language, target_language))
+        elapsed = time.perf_counter() - start
+        tokens = provider.get_stats()["input_tokens"] - tokens_before
+        models = provider.get_stats()["models"]
+        return {
+            "precision": provider.precision,
+            "memory_mb": models["memory_mb"],
+            "load_seconds": models["resident"][provider.model_name]["load_seconds"],
+            "sentences_per_second": round(len(corpus) * repeats / elapsed, 2),
+            "tokens_per_second": round(tokens / elapsed, 2),
+            "translations": translations,
+        }
+    finally:
+        provider.unload_model()
+
+
+def precision_report(
+    precisions: List[str],
+    corpus: List[str],
+    source_language: str,
+    target_language: str,
+    repeats: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Measure every precision mode and score it against float32
+
+    Returns:
+        One result per mode, with a ``quality`` entry for modes other than float32
+    """
+    if "float32" not in precisions:
+        precisions = ["float32"] + precisions
+
+    results = []
+    reference: Optional[List[str]] = None
+    for precision in precisions:
+        logger.info(f"Measuring {precision}")
+        result = measure_precision(precision, corpus, source_language, target_language, repeats)
+        if precision == "float32":
+            reference = result["translations"]
+        else:
+            result["quality"] = compare_outputs(reference, result["translations"])
+        results.append(result)
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Compare local engine precision modes")
+    parser.add_argument("--precisions", default="float32,bfloat16,int8")
+    parser.add_argument("--source-language", "-s", default="en")
+    parser.add_argument("--target-language", "-t", default="es")
+    parser.add_argument("--corpus", default=None, help="JSONL file with a 'text' field per line")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed passes over the corpus")
+    parser.add_argument("--device", default=None, help="Override LOCAL_DEVICE (e.g. cpu)")
+    parser.add_argument("--min-chrf", type=float, default=90.0, help="Fail below this mean chrF vs float32")
+    parser.add_argument("--show-translations", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    from src.core.config import get_settings
+
+    settings = get_settings()
+    settings.LOCAL_MICROBATCH_ENABLED = False
+    if args.device:
+        settings.LOCAL_DEVICE = args.device
+
+    corpus = DEFAULT_CORPUS
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as source:
+            corpus = [json.loads(line)["text"] for line in source if line.strip()]
+
+    results = precision_report(
+        [p.strip() for p in args.precisions.split(",") if p.strip()],
+        corpus,
+        args.source_language,
+        args.target_language,
+        repeats=args.repeats
+    )
+
+    regressed = False
+    for result in results:
+        if not args.show_translations:
+            result.pop("translations")
+        quality = result.get("quality")
+        if quality and quality["chrf"] < args.min_chrf:
+            regressed = True
+            logger.error(
+                f"{result['precision']} chrF {quality['chrf']} vs float32 is below {args.min_chrf}"
+            )
+        print(json.dumps(result, ensure_ascii=False))
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Find the best replicas x threads layout for the local engine on this machine
+
+Loads the configured local model once, then for each layout swaps in a
+ReplicaPool and drives it with concurrent single-sentence clients (through
+the micro-batcher, as the API does). Reports throughput and latency per
+layout, then the layout with the highest throughput; put it in
+INFERENCE_REPLICAS / INFERENCE_REPLICA_THREADS.
+
+Usage:
+    python -m src.tools.replica_sweep --device cpu -s en -t es
+    python -m src.tools.replica_sweep --layouts 1x16,2x8,4x4,8x2 --pin-cores
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.integrations.batching import percentile
+from src.integrations.executor import ReplicaPool, available_cores
+from src.tools.precision_report import DEFAULT_CORPUS
+
+logger = logging.getLogger(__name__)
+
+
+def default_layouts(cores: int) -> List[Tuple[int, int]]:
+    """Replica counts of 1, 2, 4, ... with the cores split evenly between them"""
+    layouts = []
+    replicas = 1
+    while replicas <= cores:
+        layouts.append((replicas, cores // replicas))
+        replicas *= 2
+    return layouts
+
+
+def parse_layouts(spec: str) -> List[Tuple[int, int]]:
+    """Parse comma-separated ``REPLICASxTHREADS`` layouts"""
+    layouts = []
+    for entry in spec.split(","):
+        if entry.strip():
+            replicas, _, threads = entry.strip().lower().partition("x")
+            layouts.append((int(replicas), int(threads)))
+    return layouts
+
+
+async def _drive(
+    provider: Any,
+    corpus: List[str],
+    source_language: str,
+    target_language: str,
+    concurrency: int,
+    requests: int
+) -> Dict[str, Any]:
+    """Send ``requests`` translations from ``concurrency`` concurrent clients"""
+    latencies = []
+    remaining = iter(range(requests))
+
+    async def client():
+        for n in remaining:
+            started = time.perf_counter()
+            await provider.translate(corpus[n % len(corpus)], source_language, target_language)
+            latencies.append(time.perf_counter() - started)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "sentences_per_second": round(requests / elapsed, 2),
+        "latency_p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "latency_p95_ms": round(percentile(latencies, 95) * 1000, 2),
+    }
+
+
+def sweep(
+    layouts: List[Tuple[int, int]],
+    corpus: List[str],
+    source_language: str,
+    target_language: str,
+    concurrency: int,
+    requests: int,
+    pin_cores: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Measure every layout on one loaded model
+
+    Returns:
+        One result per layout, in the order given
+    """
+    from src.integrations.local_translate import LocalTranslateProvider
+
+    provider = LocalTranslateProvider()
+    results = []
+    try:
+        for replicas, threads in layouts:
+            pool = ReplicaPool("sweep", replicas, threads, pin_cores=pin_cores)
+            provider.inference_executor = pool
+            try:
+                # Untimed pass: warms up every replica's thread pool
+                asyncio.run(_drive(
+                    provider, corpus, source_language, target_language, concurrency, replicas * 2
+                ))
+                result = asyncio.run(_drive(
+                    provider, corpus, source_language, target_language, concurrency, requests
+                ))
+            finally:
+                pool.shutdown()
+            result.update({"replicas": replicas, "threads_per_replica": threads})
+            logger.info(f"{replicas}x{threads}: {result['sentences_per_second']} sentences/s")
+            results.append(result)
+    finally:
+        provider.unload_model()
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Sweep replica x thread layouts for the local engine")
+    parser.add_argument("--layouts", default=None, help="e.g. 1x16,2x8,4x4 (default: powers of two over all cores)")
+    parser.add_argument("--source-language", "-s", default="en")
+    parser.add_argument("--target-language", "-t", default="es")
+    parser.add_argument("--corpus", default=None, help="JSONL file with a 'text' field per line")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=256, help="Timed translations per layout")
+    parser.add_argument("--pin-cores", action="store_true", help="Pin each replica to its own cores")
+    parser.add_argument("--device", default=None, help="Override LOCAL_DEVICE (e.g. cpu)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    from src.core.config import get_settings
+
+    settings = get_settings()
+    settings.LOCAL_PAIR_MODELS = ""
+    if args.device:
+        settings.LOCAL_DEVICE = args.device
+
+    corpus = DEFAULT_CORPUS
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as source:
+            corpus = [json.loads(line)["text"] for line in source if line.strip()]
+
+    layouts = parse_layouts(args.layouts) if args.layouts else default_layouts(len(available_cores()))
+    results = sweep(
+        layouts,
+        corpus,
+        args.source_language,
+        args.target_language,
+        args.concurrency,
+        args.requests,
+        pin_cores=args.pin_cores
+    )
+    for result in results:
+        print(json.dumps(result))
+    best = max(results, key=lambda result: result["sentences_per_second"])
+    print(json.dumps({"best": f"{best['replicas']}x{best['threads_per_replica']}", **best}))
+
+
+if __name__ == "__main__":
+    main()
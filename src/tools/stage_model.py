@@ -0,0 +1,91 @@
+"""
+Stage a Hugging Face checkpoint locally for memory-mapped loading
+
+Writes the config, tokenizer and safetensors weights in the serving
+precision's dtype, so the local engine maps the weights instead of
+initializing a model and copying a checkpoint into it. Point
+LOCAL_MODEL_NAME (or a LOCAL_PAIR_MODELS entry) at the output directory.
+
+Usage:
+    python -m src.tools.stage_model facebook/nllb-200-distilled-600M \\
+        models/staged/nllb-200-distilled-600M-bf16 --precision bfloat16
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from src.integrations.precision import load_dtype
+from src.integrations.staged_model import STAGED_MANIFEST_FILE
+
+logger = logging.getLogger(__name__)
+
+
+def stage_model(
+    model: Any,
+    output_dir: str,
+    checkpoint: str,
+    precision: str = "float32",
+    tokenizer: Optional[Any] = None
+) -> Dict[str, Any]:
+    """
+    Write a model as a staged artifact
+
+    Args:
+        model: Seq2seq model to stage
+        output_dir: Directory to write the artifact to
+        checkpoint: Name of the source checkpoint, recorded in the manifest
+        precision: Serving precision mode; int8 stages float32 weights,
+            since quantization happens after loading
+        tokenizer: Tokenizer to save with the artifact
+
+    Returns:
+        The manifest written to the artifact
+    """
+    dtype = load_dtype(precision)
+    os.makedirs(output_dir, exist_ok=True)
+    model.to(dtype).save_pretrained(output_dir, safe_serialization=True)
+    if tokenizer is not None:
+        tokenizer.save_pretrained(output_dir)
+
+    manifest = {
+        "checkpoint": checkpoint,
+        "precision": precision,
+        "dtype": str(dtype).replace("torch.", ""),
+    }
+    with open(os.path.join(output_dir, STAGED_MANIFEST_FILE), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Stage a checkpoint for memory-mapped loading")
+    parser.add_argument("checkpoint", help="Hugging Face checkpoint, e.g. facebook/nllb-200-distilled-600M")
+    parser.add_argument("output_dir", help="Artifact directory (LOCAL_MODEL_NAME)")
+    parser.add_argument(
+        "--precision",
+        default="float32",
+        help="LOCAL_MODEL_PRECISION the artifact will be served in"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+    start = time.time()
+    manifest = stage_model(
+        AutoModelForSeq2SeqLM.from_pretrained(args.checkpoint, torch_dtype=load_dtype(args.precision)),
+        args.output_dir,
+        args.checkpoint,
+        precision=args.precision,
+        tokenizer=AutoTokenizer.from_pretrained(args.checkpoint)
+    )
+    logger.info(f"Staged {args.checkpoint} to {args.output_dir} in {time.time() - start:.0f}s")
+    print(json.dumps(manifest), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
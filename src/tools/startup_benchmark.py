@@ -0,0 +1,91 @@
+"""
+Measure cold start per translation engine
+
+For each engine, starts a fresh interpreter and reports how long it takes to
+import the application, to initialize the engine (model load included) and
+to serve the first translation, plus whether torch was imported before the
+engine was created. Engines that cannot initialize here (e.g. missing API
+credentials) report the error instead.
+
+Usage:
+    python -m src.tools.startup_benchmark --engines local,onnx,google,openai
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+
+def measure_engine(source_language: str, target_language: str) -> Dict[str, Any]:
+    """Measure the configured engine in this (fresh) process"""
+    result: Dict[str, Any] = {}
+    start = time.perf_counter()
+    import src.main  # noqa: F401
+    result["import_seconds"] = round(time.perf_counter() - start, 3)
+    result["torch_imported_at_startup"] = "torch" in sys.modules
+
+    from src.integrations.factory import get_translation_provider
+
+    try:
+        start = time.perf_counter()
+        provider = get_translation_provider()
+        result["load_seconds"] = round(time.perf_counter() - start, 3)
+
+        for attempt in ("first_request_seconds", "second_request_seconds"):
+            start = time.perf_counter()
+            asyncio.run(provider.translate("Hello, how are you today?", source_language, target_language))
+            result[attempt] = round(time.perf_counter() - start, 3)
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+def benchmark_engine(engine: str, source_language: str, target_language: str) -> Dict[str, Any]:
+    """Run measure_engine for one engine in a child interpreter"""
+    env = dict(
+        os.environ,
+        TRANSLATION_ENGINE=engine,
+        # Measure the engine, not the cache
+        CACHE_ENABLED="False"
+    )
+    start = time.perf_counter()
+    child = subprocess.run(
+        [
+            sys.executable, "-m", "src.tools.startup_benchmark", "--child",
+            "-s", source_language, "-t", target_language
+        ],
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    lines = child.stdout.strip().splitlines()
+    result = json.loads(lines[-1]) if child.returncode == 0 and lines else {
+        "error": child.stderr.strip().splitlines()[-1] if child.stderr.strip() else f"exit {child.returncode}"
+    }
+    result["process_seconds"] = round(time.perf_counter() - start, 3)
+    return {"engine": engine, **result}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Measure cold start per translation engine")
+    parser.add_argument("--engines", default="local,onnx,google,openai")
+    parser.add_argument("--source-language", "-s", default="en")
+    parser.add_argument("--target-language", "-t", default="es")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure_engine(args.source_language, args.target_language)))
+        return
+
+    for engine in args.engines.split(","):
+        if engine.strip():
+            print(json.dumps(benchmark_engine(engine.strip(), args.source_language, args.target_language)))
+
+
+if __name__ == "__main__":
+    main()
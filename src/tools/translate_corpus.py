@@ -0,0 +1,173 @@
+"""
+Offline corpus translation
+
+Translates a JSONL corpus (one object with a ``text`` field per line, same
+format as bulk translation jobs) with the local engine, sharding chunks of
+lines across worker processes. Each worker holds one LocalTranslateProvider
+with a fixed torch thread count. Output is written in input order while only
+a bounded number of chunks are in flight.
+
+Usage:
+    python -m src.tools.translate_corpus requests.jsonl translated.jsonl \\
+        --source-language en --target-language es --workers 4
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Provider owned by each worker process
+_provider = None
+
+
+def _init_worker(threads: int, device: Optional[str]):
+    """Load one provider per worker process"""
+    global _provider
+
+    import torch
+    from src.core.config import get_settings
+
+    # The provider's inference threads, started afterwards, inherit this count
+    torch.set_num_threads(threads)
+    settings = get_settings()
+    if device:
+        settings.LOCAL_DEVICE = device
+    # Each worker translates one chunk at a time; coalescing would only add latency
+    settings.LOCAL_MICROBATCH_ENABLED = False
+
+    from src.integrations.local_translate import LocalTranslateProvider
+
+    _provider = LocalTranslateProvider()
+
+
+def _translate_chunk(
+    lines: List[bytes],
+    first_index: int,
+    source_language: str,
+    target_language: str
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """Translate one chunk in a worker; returns records, failures and input tokens"""
+    from src.jobs.corpus import translate_chunk
+
+    tokens_before = _provider.get_stats().get("input_tokens", 0)
+    records, failed = asyncio.run(translate_chunk(
+        _provider,
+        lines,
+        first_index,
+        source_language,
+        target_language
+    ))
+    tokens = _provider.get_stats().get("input_tokens", 0) - tokens_before
+    return records, failed, tokens
+
+
+def translate_corpus(
+    input_path: str,
+    output_path: str,
+    source_language: str,
+    target_language: str,
+    workers: int,
+    threads: int,
+    chunk_size: int,
+    device: Optional[str] = None
+) -> Dict[str, float]:
+    """
+    Translate a JSONL corpus with a pool of local-engine worker processes
+
+    Returns:
+        Throughput summary
+    """
+    context = multiprocessing.get_context("spawn")
+    max_in_flight = workers * 2
+    segments = 0
+    failed = 0
+    tokens = 0
+    start_time = time.time()
+
+    with context.Pool(workers, initializer=_init_worker, initargs=(threads, device)) as pool, \
+            open(input_path, "rb") as source, \
+            open(output_path, "w", encoding="utf-8") as output:
+        in_flight: deque = deque()
+        next_index = 0
+        exhausted = False
+
+        while in_flight or not exhausted:
+            # Keep a bounded window of chunks in flight
+            while not exhausted and len(in_flight) < max_in_flight:
+                lines = list(islice(source, chunk_size))
+                if not lines:
+                    exhausted = True
+                    break
+                in_flight.append(pool.apply_async(
+                    _translate_chunk,
+                    (lines, next_index, source_language, target_language)
+                ))
+                next_index += len(lines)
+
+            if not in_flight:
+                break
+
+            # Results are written strictly in submission order
+            records, chunk_failed, chunk_tokens = in_flight.popleft().get()
+            for record in records:
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            segments += len(records)
+            failed += chunk_failed
+            tokens += chunk_tokens
+
+    elapsed = time.time() - start_time
+    return {
+        "segments": segments,
+        "failed": failed,
+        "tokens": tokens,
+        "elapsed_s": round(elapsed, 2),
+        "segments_per_second": round(segments / elapsed, 2) if elapsed else 0.0,
+        "tokens_per_second": round(tokens / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Translate a JSONL corpus offline with the local engine")
+    parser.add_argument("input", help="Input JSONL file (objects with a 'text' field)")
+    parser.add_argument("output", help="Output JSONL file")
+    parser.add_argument("--source-language", "-s", required=True)
+    parser.add_argument("--target-language", "-t", required=True)
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Worker processes")
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=0,
+        help="Torch intra-op threads per worker (default: CPU count / workers)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=256, help="Lines per work unit")
+    parser.add_argument("--device", default=None, help="Override LOCAL_DEVICE (e.g. cpu)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    threads = args.threads or max(1, (os.cpu_count() or 1) // args.workers)
+    logger.info(f"Translating {args.input} with {args.workers} workers x {threads} threads")
+
+    summary = translate_corpus(
+        args.input,
+        args.output,
+        args.source_language,
+        args.target_language,
+        workers=args.workers,
+        threads=threads,
+        chunk_size=args.chunk_size,
+        device=args.device
+    )
+    print(json.dumps(summary), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
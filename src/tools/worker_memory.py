@@ -0,0 +1,153 @@
+"""
+Measure how server memory scales with the number of gunicorn workers
+
+Reads /proc/<pid>/smaps_rollup (Linux) for a gunicorn master and its
+workers. PSS (proportional set size) splits each shared page between the
+processes mapping it, so the total PSS is the real footprint of the server:
+with the model preloaded in the master it should grow by much less than one
+model per worker.
+
+Usage:
+    # Inspect a running server
+    python -m src.tools.worker_memory --pid <gunicorn master pid>
+
+    # Start gunicorn with 1, 2 and 4 workers and compare
+    python -m src.tools.worker_memory --sweep 1,2,4
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+MEMORY_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+def process_memory(pid: int) -> Dict[str, float]:
+    """Memory of one process in MB, from smaps_rollup"""
+    memory = {}
+    with open(f"/proc/{pid}/smaps_rollup", encoding="utf-8") as rollup:
+        for line in rollup:
+            field, _, value = line.partition(":")
+            if field in MEMORY_FIELDS:
+                memory[field.lower()] = round(int(value.split()[0]) / 1024, 1)
+    return memory
+
+
+def child_pids(pid: int) -> List[int]:
+    """Direct children of a process"""
+    children = []
+    for task in os.listdir(f"/proc/{pid}/task"):
+        with open(f"/proc/{pid}/task/{task}/children", encoding="utf-8") as source:
+            children.extend(int(child) for child in source.read().split())
+    return sorted(children)
+
+
+def server_memory(master_pid: int) -> Dict[str, Any]:
+    """Memory of a gunicorn master and its workers"""
+    workers = [process_memory(pid) for pid in child_pids(master_pid)]
+    master = process_memory(master_pid)
+    processes = [master] + workers
+    return {
+        "workers": len(workers),
+        "master": master,
+        "worker_pss_mb": [worker.get("pss", 0.0) for worker in workers],
+        "total_rss_mb": round(sum(p.get("rss", 0.0) for p in processes), 1),
+        "total_pss_mb": round(sum(p.get("pss", 0.0) for p in processes), 1),
+        "private_mb": round(
+            sum(p.get("private_clean", 0.0) + p.get("private_dirty", 0.0) for p in processes), 1
+        ),
+    }
+
+
+def _wait_ready(url: str, timeout: float, successes: int) -> bool:
+    """Wait for ``successes`` consecutive 200 responses"""
+    deadline = time.monotonic() + timeout
+    streak = 0
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                streak = streak + 1 if response.status == 200 else 0
+        except Exception:
+            streak = 0
+        if streak >= successes:
+            return True
+        time.sleep(0.2 if streak else 1)
+    return False
+
+
+def measure_workers(workers: int, port: int, preload: bool, timeout: float) -> Dict[str, Any]:
+    """Start gunicorn with the given worker count, measure it once all workers are ready"""
+    env = dict(
+        os.environ,
+        SERVER_WORKERS=str(workers),
+        SERVER_BIND=f"127.0.0.1:{port}",
+        SERVER_PRELOAD_MODEL=str(preload)
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "src.main:app"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        # /ready is answered by whichever worker accepts the connection, so
+        # a run of ready answers is taken to mean every worker is ready
+        ready = _wait_ready(f"http://127.0.0.1:{port}/ready", timeout, successes=workers * 4)
+        result = server_memory(server.pid)
+        result.update({"requested_workers": workers, "preload": preload, "ready": ready})
+        return result
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def sweep(worker_counts: List[int], port: int, preload: bool, timeout: float) -> List[Dict[str, Any]]:
+    """
+    Measure total PSS at each worker count
+
+    Each result carries ``marginal_mb_per_worker``: the growth in total PSS
+    per added worker relative to the first count. Compare it with the
+    single-worker footprint - sub-linear growth means the weights are shared.
+    """
+    results = []
+    for workers in worker_counts:
+        result = measure_workers(workers, port, preload, timeout)
+        if results:
+            first = results[0]
+            added = workers - first["requested_workers"]
+            if added > 0:
+                result["marginal_mb_per_worker"] = round(
+                    (result["total_pss_mb"] - first["total_pss_mb"]) / added, 1
+                )
+        results.append(result)
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Measure gunicorn memory per worker count")
+    parser.add_argument("--pid", type=int, default=None, help="Running gunicorn master to inspect")
+    parser.add_argument("--sweep", default="1,2,4", help="Worker counts to start and measure")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--no-preload", action="store_true", help="Load the model in every worker instead")
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds to wait for /ready")
+    args = parser.parse_args(argv)
+
+    if args.pid is not None:
+        print(json.dumps(server_memory(args.pid)))
+        return
+
+    worker_counts = [int(count) for count in args.sweep.split(",") if count.strip()]
+    for result in sweep(worker_counts, args.port, not args.no_preload, args.timeout):
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, HTTPException, status
+from typing import AsyncIterator
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from src.translation.service import TranslationService
 from src.translation.schemas import (
     TranslateRequest,
@@ -6,14 +9,17 @@ from src.translation.schemas import (
     BatchTranslateRequest,
     BatchTranslateResponse,
     SupportedLanguagesResponse,
-    EngineHealthResponse
+    EngineHealthResponse,
+    EngineStatsResponse,
+    StreamError
 )
 from src.core.exceptions import TranslationException
+from src.core.timing import TimedRoute
 import logging
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/translate", tags=["translation"])
+router = APIRouter(prefix="/api/translate", tags=["translation"], route_class=TimedRoute)
 
 
 @router.post("/", response_model=TranslateResponse)
@@ -41,6 +47,40 @@ async def translate(request: TranslateRequest):
         )
 
 
+@router.post("/stream")
+async def translate_stream(request: TranslateRequest, http_request: Request):
+    """
+    Translate text, streaming the translation as it is generated (SSE)
+    
+    Emits `token` events carrying text deltas, then a `done` event with the
+    full translation, time-to-first-token and tokens/sec. Engines that cannot
+    stream tokens send the whole translation as a single delta.
+    
+    **Parameters:**
+    - **text**: Text to translate (max 5000 characters)
+    - **source_language**: Source language code (e.g., 'en', 'es', 'fr')
+    - **target_language**: Target language code (e.g., 'es', 'en', 'fr')
+    """
+    try:
+        events = await TranslationService.translate_stream(request)
+    except TranslationException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.message
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+    
+    return StreamingResponse(
+        _stream_events(events, http_request, sse=True),
+        media_type="text/event-stream"
+    )
+
+
 @router.post("/batch", response_model=BatchTranslateResponse)
 async def batch_translate(request: BatchTranslateRequest):
     """
@@ -66,6 +106,72 @@ async def batch_translate(request: BatchTranslateRequest):
         )
 
 
+@router.post("/batch/stream")
+async def batch_translate_stream(request: BatchTranslateRequest, http_request: Request):
+    """
+    Batch translate multiple texts, streaming each result as it completes
+    
+    Emits newline-delimited JSON by default, or Server-Sent Events when the
+    client sends `Accept: text/event-stream`. Results arrive out of order;
+    each carries its `index` in `texts`. The stream ends with a `done`
+    event, or an `error` event if translation fails part-way. Closing the
+    connection cancels the remaining work.
+    
+    **Parameters:**
+    - **texts**: List of texts to translate (1-100 items)
+    - **source_language**: Source language code
+    - **target_language**: Target language code
+    """
+    try:
+        events = await TranslationService.batch_translate_stream(request)
+    except TranslationException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.message
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+    
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+    return StreamingResponse(
+        _stream_events(events, http_request, sse),
+        media_type="text/event-stream" if sse else "application/x-ndjson"
+    )
+
+
+async def _stream_events(
+    events: AsyncIterator[BaseModel],
+    http_request: Request,
+    sse: bool
+) -> AsyncIterator[str]:
+    """Serialize stream events, stopping when the client goes away"""
+    try:
+        async for event in events:
+            if await http_request.is_disconnected():
+                logger.info("Client disconnected, cancelling stream")
+                break
+            yield _format_event(event, sse)
+    except TranslationException as e:
+        yield _format_event(StreamError(error=e.__class__.__name__, message=e.message), sse)
+    except Exception as e:
+        logger.error(f"Streaming error: {str(e)}")
+        yield _format_event(StreamError(error="InternalError", message="Internal server error"), sse)
+    finally:
+        await events.aclose()
+
+
+def _format_event(event: BaseModel, sse: bool) -> str:
+    """Format an event as an NDJSON line or an SSE message"""
+    data = event.model_dump_json()
+    if sse:
+        return f"event: {event.type}\ndata: {data}\n\n"
+    return data + "\n"
+
+
 @router.get("/languages", response_model=SupportedLanguagesResponse)
 async def get_supported_languages():
     """Get list of supported languages"""
@@ -84,6 +190,24 @@ async def get_supported_languages():
         )
 
 
+@router.get("/stats", response_model=EngineStatsResponse)
+async def get_stats():
+    """Get translation engine runtime statistics (batching, latency)"""
+    try:
+        result = await TranslationService.get_stats()
+        return EngineStatsResponse(
+            engine=result["engine"],
+            stats=result["stats"],
+            timestamp=result["timestamp"]
+        )
+    except Exception as e:
+        logger.error(f"Error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
 @router.get("/health", response_model=EngineHealthResponse)
 async def health_check():
     """Check translation engine health"""
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
 
 
@@ -27,17 +27,65 @@ class TranslateResponse(BaseModel):
     timestamp: datetime
 
 
+class BatchItemError(BaseModel):
+    """Text of a batch that could not be translated"""
+    index: int
+    error: str
+
+
 class BatchTranslateResponse(BaseModel):
     """Batch translation response"""
     original_texts: List[str]
-    translated_texts: List[str]
+    translated_texts: List[Optional[str]]  # None where the text failed, see errors
     source_language: str
     target_language: str
     engine: str
     count: int
+    errors: List[BatchItemError] = []
     timestamp: datetime
 
 
+class TranslateStreamDelta(BaseModel):
+    """Incremental text emitted by a streaming translation"""
+    type: Literal["token"] = "token"
+    text: str
+
+
+class TranslateStreamSummary(BaseModel):
+    """Final event of a streaming translation"""
+    type: Literal["done"] = "done"
+    translated_text: str
+    engine: str
+    time_to_first_token_ms: Optional[float]
+    tokens: int
+    tokens_per_second: Optional[float]
+    duration_ms: float
+
+
+class BatchStreamItem(BaseModel):
+    """Single translation emitted by a streaming batch"""
+    type: Literal["translation"] = "translation"
+    index: int
+    original_text: str
+    translated_text: str
+    elapsed_ms: float
+
+
+class BatchStreamSummary(BaseModel):
+    """Final event of a streaming batch"""
+    type: Literal["done"] = "done"
+    count: int
+    engine: str
+    duration_ms: float
+
+
+class StreamError(BaseModel):
+    """Error event terminating a stream"""
+    type: Literal["error"] = "error"
+    error: str
+    message: str
+
+
 class LanguageInfo(BaseModel):
     """Language information"""
     code: str
@@ -67,6 +115,13 @@ class EngineHealthResponse(BaseModel):
     response_time_ms: float
 
 
+class EngineStatsResponse(BaseModel):
+    """Engine runtime statistics response"""
+    engine: str
+    stats: Dict[str, Any]
+    timestamp: datetime
+
+
 class EngineConfigResponse(BaseModel):
     """Current engine configuration"""
     current_engine: str
@@ -1,22 +1,57 @@
 import logging
 import time
-from typing import List
+from typing import Any, List, Dict, AsyncIterator, Union
 from datetime import datetime
 
 from src.integrations.factory import get_translation_provider
+from src.translation.singleflight import SingleFlight
 from src.translation.schemas import (
     TranslateRequest, 
     TranslateResponse,
     BatchTranslateRequest,
-    BatchTranslateResponse
+    BatchTranslateResponse,
+    BatchItemError,
+    BatchStreamItem,
+    BatchStreamSummary,
+    TranslateStreamDelta,
+    TranslateStreamSummary
 )
 from src.core.exceptions import (
     InvalidLanguageException,
+    PartialBatchTranslationException,
+    RateLimitException,
     TranslationEngineException
 )
+from src.core.metrics import TRANSLATED_CHARACTERS, TRANSLATED_TEXTS, TRANSLATION_DURATION
 
 logger = logging.getLogger(__name__)
 
+# Concurrent identical translations share one provider call
+_singleflight = SingleFlight()
+
+
+class _FailedItem:
+    """Placeholder result for a batch text the provider could not translate"""
+    
+    def __init__(self, error: str):
+        self.error = error
+
+
+def _record_translation(
+    operation: str,
+    provider,
+    source_language: str,
+    target_language: str,
+    texts: List[str],
+    duration: float
+):
+    """Record latency and throughput of a completed translation"""
+    engine = provider.engine_name
+    pair = f"{source_language}-{target_language}"
+    TRANSLATION_DURATION.labels(operation, engine, pair).observe(duration)
+    TRANSLATED_TEXTS.labels(engine, pair).inc(len(texts))
+    TRANSLATED_CHARACTERS.labels(engine, pair).inc(sum(len(text) for text in texts))
+
 
 class TranslationService:
     """Translation service"""
@@ -28,12 +63,31 @@ class TranslationService:
             provider = get_translation_provider()
             
             start_time = time.time()
-            translated_text = await provider.translate(
-                request.text,
-                request.source_language,
-                request.target_language
+            translated_text = await _singleflight.run(
+                (
+                    provider.cache_identity(),
+                    request.source_language,
+                    request.target_language,
+                    request.text
+                ),
+                lambda: provider.translate(
+                    request.text,
+                    request.source_language,
+                    request.target_language
+                )
             )
+            if isinstance(translated_text, _FailedItem):
+                # Joined a concurrent batch that could not translate this text
+                raise TranslationEngineException(translated_text.error, provider.engine_name)
             duration = time.time() - start_time
+            _record_translation(
+                "translate",
+                provider,
+                request.source_language,
+                request.target_language,
+                [request.text],
+                duration
+            )
             
             logger.info(
                 f"Translation completed in {duration:.2f}s - "
@@ -45,10 +99,10 @@ class TranslationService:
                 translated_text=translated_text,
                 source_language=request.source_language,
                 target_language=request.target_language,
-                engine=provider.__class__.__name__,
+                engine=provider.engine_name,
                 timestamp=datetime.utcnow()
             )
-        except InvalidLanguageException:
+        except (InvalidLanguageException, RateLimitException):
             raise
         except TranslationEngineException:
             raise
@@ -63,16 +117,55 @@ class TranslationService:
             provider = get_translation_provider()
             
             start_time = time.time()
-            translated_texts = await provider.batch_translate(
-                request.texts,
-                request.source_language,
-                request.target_language
+            # Translate each unique text once and fan results back out
+            unique_texts = list(dict.fromkeys(request.texts))
+            identity = provider.cache_identity()
+            
+            async def translate_unique(positions: List[int]) -> List[Any]:
+                try:
+                    return await provider.batch_translate(
+                        [unique_texts[i] for i in positions],
+                        request.source_language,
+                        request.target_language
+                    )
+                except PartialBatchTranslationException as e:
+                    # Shared with concurrent callers, so failures travel as values
+                    return [
+                        _FailedItem(e.errors[i]) if i in e.errors else result
+                        for i, result in enumerate(e.results)
+                    ]
+            
+            unique_results = await _singleflight.run_many(
+                [
+                    (identity, request.source_language, request.target_language, text)
+                    for text in unique_texts
+                ],
+                translate_unique
             )
+            translations = dict(zip(unique_texts, unique_results))
+            translated_texts = []
+            errors = []
+            for index, text in enumerate(request.texts):
+                result = translations[text]
+                if isinstance(result, _FailedItem):
+                    translated_texts.append(None)
+                    errors.append(BatchItemError(index=index, error=result.error))
+                else:
+                    translated_texts.append(result)
             duration = time.time() - start_time
+            _record_translation(
+                "batch",
+                provider,
+                request.source_language,
+                request.target_language,
+                request.texts,
+                duration
+            )
             
             logger.info(
                 f"Batch translation completed in {duration:.2f}s - "
-                f"{len(request.texts)} texts translated"
+                f"{len(request.texts)} texts translated "
+                f"({len(unique_texts)} unique, {len(errors)} failed)"
             )
             
             return BatchTranslateResponse(
@@ -80,11 +173,12 @@ class TranslationService:
                 translated_texts=translated_texts,
                 source_language=request.source_language,
                 target_language=request.target_language,
-                engine=provider.__class__.__name__,
+                engine=provider.engine_name,
                 count=len(request.texts),
+                errors=errors,
                 timestamp=datetime.utcnow()
             )
-        except InvalidLanguageException:
+        except (InvalidLanguageException, RateLimitException):
             raise
         except TranslationEngineException:
             raise
@@ -92,6 +186,159 @@ class TranslationService:
             logger.error(f"Batch translation error: {str(e)}")
             raise TranslationEngineException(str(e))
     
+    @staticmethod
+    async def translate_stream(
+        request: TranslateRequest
+    ) -> AsyncIterator[Union[TranslateStreamDelta, TranslateStreamSummary]]:
+        """
+        Validate a request and start streaming its translation
+        
+        Returns:
+            Async iterator of text deltas, ending with a summary carrying
+            time-to-first-token and tokens/sec
+        """
+        provider = get_translation_provider()
+        if not provider.validate_language_pair(
+            request.source_language,
+            request.target_language
+        ):
+            raise InvalidLanguageException(
+                f"Language pair {request.source_language}->"
+                f"{request.target_language} not supported"
+            )
+        
+        return TranslationService._stream_translation_events(provider, request)
+    
+    @staticmethod
+    async def _stream_translation_events(
+        provider,
+        request: TranslateRequest
+    ) -> AsyncIterator[Union[TranslateStreamDelta, TranslateStreamSummary]]:
+        """Forward text deltas and summarize the stream"""
+        start_time = time.time()
+        first_token_time = None
+        parts = []
+        tokens = 0
+        
+        stream = provider.translate_stream(
+            request.text,
+            request.source_language,
+            request.target_language
+        )
+        try:
+            async for delta, delta_tokens in stream:
+                if first_token_time is None and delta.strip():
+                    first_token_time = time.time()
+                parts.append(delta)
+                tokens += delta_tokens
+                yield TranslateStreamDelta(text=delta)
+        finally:
+            await stream.aclose()
+        
+        duration = time.time() - start_time
+        generation_time = time.time() - (first_token_time or start_time)
+        _record_translation(
+            "stream",
+            provider,
+            request.source_language,
+            request.target_language,
+            [request.text],
+            duration
+        )
+        logger.info(
+            f"Streaming translation completed in {duration:.2f}s - "
+            f"{request.source_language}->{request.target_language}"
+        )
+        yield TranslateStreamSummary(
+            translated_text="".join(parts),
+            engine=provider.engine_name,
+            time_to_first_token_ms=(
+                round((first_token_time - start_time) * 1000, 2)
+                if first_token_time is not None else None
+            ),
+            tokens=tokens,
+            tokens_per_second=(
+                round(tokens / generation_time, 2)
+                if tokens and generation_time > 0 else None
+            ),
+            duration_ms=round(duration * 1000, 2)
+        )
+    
+    @staticmethod
+    async def batch_translate_stream(
+        request: BatchTranslateRequest
+    ) -> AsyncIterator[Union[BatchStreamItem, BatchStreamSummary]]:
+        """
+        Validate a batch and start streaming its translations
+        
+        Validation happens before the first event so that errors can still be
+        returned as a regular HTTP error response.
+        
+        Returns:
+            Async iterator of translation events, ending with a summary
+        """
+        provider = get_translation_provider()
+        if not provider.validate_language_pair(
+            request.source_language,
+            request.target_language
+        ):
+            raise InvalidLanguageException(
+                f"Language pair {request.source_language}->"
+                f"{request.target_language} not supported"
+            )
+        
+        return TranslationService._stream_batch_events(provider, request)
+    
+    @staticmethod
+    async def _stream_batch_events(
+        provider,
+        request: BatchTranslateRequest
+    ) -> AsyncIterator[Union[BatchStreamItem, BatchStreamSummary]]:
+        """Translate unique texts and emit an event per original index"""
+        start_time = time.time()
+        unique_texts = list(dict.fromkeys(request.texts))
+        positions: Dict[str, List[int]] = {}
+        for index, text in enumerate(request.texts):
+            positions.setdefault(text, []).append(index)
+        
+        stream = provider.batch_translate_stream(
+            unique_texts,
+            request.source_language,
+            request.target_language
+        )
+        try:
+            async for unique_index, translated_text in stream:
+                text = unique_texts[unique_index]
+                elapsed_ms = round((time.time() - start_time) * 1000, 2)
+                for index in positions[text]:
+                    yield BatchStreamItem(
+                        index=index,
+                        original_text=text,
+                        translated_text=translated_text,
+                        elapsed_ms=elapsed_ms
+                    )
+        finally:
+            await stream.aclose()
+        
+        duration = time.time() - start_time
+        _record_translation(
+            "batch_stream",
+            provider,
+            request.source_language,
+            request.target_language,
+            request.texts,
+            duration
+        )
+        logger.info(
+            f"Streaming batch translation completed in {duration:.2f}s - "
+            f"{len(request.texts)} texts translated"
+        )
+        yield BatchStreamSummary(
+            count=len(request.texts),
+            engine=provider.engine_name,
+            duration_ms=round(duration * 1000, 2)
+        )
+    
     @staticmethod
     async def get_supported_languages():
         """Get supported languages"""
@@ -101,13 +348,31 @@ class TranslationService:
             
             return {
                 "languages": languages,
-                "engine": provider.__class__.__name__,
+                "engine": provider.engine_name,
                 "total": len(languages)
             }
         except Exception as e:
             logger.error(f"Error getting supported languages: {str(e)}")
             raise TranslationEngineException(str(e))
     
+    @staticmethod
+    async def get_stats():
+        """Get translation engine runtime statistics"""
+        try:
+            provider = get_translation_provider()
+            
+            stats = dict(provider.get_stats())
+            stats["singleflight"] = _singleflight.stats()
+            
+            return {
+                "engine": provider.engine_name,
+                "stats": stats,
+                "timestamp": datetime.utcnow()
+            }
+        except Exception as e:
+            logger.error(f"Error getting engine stats: {str(e)}")
+            raise TranslationEngineException(str(e))
+    
     @staticmethod
     async def health_check():
         """Health check translation engine"""
@@ -120,7 +385,7 @@ class TranslationService:
             
             return {
                 "healthy": is_healthy,
-                "engine": provider.__class__.__name__,
+                "engine": provider.engine_name,
                 "timestamp": datetime.utcnow(),
                 "response_time_ms": round(response_time, 2)
             }
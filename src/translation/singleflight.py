@@ -0,0 +1,133 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List
+
+logger = logging.getLogger(__name__)
+
+
+class _LeaderCancelled(Exception):
+    """The call a follower was waiting on was cancelled by its owner"""
+
+
+class SingleFlight:
+    """
+    Process-wide table of in-flight calls
+
+    Concurrent callers asking for the same key share one underlying call: the
+    first caller (leader) runs it, later callers (followers) await its result.
+    Entries are removed as soon as the call finishes, so this deduplicates
+    work in flight without caching results.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn for key, or wait on the identical call already in flight
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function producing the result
+
+        Returns:
+            Result of the shared call
+        """
+        async def run_one(positions: List[int]) -> List[Any]:
+            return [await fn()]
+
+        return (await self.run_many([key], run_one))[0]
+
+    async def run_many(
+        self,
+        keys: List[Hashable],
+        fn: Callable[[List[int]], Awaitable[List[Any]]]
+    ) -> List[Any]:
+        """
+        Resolve several keys, running a single call for those not in flight
+
+        Args:
+            keys: Unique call identities
+            fn: Coroutine function receiving the positions (into keys) this
+                caller must compute, returning their results in that order
+
+        Returns:
+            Results for every key, in order
+        """
+        loop = asyncio.get_running_loop()
+        waiting: Dict[int, asyncio.Future] = {}
+        owned: Dict[int, asyncio.Future] = {}
+        for position, key in enumerate(keys):
+            existing = self._inflight.get(key)
+            if existing is not None and not existing.done():
+                waiting[position] = existing
+            else:
+                future = loop.create_future()
+                future.add_done_callback(_consume_exception)
+                self._inflight[key] = future
+                owned[position] = future
+        self.leaders += len(owned)
+        self.followers += len(waiting)
+
+        results: List[Any] = [None] * len(keys)
+        try:
+            if owned:
+                positions = list(owned)
+                computed = await fn(positions)
+                if len(computed) != len(positions):
+                    raise RuntimeError(
+                        f"Expected {len(positions)} results, got {len(computed)}"
+                    )
+                for position, value in zip(positions, computed):
+                    owned[position].set_result(value)
+                    results[position] = value
+        except asyncio.CancelledError:
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(_LeaderCancelled())
+            raise
+        except Exception as e:
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(e)
+            raise
+        finally:
+            for position, future in owned.items():
+                if self._inflight.get(keys[position]) is future:
+                    del self._inflight[keys[position]]
+
+        retry = []
+        for position, future in waiting.items():
+            try:
+                results[position] = await asyncio.shield(future)
+            except _LeaderCancelled:
+                retry.append(position)
+
+        if retry:
+            # The leader went away; compute those keys ourselves
+            async def run_retry(positions: List[int]) -> List[Any]:
+                return await fn([retry[p] for p in positions])
+
+            for position, value in zip(
+                retry,
+                await self.run_many([keys[p] for p in retry], run_retry)
+            ):
+                results[position] = value
+
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """Get leader / follower counters and current table size"""
+        return {
+            "inflight": len(self._inflight),
+            "leaders": self.leaders,
+            "followers": self.followers,
+        }
+
+
+def _consume_exception(future: asyncio.Future):
+    """Mark a shared future's exception as retrieved when nobody waits on it"""
+    if not future.cancelled():
+        future.exception()
@@ -1,7 +1,41 @@
 import pytest
+from typing import List, Dict
 from fastapi.testclient import TestClient
 from src.main import app
 from src.core.config import get_settings
+from src.integrations.base import TranslationProvider
+from src.translation import service
+from src.translation.singleflight import SingleFlight
+
+
+class FakeTranslationProvider(TranslationProvider):
+    """In-memory provider that records every call it receives"""
+    
+    def __init__(self):
+        self.translate_calls: List[str] = []
+        self.batch_calls: List[List[str]] = []
+    
+    async def translate(self, text: str, source_language: str, target_language: str) -> str:
+        self.translate_calls.append(text)
+        return f"[{target_language}] {text}"
+    
+    async def batch_translate(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[str]:
+        self.batch_calls.append(list(texts))
+        return [f"[{target_language}] {text}" for text in texts]
+    
+    async def get_supported_languages(self) -> Dict[str, str]:
+        return {"en": "English", "es": "Spanish", "fr": "French"}
+    
+    def validate_language_pair(self, source_language: str, target_language: str) -> bool:
+        return source_language != target_language
+    
+    async def health_check(self) -> bool:
+        return True
 
 
 @pytest.fixture(scope="session")
@@ -16,6 +50,22 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture
+def fake_provider():
+    """Fake translation provider"""
+    return FakeTranslationProvider()
+
+
+@pytest.fixture
+def use_provider(monkeypatch):
+    """Route the translation service to a given provider"""
+    def use(provider):
+        monkeypatch.setattr(service, "get_translation_provider", lambda: provider)
+        monkeypatch.setattr(service, "_singleflight", SingleFlight())
+        return provider
+    return use
+
+
 @pytest.fixture
 def test_data():
     """Test data fixtures"""
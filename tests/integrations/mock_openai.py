@@ -0,0 +1,130 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+
+class MockOpenAIServer:
+    """
+    Local OpenAI-compatible chat completions server
+
+    Echoes the text after "Text: " in the last user message as
+    ``"<translated> text"``, or translates every string of a packed JSON array
+    prompt the same way. Answers 400 for texts containing "FAIL", drops the
+    last translation of packs larger than ``max_pack_size``, and records the
+    peak number of requests it served concurrently. The first
+    ``rate_limited`` requests are answered with 429 and ``retry_after``.
+    Successful responses carry ``headers`` (e.g. ``x-ratelimit-*``).
+    Connections are kept alive, and ``client_ports`` records the client
+    connections that were used.
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        max_pack_size: int = 0,
+        rate_limited: int = 0,
+        retry_after: str = "0",
+        headers: dict = None
+    ):
+        self.delay = delay
+        self.max_pack_size = max_pack_size
+        self.rate_limited = rate_limited
+        self.retry_after = retry_after
+        self.headers = headers or {}
+        self.client_ports = set()
+        self.requests: List[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/v1"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reply(self, body: dict):
+        """Build the assistant message for a request body"""
+        content = body["messages"][-1]["content"]
+        if content.startswith("["):
+            texts = json.loads(content)
+            if any("FAIL" in text for text in texts):
+                return None
+            translations = [f"<translated> {text}" for text in texts]
+            if self.max_pack_size and len(texts) > self.max_pack_size:
+                translations = translations[:-1]
+            return json.dumps(translations)
+
+        text = content.split("Text: ", 1)[-1]
+        if "FAIL" in text:
+            return None
+        return f"<translated> {text}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with server._lock:
+                    server.requests.append(body)
+                    server.client_ports.add(self.client_address[1])
+                    if len(server.requests) <= server.rate_limited:
+                        self._send(
+                            429,
+                            {"error": {"message": "slow down", "type": "rate_limit_exceeded"}},
+                            {"Retry-After": server.retry_after}
+                        )
+                        return
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.delay)
+                    content = server.reply(body)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+                if content is None:
+                    self._send(400, {"error": {"message": "bad input", "type": "invalid_request_error"}})
+                    return
+                self._send(200, {
+                    "id": "chatcmpl-mock",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body["model"],
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                }, server.headers)
+
+            def _send(self, status: int, payload: dict, headers: dict = None):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+from src.integrations.batching import MicroBatcher, pack_by_budget, percentile, plan_token_batches
+
+
+class RecordingBatchFunction:
+    """Batch function that records every batch it receives"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, texts, source_language, target_language):
+        self.calls.append((list(texts), source_language, target_language))
+        return [f"{target_language}:{text}" for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_coalesced():
+    """Concurrent requests for one language pair share a single batch"""
+    batch_fn = RecordingBatchFunction()
+    batcher = MicroBatcher(batch_fn, max_batch_size=16, max_wait_ms=20)
+
+    results = await asyncio.gather(*[
+        batcher.submit(f"text {i}", "en", "es") for i in range(5)
+    ])
+
+    assert results == [f"es:text {i}" for i in range(5)]
+    assert len(batch_fn.calls) == 1
+    assert batcher.stats.snapshot()["avg_batch_size"] == 5
+
+
+@pytest.mark.asyncio
+async def test_batches_split_by_size_and_language_pair():
+    """Full batches flush immediately and pairs are never mixed"""
+    batch_fn = RecordingBatchFunction()
+    batcher = MicroBatcher(batch_fn, max_batch_size=2, max_wait_ms=20)
+
+    results = await asyncio.gather(
+        batcher.submit("a", "en", "es"),
+        batcher.submit("b", "en", "fr"),
+        batcher.submit("c", "en", "es"),
+        batcher.submit("d", "en", "es"),
+    )
+
+    assert results == ["es:a", "fr:b", "es:c", "es:d"]
+    assert sorted(len(texts) for texts, _, _ in batch_fn.calls) == [1, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_propagates_to_every_caller():
+    """A failed batch rejects every future waiting on it"""
+    async def failing(texts, source_language, target_language):
+        raise RuntimeError("boom")
+
+    batcher = MicroBatcher(failing, max_batch_size=4, max_wait_ms=1)
+    results = await asyncio.gather(
+        batcher.submit("a", "en", "es"),
+        batcher.submit("b", "en", "es"),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_running_batches_are_held_until_done():
+    """The batcher keeps a reference to each batch task while it runs"""
+    held = []
+
+    async def batch_fn(texts, source_language, target_language):
+        held.append(len(batcher._tasks))
+        return texts
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=2, max_wait_ms=1)
+    assert await asyncio.gather(batcher.submit("a", "en", "es"), batcher.submit("b", "en", "es")) == ["a", "b"]
+    await asyncio.sleep(0)
+
+    assert held == [1]
+    assert not batcher._tasks
+
+
+def test_percentile():
+    """Nearest-rank percentile"""
+    assert percentile([], 50) == 0.0
+    assert percentile(range(1, 101), 50) in (50, 51)
+    assert percentile(range(1, 101), 99) == 99
+
+
+def test_plan_token_batches_respects_budget():
+    """Batches are length-sorted and stay within the padded-token budget"""
+    lengths = [3, 50, 4, 2, 48, 5]
+    batches = plan_token_batches(lengths, max_batch_tokens=100)
+
+    assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+    for batch in batches:
+        assert len(batch) * max(lengths[i] for i in batch) <= 100
+    assert batches[0] == [1, 4]
+
+
+def test_plan_token_batches_oversized_input_gets_own_batch():
+    """An input longer than the budget is batched alone"""
+    assert plan_token_batches([500, 10, 10], max_batch_tokens=100) == [[0], [1, 2]]
+
+
+def test_plan_token_batches_caps_rows():
+    """Short inputs fill batches up to the row cap, not the whole token budget"""
+    batches = plan_token_batches([2] * 10, max_batch_tokens=4096, max_batch_size=4)
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+
+
+def test_pack_by_budget_keeps_order_under_limits():
+    """Packs are consecutive and respect both the item and size limits"""
+    assert pack_by_budget([1, 1, 1, 1, 1], max_items=2, max_size=0) == [[0, 1], [2, 3], [4]]
+    assert pack_by_budget([5, 5, 20, 1, 1], max_items=0, max_size=10) == [[0, 1], [2], [3, 4]]
+    assert pack_by_budget([], max_items=2, max_size=10) == []
@@ -0,0 +1,100 @@
+import pytest
+import fakeredis
+from src.core.exceptions import PartialBatchTranslationException
+from src.integrations.cache import CachedTranslationProvider, LRUCache, make_cache_key
+
+
+@pytest.fixture
+def redis_client():
+    """Fake async Redis client"""
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.mark.asyncio
+async def test_translate_hits_memory_then_redis(fake_provider, redis_client):
+    """Repeated texts are served from the memory tier, then from Redis"""
+    cache = CachedTranslationProvider(fake_provider, redis_client=redis_client)
+
+    assert await cache.translate("Hello", "en", "es") == "[es] Hello"
+    assert await cache.translate(" Hello ", "en", "es") == "[es] Hello"
+    assert fake_provider.translate_calls == ["Hello"]
+
+    cache.memory.clear()
+    assert await cache.translate("Hello", "en", "es") == "[es] Hello"
+    assert fake_provider.translate_calls == ["Hello"]
+
+    stats = cache.get_stats()["cache"]
+    assert (stats["memory_hits"], stats["redis_hits"], stats["misses"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_batch_only_translates_misses(fake_provider, redis_client):
+    """Batches send only uncached texts to the provider, in order"""
+    cache = CachedTranslationProvider(fake_provider, redis_client=redis_client)
+    await cache.batch_translate(["a", "b"], "en", "fr")
+    cache.memory.clear()
+
+    results = await cache.batch_translate(["a", "c", "b", "d"], "en", "fr")
+
+    assert results == ["[fr] a", "[fr] c", "[fr] b", "[fr] d"]
+    assert fake_provider.batch_calls == [["a", "b"], ["c", "d"]]
+    assert await redis_client.ttl(make_cache_key(
+        fake_provider.cache_identity(), "en", "fr", "c"
+    )) > 0
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_falls_back_to_provider(fake_provider):
+    """A broken Redis connection never fails translation"""
+    class BrokenRedis:
+        async def mget(self, keys):
+            raise ConnectionError("down")
+
+    cache = CachedTranslationProvider(fake_provider, redis_client=BrokenRedis())
+
+    assert await cache.batch_translate(["x"], "en", "es") == ["[es] x"]
+    assert cache.get_stats()["cache"]["redis_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_caches_partial_successes(fake_provider, redis_client):
+    """Texts that succeeded in a partially failed batch are still cached"""
+    async def batch_translate(texts, source_language, target_language):
+        fake_provider.batch_calls.append(list(texts))
+        results = [None if text == "bad" else f"[{target_language}] {text}" for text in texts]
+        raise PartialBatchTranslationException(
+            results, {i: "rejected" for i, r in enumerate(results) if r is None}
+        )
+
+    cache = CachedTranslationProvider(fake_provider, redis_client=redis_client)
+    await cache.translate("a", "en", "es")
+    fake_provider.batch_translate = batch_translate
+
+    with pytest.raises(PartialBatchTranslationException) as exc_info:
+        await cache.batch_translate(["a", "bad", "c"], "en", "es")
+
+    assert exc_info.value.results == ["[es] a", None, "[es] c"]
+    assert exc_info.value.errors == {1: "rejected"}
+    assert fake_provider.batch_calls == [["bad", "c"]]
+    assert await cache.translate("c", "en", "es") == "[es] c"
+
+
+def test_lru_evicts_by_size():
+    """Least recently used entries are evicted once the byte budget is exceeded"""
+    lru = LRUCache(max_entries=100, max_bytes=30)
+    lru.set("a", "x" * 10)
+    lru.set("b", "x" * 10)
+    lru.get("a")
+    lru.set("c", "x" * 10)
+
+    assert lru.get("b") is None
+    assert lru.get("a") is not None
+    assert lru.current_bytes <= 30
+
+
+def test_cache_key_depends_on_engine_and_pair():
+    """Keys differ per engine identity and language pair"""
+    base = make_cache_key("local:m:float32", "en", "es", "hi")
+    assert base == make_cache_key("local:m:float32", "en", "es", "hi ")
+    assert base != make_cache_key("local:m:float16", "en", "es", "hi")
+    assert base != make_cache_key("local:m:float32", "en", "fr", "hi")
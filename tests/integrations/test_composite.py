@@ -0,0 +1,167 @@
+import asyncio
+import pytest
+from src.core.exceptions import (
+    InvalidLanguageException,
+    PartialBatchTranslationException,
+    TranslationEngineException
+)
+from src.integrations.composite import CompositeTranslationProvider
+from tests.conftest import FakeTranslationProvider
+
+
+class ScriptedProvider(FakeTranslationProvider):
+    """Fake engine with a fixed delay that can be made to fail"""
+
+    def __init__(self, name, delay=0.0, fail=False, fail_texts=(), pairs=None):
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.fail_texts = set(fail_texts)
+        self.pairs = pairs
+        self.cancelled = 0
+
+    async def translate(self, text, source_language, target_language):
+        self.translate_calls.append(text)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise TranslationEngineException("down", self.name)
+        return f"{self.name}:{text}"
+
+    async def batch_translate(self, texts, source_language, target_language):
+        self.batch_calls.append(list(texts))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise TranslationEngineException("down", self.name)
+        results = [None if text in self.fail_texts else f"{self.name}:{text}" for text in texts]
+        errors = {i: "rejected" for i, result in enumerate(results) if result is None}
+        if errors:
+            raise PartialBatchTranslationException(results, errors, self.name)
+        return results
+
+    def validate_language_pair(self, source_language, target_language):
+        return self.pairs is None or (source_language, target_language) in self.pairs
+
+
+@pytest.fixture
+def router_settings(settings, monkeypatch):
+    monkeypatch.setattr(settings, "ROUTER_HEDGE_ENABLED", False)
+    monkeypatch.setattr(settings, "ROUTER_MAX_FAILURES", 2)
+    monkeypatch.setattr(settings, "ROUTER_HEDGE_MIN_DELAY_MS", 20)
+    return settings
+
+
+@pytest.mark.asyncio
+async def test_routes_to_lowest_latency_engine(router_settings):
+    """After every engine has a sample, the fastest one takes the traffic"""
+    slow = ScriptedProvider("slow", delay=0.05)
+    fast = ScriptedProvider("fast", delay=0.0)
+    router = CompositeTranslationProvider({"slow": slow, "fast": fast})
+
+    await router.translate("a", "en", "es")
+    await router.translate("b", "en", "es")
+    for text in "cdef":
+        assert await router.translate(text, "en", "es") == f"fast:{text}"
+
+    assert slow.translate_calls == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_fails_over_and_marks_engine_unhealthy(router_settings):
+    """Errors fail over to the next engine; repeated errors demote the engine"""
+    broken = ScriptedProvider("broken")
+    backup = ScriptedProvider("backup", delay=0.01)
+    router = CompositeTranslationProvider({"broken": broken, "backup": backup})
+    await router.translate("warm", "en", "es")
+    await router.translate("warm", "en", "es")
+
+    broken.fail = True
+    assert await router.translate("a", "en", "es") == "backup:a"
+    assert await router.translate("b", "en", "es") == "backup:b"
+    assert await router.translate("c", "en", "es") == "backup:c"
+
+    stats = router.get_stats()
+    assert stats["engines"]["broken"]["healthy"] is False
+    assert broken.translate_calls == ["warm", "a", "b"]
+    assert stats["failovers"] == 2
+
+
+@pytest.mark.asyncio
+async def test_hedges_slow_primary(router_settings, monkeypatch):
+    """A primary slower than its hedge delay is raced by the next engine"""
+    primary = ScriptedProvider("primary", delay=0.01)
+    secondary = ScriptedProvider("secondary", delay=0.03)
+    router = CompositeTranslationProvider({"primary": primary, "secondary": secondary})
+    await router.translate("warm", "en", "es")
+    await router.translate("warm", "en", "es")
+
+    monkeypatch.setattr(router_settings, "ROUTER_HEDGE_ENABLED", True)
+    primary.delay = 1.0
+    secondary.delay = 0.0
+    assert await router.translate("x", "en", "es") == "secondary:x"
+
+    await asyncio.sleep(0)
+    assert primary.cancelled == 1
+    stats = router.get_stats()
+    assert stats["hedged_requests"] == 1
+    assert stats["engines"]["secondary"]["hedges_won"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cold_primary_is_not_hedged_by_default(router_settings, monkeypatch):
+    """Without latency samples, only an explicit initial delay allows hedging"""
+    monkeypatch.setattr(router_settings, "ROUTER_HEDGE_ENABLED", True)
+    primary = ScriptedProvider("primary", delay=0.05)
+    secondary = ScriptedProvider("secondary")
+    router = CompositeTranslationProvider({"primary": primary, "secondary": secondary})
+    assert await router.translate("x", "en", "es") == "primary:x"
+    assert secondary.translate_calls == []
+
+    monkeypatch.setattr(router_settings, "ROUTER_HEDGE_INITIAL_DELAY_MS", 20)
+    router = CompositeTranslationProvider({"primary": primary, "secondary": secondary})
+    assert await router.translate("y", "en", "es") == "secondary:y"
+    assert router.get_stats()["hedged_requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_engine_that_only_failed_is_not_ranked_first(router_settings):
+    """An engine without samples ranks behind a measured one of equal standing"""
+    broken = ScriptedProvider("broken", fail=True)
+    backup = ScriptedProvider("backup")
+    router = CompositeTranslationProvider({"broken": broken, "backup": backup})
+    for text in "abc":
+        assert await router.translate(text, "en", "es") == f"backup:{text}"
+
+    assert broken.translate_calls == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_batch_retries_failed_texts_on_next_engine(router_settings):
+    """Texts one engine rejected are sent to the next engine only"""
+    picky = ScriptedProvider("picky", fail_texts={"b"})
+    backup = ScriptedProvider("backup")
+    router = CompositeTranslationProvider({"picky": picky, "backup": backup})
+
+    assert await router.batch_translate(["a", "b", "c"], "en", "es") == [
+        "picky:a", "backup:b", "picky:c"
+    ]
+    assert backup.batch_calls == [["b"]]
+
+
+@pytest.mark.asyncio
+async def test_only_engines_supporting_the_pair_are_used(router_settings):
+    """Engines are filtered by language pair support"""
+    limited = ScriptedProvider("limited", pairs={("en", "es")})
+    broad = ScriptedProvider("broad", delay=0.01)
+    router = CompositeTranslationProvider({"limited": limited, "broad": broad})
+
+    assert await router.translate("a", "en", "de") == "broad:a"
+    assert limited.translate_calls == []
+
+    router = CompositeTranslationProvider({"limited": limited})
+    with pytest.raises(InvalidLanguageException):
+        await router.translate("a", "en", "de")
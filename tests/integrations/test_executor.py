@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+import pytest
+from src.core.exceptions import InferenceQueueFullException
+from src.integrations.executor import InferenceExecutor, ReplicaPool, intra_op_threads_are_per_thread
+
+
+@pytest.mark.asyncio
+async def test_blocking_work_does_not_stall_event_loop():
+    """The loop keeps running coroutines while a worker is busy"""
+    executor = InferenceExecutor("test", max_workers=1)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    result, _ = await asyncio.gather(
+        executor.run(lambda: time.sleep(0.1) or "done"),
+        ticker()
+    )
+
+    assert result == "done"
+    assert len(ticks) == 5
+    assert ticks[-1] - ticks[0] < 0.1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queue_bound_rejects_excess_calls():
+    """Calls beyond the queue bound fail fast"""
+    executor = InferenceExecutor("test", max_workers=1, max_queue_size=2)
+    release = threading.Event()
+
+    first = asyncio.ensure_future(executor.run(release.wait))
+    second = asyncio.ensure_future(executor.run(release.wait))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(InferenceQueueFullException):
+        await executor.run(release.wait)
+    assert executor.stats()["rejected"] == 1
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert executor.stats()["completed"] == 2
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_replica_pool_dispatches_to_least_loaded_replica():
+    """A busy replica is skipped while another is idle"""
+    pool = ReplicaPool("test", replicas=2, threads_per_replica=1)
+    release = threading.Event()
+
+    blocked = asyncio.ensure_future(pool.run(release.wait))
+    await asyncio.sleep(0.01)
+    names = [await pool.run(lambda: threading.current_thread().name) for _ in range(3)]
+    assert len(set(names)) == 1
+
+    stats = pool.stats()
+    assert [replica["in_flight"] for replica in stats["replicas"]] == [1, 0]
+    assert stats["running"] == 1
+    assert stats["replicas"][1]["completed"] == 3
+
+    release.set()
+    await blocked
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not intra_op_threads_are_per_thread(), reason="torch build without the OpenMP backend")
+async def test_replica_threads_have_their_own_intra_op_budget():
+    """Thread budgets set on replica threads do not overwrite each other's"""
+    torch = pytest.importorskip("torch")
+    before = torch.get_num_threads()
+    first = ReplicaPool("first", replicas=1, threads_per_replica=3)
+    second = ReplicaPool("second", replicas=1, threads_per_replica=2)
+    assert await first.run(torch.get_num_threads) == 3
+    assert await second.run(torch.get_num_threads) == 2
+    assert await first.run(torch.get_num_threads) == 3
+    assert torch.get_num_threads() == before
+    inherited = []
+    plain = threading.Thread(target=lambda: inherited.append(torch.get_num_threads()))
+    plain.start()
+    plain.join()
+    # New threads take the most recently set budget, not the library default
+    assert inherited == [2]
+    first.shutdown()
+    second.shutdown()
+
+    pool = ReplicaPool("test", replicas=2, threads_per_replica=3, max_queue_size=1)
+    release = threading.Event()
+    assert await pool.run(torch.get_num_threads) == 3
+
+    blocked = asyncio.ensure_future(pool.run(release.wait))
+    await asyncio.sleep(0.01)
+    with pytest.raises(InferenceQueueFullException):
+        await pool.run(torch.get_num_threads)
+    release.set()
+    await blocked
+    pool.shutdown()
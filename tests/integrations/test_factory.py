@@ -0,0 +1,26 @@
+import subprocess
+import sys
+from src.core.enums import TranslationEngine
+from src.integrations import factory
+
+
+def test_app_import_does_not_load_engine_modules():
+    """Engine modules, and torch with them, are imported only when selected"""
+    check = (
+        "import sys, src.main; "
+        "print(sorted(m for m in ('torch', 'transformers', 'src.integrations.local_translate', "
+        "'src.integrations.google_translate', 'src.integrations.openai_translate') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_registered_engine_is_created_from_its_module(monkeypatch, fake_provider):
+    monkeypatch.setattr(factory, "_ENGINES", dict(factory._ENGINES))
+    monkeypatch.setitem(sys.modules, "fake_engine_module", type(sys)("fake_engine_module"))
+    sys.modules["fake_engine_module"].FakeEngine = lambda: fake_provider
+
+    factory.register_engine(TranslationEngine.GOOGLE, "fake_engine_module", "FakeEngine")
+    assert factory._create_provider(TranslationEngine.GOOGLE) is fake_provider
+    assert factory.local_providers(fake_provider) == []
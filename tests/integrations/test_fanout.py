@@ -0,0 +1,128 @@
+import asyncio
+import pytest
+from src.core.exceptions import PartialBatchTranslationException
+from src.integrations.fanout import bounded_fan_out, stream_packs
+from src.integrations.openai_translate import OpenAITranslateProvider
+from tests.integrations.mock_openai import MockOpenAIServer
+
+
+@pytest.fixture
+def openai_server():
+    """Mock OpenAI server with a small per-request delay"""
+    server = MockOpenAIServer(delay=0.05).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def openai_provider(openai_server, settings, monkeypatch):
+    """OpenAI provider pointed at the mock server"""
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "OPENAI_BASE_URL", openai_server.base_url)
+    monkeypatch.setattr(settings, "OPENAI_MAX_CONCURRENCY", 4)
+    monkeypatch.setattr(settings, "REMOTE_BATCH_CONCURRENCY", 0)
+    monkeypatch.setattr(settings, "OPENAI_PACK_MAX_TEXTS", 1)
+    return OpenAITranslateProvider()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_keeps_order_and_limits_concurrency():
+    """Results come back in input order with at most max_concurrency running"""
+    running = 0
+    peak = 0
+
+    async def translate(text):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - int(text)))
+        running -= 1
+        return f"t{text}"
+
+    results = await bounded_fan_out(["1", "2", "3", "4", "5"], translate, 2, "test")
+
+    assert results == ["t1", "t2", "t3", "t4", "t5"]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_fan_out_reports_partial_failures():
+    """Failed items are reported by index without failing the others"""
+    async def translate(text):
+        if text == "bad":
+            raise ValueError("boom")
+        return text.upper()
+
+    with pytest.raises(PartialBatchTranslationException) as exc_info:
+        await bounded_fan_out(["a", "bad", "c"], translate, 0, "test")
+
+    assert exc_info.value.results == ["A", None, "C"]
+    assert exc_info.value.errors == {1: "boom"}
+
+    with pytest.raises(ValueError):
+        await bounded_fan_out(["bad", "bad"], translate, 0, "test")
+
+
+@pytest.mark.asyncio
+async def test_openai_batch_runs_concurrently(openai_server, openai_provider):
+    """A batch is fanned out under the provider-wide limit"""
+    texts = [f"text {i}" for i in range(12)]
+
+    results = await openai_provider.batch_translate(texts, "en", "es")
+
+    assert results == [f"<translated> {text}" for text in texts]
+    assert openai_server.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_openai_semaphore_is_shared_across_batches(openai_server, openai_provider):
+    """Concurrent requests share one limit instead of each getting their own"""
+    await asyncio.gather(*(
+        openai_provider.batch_translate([f"{n}-{i}" for i in range(4)], "en", "fr")
+        for n in range(3)
+    ))
+
+    assert len(openai_server.requests) == 12
+    assert openai_server.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_openai_batch_partial_failure(openai_server, openai_provider):
+    """One rejected text does not fail the rest of the batch"""
+    with pytest.raises(PartialBatchTranslationException) as exc_info:
+        await openai_provider.batch_translate(["one", "FAIL", "three"], "en", "de")
+
+    assert exc_info.value.results[0] == "<translated> one"
+    assert exc_info.value.results[1] is None
+    assert exc_info.value.results[2] == "<translated> three"
+    assert list(exc_info.value.errors) == [1]
+
+
+@pytest.mark.asyncio
+async def test_stream_packs_yields_in_completion_order():
+    """Texts arrive as their packs finish; failed packs are reported at the end"""
+    async def translate_pack(texts):
+        await asyncio.sleep(0.01 * len(texts))
+        if "bad" in texts:
+            raise ValueError("boom")
+        return [text.upper() for text in texts]
+
+    texts = ["a", "b", "c", "d", "bad"]
+    received = []
+    with pytest.raises(PartialBatchTranslationException) as exc_info:
+        async for item in stream_packs(texts, [[0, 1, 2], [3], [4]], translate_pack, 0, "test"):
+            received.append(item)
+
+    assert received == [(3, "D"), (0, "A"), (1, "B"), (2, "C")]
+    assert exc_info.value.errors == {4: "boom"}
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_runs_concurrently(openai_server, openai_provider):
+    """Streamed batches overlap their completions instead of awaiting each in turn"""
+    texts = [f"text {i}" for i in range(8)]
+
+    results = dict([item async for item in openai_provider.batch_translate_stream(texts, "en", "es")])
+
+    assert results == {i: f"<translated> {text}" for i, text in enumerate(texts)}
+    assert openai_server.max_in_flight == 4
@@ -0,0 +1,117 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+import pytest
+from google.auth.credentials import AnonymousCredentials
+
+from src.core.exceptions import PartialBatchTranslationException
+from src.integrations.google_translate import GoogleTranslateProvider
+
+
+class MockGoogleServer:
+    """Local Translation API v2 server; rejects requests containing "FAIL" """
+
+    def __init__(self):
+        self.requests: List[dict] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                server.requests.append(body)
+                if any("FAIL" in q for q in body["q"]):
+                    status, payload = 400, {"error": {"code": 400, "message": "bad input"}}
+                else:
+                    status, payload = 200, {"data": {"translations": [
+                        {"translatedText": f"[{body['target']}] {q}"} for q in body["q"]
+                    ]}}
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def google_server():
+    server = MockGoogleServer()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def google_provider(google_server, settings, monkeypatch):
+    """Google provider pointed at the mock server with small request limits"""
+    monkeypatch.setattr(
+        "google.auth.default",
+        lambda scopes=None: (AnonymousCredentials(), None)
+    )
+    monkeypatch.setattr(settings, "GOOGLE_API_ENDPOINT", google_server.endpoint)
+    monkeypatch.setattr(settings, "GOOGLE_MAX_SEGMENTS_PER_REQUEST", 3)
+    monkeypatch.setattr(settings, "GOOGLE_MAX_CHARS_PER_REQUEST", 20)
+    return GoogleTranslateProvider()
+
+
+@pytest.mark.asyncio
+async def test_batch_packs_segments_per_request(google_server, google_provider):
+    """Texts are packed under segment and character limits, in order"""
+    texts = ["a", "b", "c", "d", "x" * 15, "e", "y" * 30, "f"]
+
+    results = await google_provider.batch_translate(texts, "en", "es")
+
+    assert results == [f"[es] {text}" for text in texts]
+    assert sorted(r["q"] for r in google_server.requests) == sorted([
+        ["a", "b", "c"], ["d", "x" * 15, "e"], ["y" * 30], ["f"]
+    ])
+
+
+@pytest.mark.asyncio
+async def test_failed_request_only_fails_its_segments(google_server, google_provider):
+    """A rejected request reports errors for exactly its own texts"""
+    texts = ["a", "b", "FAIL", "c", "d"]
+
+    with pytest.raises(PartialBatchTranslationException) as exc_info:
+        await google_provider.batch_translate(texts, "en", "fr")
+
+    assert exc_info.value.results == [None, None, None, "[fr] c", "[fr] d"]
+    assert sorted(exc_info.value.errors) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_translate_single_text(google_server, google_provider):
+    """Single texts go through the same v2 call"""
+    assert await google_provider.translate("hello", "en", "de") == "[de] hello"
+    assert google_server.requests[0]["format"] == "text"
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_packs_and_reports_failed_ones(google_server, google_provider):
+    """A streamed batch uses the same packing and yields every successful text"""
+    texts = ["a", "b", "c", "FAIL", "d"]
+
+    received = {}
+    with pytest.raises(PartialBatchTranslationException) as exc_info:
+        async for index, translated in google_provider.batch_translate_stream(texts, "en", "es"):
+            received[index] = translated
+
+    assert received == {0: "[es] a", 1: "[es] b", 2: "[es] c"}
+    assert sorted(exc_info.value.errors) == [3, 4]
+    assert len(google_server.requests) == 2
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import pytest
+import torch
+from src.core.exceptions import InferenceQueueFullException
+from src.integrations.local_translate import LocalTranslateProvider
+from src.integrations.model_registry import LoadedModel
+
+
+class CharTokenizer:
+    """One token per character"""
+
+    pad_token_id = 0
+
+    def __call__(self, texts, **kwargs):
+        return {"input_ids": [[ord(c) for c in text] for text in texts]}
+
+    def pad(self, encoded, **kwargs):
+        ids = encoded["input_ids"]
+        width = max(len(row) for row in ids)
+        return _Inputs(input_ids=torch.tensor([row + [0] * (width - len(row)) for row in ids]))
+
+    def decode(self, token_ids, skip_special_tokens=True):
+        return "".join(chr(token) for token in token_ids if token)
+
+    def batch_decode(self, tokens, **kwargs):
+        return [self.decode(row) for row in tokens.tolist()]
+
+
+class WordTokenizer(CharTokenizer):
+    """One token per word, and two per non-ASCII character"""
+
+    def __call__(self, texts, **kwargs):
+        return {
+            "input_ids": [
+                [1] * len(text.split()) + [2] * sum(2 for c in text if ord(c) > 127)
+                for text in texts
+            ]
+        }
+
+
+class _Inputs(dict):
+    def to(self, device):
+        return self
+
+
+class SlowStreamingModel:
+    """Streams input tokens one per step until stopped"""
+
+    def generate(self, input_ids, forced_bos_token_id, streamer=None, stopping_criteria=None, **kwargs):
+        streamer.put(torch.tensor([0]))
+        for step in range(input_ids.shape[1]):
+            if stopping_criteria is not None and bool(stopping_criteria[0](input_ids, None)[0]):
+                break
+            streamer.put(input_ids[:, step])
+            threading.Event().wait(0.01)
+        return input_ids
+
+
+@pytest.fixture
+def provider(settings, monkeypatch):
+    monkeypatch.setattr(settings, "LOCAL_DEVICE", "cpu")
+    monkeypatch.setattr(settings, "LOCAL_MICROBATCH_ENABLED", False)
+    monkeypatch.setattr(settings, "LOCAL_PAIR_MODELS", "")
+
+    def load_model(self, name):
+        return LoadedModel(name, CharTokenizer(), SlowStreamingModel(), memory_bytes=1)
+
+    monkeypatch.setattr(LocalTranslateProvider, "_load_model", load_model)
+    provider = LocalTranslateProvider()
+    yield provider
+    provider.unload_model()
+
+
+@pytest.mark.asyncio
+async def test_stream_raises_when_generation_cannot_start(provider, monkeypatch):
+    """A rejected generate call fails the stream instead of hanging it"""
+    async def reject(*args, **kwargs):
+        raise InferenceQueueFullException("inference")
+
+    monkeypatch.setattr(provider.inference_executor, "run", reject)
+
+    async def consume():
+        return [delta async for delta in provider._stream_tokens(provider.fallback, [104, 105], "es")]
+
+    with pytest.raises(InferenceQueueFullException):
+        await asyncio.wait_for(consume(), timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_waits_for_generation(provider):
+    """Leaving a stream early stops generation and releases its executor slot"""
+    stream = provider._stream_tokens(provider.fallback, [ord(c) for c in "hello world"], "es")
+    first, _ = await stream.__anext__()
+    assert first == "h"
+
+    await asyncio.wait_for(stream.aclose(), timeout=2)
+    stats = provider.inference_executor.stats()
+    assert stats["running"] == 0 and stats["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_segmenting_is_decided_by_token_count(provider, settings, monkeypatch):
+    """Short texts with many tokens are segmented; long texts with few are not"""
+    monkeypatch.setattr(settings, "LOCAL_SEGMENT_MAX_TOKENS", 8)
+    provider.fallback.tokenizer = WordTokenizer()
+
+    assert not await provider._exceeds_segment_budget("hi", "en", "es")
+    assert not await provider._exceeds_segment_budget("one two three four five six seven", "en", "es")
+    assert await provider._exceeds_segment_budget("你好世界你好", "zh", "en")
@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import pytest
+import torch
+from src.integrations.local_translate import LocalTranslateProvider
+from src.integrations.model_registry import LoadedModel, ModelRegistry, parse_pair_models
+
+MB = 2 ** 20
+
+
+class FakeLoader:
+    """Loader returning empty models of a fixed size, optionally gated"""
+
+    def __init__(self, sizes=None, gate=None, fail=()):
+        self.sizes = sizes or {}
+        self.gate = gate
+        self.fail = set(fail)
+        self.calls = []
+
+    def __call__(self, name):
+        self.calls.append(name)
+        if self.gate is not None:
+            self.gate.wait(5)
+        if name in self.fail:
+            raise OSError(f"{name} not found")
+        return LoadedModel(name, tokenizer=None, model=None, memory_bytes=self.sizes.get(name, MB))
+
+
+def test_parse_pair_models():
+    assert parse_pair_models(" en-es=opus-en-es, en-fr = opus-en-fr,") == {
+        ("en", "es"): "opus-en-es",
+        ("en", "fr"): "opus-en-fr",
+    }
+    with pytest.raises(ValueError):
+        parse_pair_models("en=opus")
+
+
+def test_evicts_least_recently_used_within_budget():
+    """Loading past the budget evicts the LRU unpinned model"""
+    registry = ModelRegistry(FakeLoader(), memory_budget_bytes=3 * MB, pinned=["base"])
+    for name in ("base", "a", "b"):
+        registry.load(name)
+    registry.get("a")
+    registry.load("c")
+
+    stats = registry.stats()
+    assert set(stats["resident"]) == {"base", "a", "c"}
+    assert stats["evictions"] == 1
+    assert stats["resident"]["base"]["pinned"] is True
+
+
+def test_pinned_model_is_never_evicted():
+    registry = ModelRegistry(FakeLoader({"base": 2 * MB}), memory_budget_bytes=3 * MB, pinned=["base"])
+    registry.load("base")
+    registry.load("a")
+    registry.load("b")
+    assert set(registry.stats()["resident"]) == {"base", "b"}
+
+
+def test_model_that_cannot_fit_is_not_reloaded():
+    """A model too large for the budget next to the pinned ones is rejected once"""
+    loader = FakeLoader({"base": 2 * MB, "large": 2 * MB})
+    registry = ModelRegistry(loader, memory_budget_bytes=3 * MB, pinned=["base"])
+    registry.load("base")
+    registry.load("a")
+    for _ in range(2):
+        with pytest.raises(MemoryError):
+            registry.load("large")
+
+    stats = registry.stats()
+    assert loader.calls == ["base", "a", "large"]
+    assert set(stats["resident"]) == {"base", "a"}
+    assert stats["unfittable"] == ["large"]
+    assert registry.has_failed("large")
+
+
+@pytest.mark.asyncio
+async def test_background_load_is_deduplicated():
+    """Concurrent requests for a cold model share one load"""
+    gate = threading.Event()
+    loader = FakeLoader(gate=gate)
+    registry = ModelRegistry(loader)
+
+    registry.load_in_background("a")
+    waiters = [asyncio.ensure_future(registry.ensure_loaded("a")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    assert registry.is_loading("a")
+    gate.set()
+
+    entries = await asyncio.gather(*waiters)
+    assert all(entry is entries[0] for entry in entries)
+    assert loader.calls == ["a"]
+    assert registry.stats()["loads"] == 1
+
+
+def test_failed_load_is_not_retried_immediately():
+    loader = FakeLoader(fail={"broken"})
+    registry = ModelRegistry(loader)
+    for _ in range(2):
+        with pytest.raises(OSError):
+            registry.load("broken")
+
+    assert loader.calls == ["broken"]
+    assert registry.has_failed("broken")
+    assert registry.stats()["load_failures"] == 1
+
+
+class NllbStyleTokenizer:
+    """Multilingual tokenizer with FLORES-200 language tokens and no get_lang_id"""
+
+    src_lang = "eng_Latn"
+    unk_token_id = 3
+
+    def convert_tokens_to_ids(self, token):
+        return {"eng_Latn": 7, "spa_Latn": 8}.get(token, self.unk_token_id)
+
+
+def test_forced_bos_token_resolves_language_tokens():
+    """Multilingual tokenizers without get_lang_id still force the target language"""
+    nllb = LoadedModel("nllb", NllbStyleTokenizer(), model=None)
+    assert nllb.forced_bos_token_id("es") == 8
+    assert nllb.forced_bos_token_id("spa_Latn") == 8
+    with pytest.raises(ValueError):
+        nllb.forced_bos_token_id("fr")
+
+    marian = LoadedModel("opus-en-es", TaggingTokenizer("opus-en-es"), model=None)
+    assert marian.forced_bos_token_id("es") is None
+
+
+class TaggingTokenizer:
+    """Tokenizer whose decoded output names the model that produced it"""
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    def __call__(self, texts, **kwargs):
+        return {"input_ids": [[len(text) + 2] for text in texts]}
+
+    def pad(self, encoded, **kwargs):
+        return _Inputs(input_ids=torch.tensor(encoded["input_ids"]))
+
+    def batch_decode(self, tokens, **kwargs):
+        return [f"{self.tag}:{row[0]}" for row in tokens.tolist()]
+
+
+class _Inputs(dict):
+    def to(self, device):
+        return self
+
+
+class EchoModel:
+    def generate(self, input_ids, forced_bos_token_id, **kwargs):
+        return input_ids
+
+
+@pytest.fixture
+def pair_provider(settings, monkeypatch):
+    monkeypatch.setattr(settings, "LOCAL_DEVICE", "cpu")
+    monkeypatch.setattr(settings, "LOCAL_MICROBATCH_ENABLED", False)
+    monkeypatch.setattr(settings, "LOCAL_PAIR_MODELS", "en-es=opus-en-es,en-xx=opus-en-xx")
+    gate = threading.Event()
+
+    def load_model(self, name):
+        if name != settings.LOCAL_MODEL_NAME:
+            gate.wait(5)
+        return LoadedModel(name, TaggingTokenizer(name), EchoModel(), memory_bytes=MB)
+
+    monkeypatch.setattr(LocalTranslateProvider, "_load_model", load_model)
+    provider = LocalTranslateProvider()
+    yield provider, gate
+    gate.set()
+    provider.unload_model()
+
+
+@pytest.mark.asyncio
+async def test_cold_pair_is_served_by_fallback_while_loading(pair_provider, settings):
+    """A cold pair model loads in the background; the fallback answers meanwhile"""
+    provider, gate = pair_provider
+
+    assert await provider.translate("hi", "en", "es") == f"{settings.LOCAL_MODEL_NAME}:4"
+    assert provider.registry.is_loading("opus-en-es")
+
+    gate.set()
+    await provider.registry.ensure_loaded("opus-en-es")
+    assert await provider.translate("hi", "en", "es") == "opus-en-es:4"
+    assert await provider.translate("hi", "en", "fr") == f"{settings.LOCAL_MODEL_NAME}:4"
+
+    models = provider.get_stats()["models"]
+    assert models["fallback_served"] == 1
+    assert set(models["resident"]) == {settings.LOCAL_MODEL_NAME, "opus-en-es"}
+
+
+@pytest.mark.asyncio
+async def test_pair_outside_fallback_waits_for_its_model(pair_provider):
+    """A pair only its own model supports waits for that model to load"""
+    provider, gate = pair_provider
+    assert provider.validate_language_pair("en", "xx")
+
+    pending = asyncio.ensure_future(provider.translate("hi", "en", "xx"))
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+    gate.set()
+    assert await pending == "opus-en-xx:4"
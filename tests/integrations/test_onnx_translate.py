@@ -0,0 +1,126 @@
+import copy
+import pytest
+import torch
+
+pytest.importorskip("onnxruntime")
+
+from transformers import BatchEncoding, M2M100Config, M2M100ForConditionalGeneration
+from src.integrations.local_translate import LocalTranslateProvider
+from src.integrations.model_registry import LoadedModel
+from src.integrations.onnx_translate import OnnxSeq2SeqModel, OnnxTranslateProvider
+from src.tools.export_onnx import export_model
+
+
+def tiny_model():
+    torch.manual_seed(0)
+    config = M2M100Config(
+        vocab_size=300,
+        d_model=32,
+        encoder_layers=2,
+        decoder_layers=2,
+        encoder_attention_heads=4,
+        decoder_attention_heads=4,
+        encoder_ffn_dim=64,
+        decoder_ffn_dim=64,
+        max_position_embeddings=128,
+        init_std=0.5,
+        pad_token_id=1,
+        bos_token_id=0,
+        eos_token_id=2,
+        decoder_start_token_id=2
+    )
+    return M2M100ForConditionalGeneration(config).eval()
+
+
+class CharTokenizer:
+    """One token per character, enough to drive both engines identically"""
+
+    pad_token_id = 1
+
+    def __call__(self, texts, truncation=True, max_length=512):
+        return {"input_ids": [[ord(c) % 250 + 10 for c in text][:max_length - 1] + [2] for text in texts]}
+
+    def pad(self, encoded, padding=True, return_tensors="pt"):
+        ids = encoded["input_ids"]
+        width = max(len(row) for row in ids)
+        return BatchEncoding({
+            "input_ids": torch.tensor([row + [1] * (width - len(row)) for row in ids]),
+            "attention_mask": torch.tensor([[1] * len(row) + [0] * (width - len(row)) for row in ids]),
+        })
+
+    def get_lang_id(self, language):
+        return 5
+
+    def decode(self, token_ids, skip_special_tokens=True):
+        return "".join(chr(97 + token % 26) for token in token_ids if token > 9)
+
+    def batch_decode(self, sequences, skip_special_tokens=True):
+        return [self.decode(row) for row in sequences.tolist()]
+
+
+@pytest.fixture(scope="module")
+def artifacts(tmp_path_factory):
+    model = tiny_model()
+    float_dir = tmp_path_factory.mktemp("onnx-float32")
+    int8_dir = tmp_path_factory.mktemp("onnx-int8")
+    export_model(copy.deepcopy(model), str(float_dir), "tiny-m2m")
+    export_model(copy.deepcopy(model), str(int8_dir), "tiny-m2m", quantize=True)
+    return model, str(float_dir), str(int8_dir)
+
+
+def test_exported_graphs_match_torch_greedy(artifacts):
+    """Encoder + cached decoder steps reproduce PyTorch greedy decoding, padding included"""
+    model, float_dir, _ = artifacts
+    inputs = CharTokenizer().pad(CharTokenizer()(["hello world", "hi", "a longer sentence here"]))
+
+    expected = model.generate(**inputs, forced_bos_token_id=5, max_length=24, num_beams=1, do_sample=False)
+    actual = OnnxSeq2SeqModel(float_dir, ["CPUExecutionProvider"]).generate(
+        inputs["input_ids"],
+        inputs["attention_mask"],
+        forced_bos_token_id=5,
+        max_length=24
+    )
+    assert actual.tolist() == expected.tolist()
+    assert len(set(map(tuple, actual.tolist()))) > 1
+
+
+def test_int8_artifact_is_smaller(artifacts):
+    _, float_dir, int8_dir = artifacts
+    float_model = OnnxSeq2SeqModel(float_dir, ["CPUExecutionProvider"])
+    int8_model = OnnxSeq2SeqModel(int8_dir, ["CPUExecutionProvider"])
+    assert int8_model.precision == "int8"
+    assert int8_model.memory_bytes() < float_model.memory_bytes()
+
+    inputs = CharTokenizer().pad(CharTokenizer()(["hello"]))
+    assert int8_model.generate(inputs["input_ids"], inputs["attention_mask"], max_length=8).shape[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_onnx_provider_matches_local_provider(artifacts, settings, monkeypatch):
+    """The ONNX engine is a drop-in for the local engine"""
+    model, float_dir, _ = artifacts
+    monkeypatch.setattr(settings, "LOCAL_DEVICE", "cpu")
+    monkeypatch.setattr(settings, "LOCAL_MAX_LENGTH", 24)
+    monkeypatch.setattr(settings, "LOCAL_MICROBATCH_ENABLED", False)
+    monkeypatch.setattr(settings, "ONNX_MODEL_DIR", float_dir)
+    monkeypatch.setattr("transformers.AutoTokenizer.from_pretrained", lambda path: CharTokenizer())
+    monkeypatch.setattr(
+        LocalTranslateProvider,
+        "_load_model",
+        lambda self, name: LoadedModel(name, CharTokenizer(), model)
+    )
+    local = LocalTranslateProvider()
+    onnx = OnnxTranslateProvider()
+    texts = ["hello world", "hi", "a longer sentence here"]
+
+    try:
+        expected = await local.batch_translate(texts, "en", "es")
+        assert await onnx.batch_translate(texts, "en", "es") == expected
+        assert await onnx.translate(texts[0], "en", "es") == expected[0]
+
+        streamed = [delta async for delta, _ in onnx.translate_stream(texts[2], "en", "es")]
+        assert "".join(streamed) == expected[2]
+        assert onnx.cache_identity() == "onnx:tiny-m2m:float32"
+    finally:
+        local.unload_model()
+        onnx.unload_model()
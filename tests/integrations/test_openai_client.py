@@ -0,0 +1,98 @@
+import time
+import pytest
+from src.core.exceptions import OpenAITranslateException
+from src.integrations.openai_translate import OpenAITranslateProvider
+from src.integrations.retry import backoff_delay, retry_after_seconds
+from tests.integrations.mock_openai import MockOpenAIServer
+
+
+@pytest.fixture
+def start_server():
+    """Start mock OpenAI servers, stopping them after the test"""
+    servers = []
+
+    def start(**kwargs):
+        servers.append(MockOpenAIServer(**kwargs).start())
+        return servers[-1]
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def make_provider(settings, monkeypatch):
+    """Build an OpenAI provider pointed at a mock server"""
+    def make(server, **overrides):
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(settings, "OPENAI_BASE_URL", server.base_url)
+        monkeypatch.setattr(settings, "OPENAI_BACKOFF_BASE", 0.01)
+        for name, value in overrides.items():
+            monkeypatch.setattr(settings, name, value)
+        return OpenAITranslateProvider()
+    return make
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_waits_for_retry_after(start_server, make_provider):
+    """A 429 is retried after the server's Retry-After instead of failing"""
+    server = start_server(rate_limited=2, retry_after="0.2")
+    provider = make_provider(server)
+
+    start = time.monotonic()
+    assert await provider.translate("hello", "en", "es") == "<translated> hello"
+
+    assert time.monotonic() - start >= 0.4
+    assert len(server.requests) == 3
+    assert provider.get_stats()["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_retries_are_bounded(start_server, make_provider):
+    """Persistent rate limiting fails once the retry budget is spent"""
+    server = start_server(rate_limited=10)
+    provider = make_provider(server, OPENAI_MAX_RETRIES=2)
+
+    with pytest.raises(OpenAITranslateException):
+        await provider.translate("hello", "en", "es")
+    assert len(server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_call_deadline(start_server, make_provider):
+    """Calls slower than OPENAI_TIMEOUT time out"""
+    server = start_server(delay=0.5)
+    provider = make_provider(server, OPENAI_TIMEOUT=0.1, OPENAI_MAX_RETRIES=0)
+
+    start = time.monotonic()
+    with pytest.raises(OpenAITranslateException):
+        await provider.translate("hello", "en", "es")
+    assert time.monotonic() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused(start_server, make_provider):
+    """Sequential calls share one keep-alive connection"""
+    server = start_server()
+    provider = make_provider(server)
+
+    for text in ("a", "b", "c"):
+        await provider.translate(text, "en", "fr")
+
+    assert len(server.client_ports) == 1
+
+
+def test_retry_after_parsing():
+    """Retry-After is read as milliseconds, seconds or an HTTP date"""
+    assert retry_after_seconds({"retry-after-ms": "250"}) == 0.25
+    assert retry_after_seconds({"retry-after": "3"}) == 3.0
+    assert retry_after_seconds({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert retry_after_seconds({"retry-after": "soon"}) is None
+    assert retry_after_seconds({}) is None
+
+
+def test_backoff_is_jittered_and_capped():
+    """Backoff grows exponentially up to the cap, with jitter below it"""
+    delays = [backoff_delay(10, 0.5, 2.0) for _ in range(50)]
+    assert all(0 <= d <= 2.0 for d in delays)
+    assert len(set(delays)) > 1
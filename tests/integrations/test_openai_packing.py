@@ -0,0 +1,54 @@
+import pytest
+from src.integrations.openai_translate import OpenAITranslateProvider, parse_translation_array
+from tests.integrations.mock_openai import MockOpenAIServer
+
+
+@pytest.fixture
+def openai_server():
+    """Mock OpenAI server that truncates packs of more than 4 texts"""
+    server = MockOpenAIServer(max_pack_size=4).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def openai_provider(openai_server, settings, monkeypatch):
+    """OpenAI provider pointed at the mock server"""
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "OPENAI_BASE_URL", openai_server.base_url)
+    monkeypatch.setattr(settings, "OPENAI_PACK_MAX_TEXTS", 4)
+    monkeypatch.setattr(settings, "OPENAI_PACK_MAX_TOKENS", 1000)
+    return OpenAITranslateProvider()
+
+
+@pytest.mark.asyncio
+async def test_batch_is_packed_into_few_completions(openai_server, openai_provider):
+    """Texts share completions and map back to their own positions"""
+    texts = [f"sentence {i}" for i in range(10)]
+
+    results = await openai_provider.batch_translate(texts, "en", "es")
+
+    assert results == [f"<translated> {text}" for text in texts]
+    assert len(openai_server.requests) == 3
+    assert openai_provider.get_stats()["packed_calls"] == 3
+
+
+@pytest.mark.asyncio
+async def test_invalid_pack_response_is_split(openai_server, openai_provider, settings, monkeypatch):
+    """A response with the wrong number of translations splits the pack in half"""
+    monkeypatch.setattr(settings, "OPENAI_PACK_MAX_TEXTS", 8)
+    texts = [f"t{i}" for i in range(8)]
+
+    results = await openai_provider.batch_translate(texts, "en", "fr")
+
+    assert results == [f"<translated> {text}" for text in texts]
+    assert openai_provider.get_stats()["pack_splits"] == 1
+    assert len(openai_server.requests) == 3
+
+
+def test_parse_translation_array_validates_count():
+    """Only a JSON array with one string per input is accepted"""
+    assert parse_translation_array('```json\n["a", "b"]\n```', 2) == ["a", "b"]
+    for content in ('["a"]', '{"a": 1}', 'a\nb', '["a", 2]'):
+        with pytest.raises(ValueError):
+            parse_translation_array(content, 2)
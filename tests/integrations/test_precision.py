@@ -0,0 +1,51 @@
+import pytest
+import torch
+from src.integrations.model_registry import model_memory_bytes
+from src.integrations.precision import apply_precision, resolve_precision
+from src.tools.precision_report import chrf, compare_outputs
+
+
+def make_model():
+    torch.manual_seed(0)
+    return torch.nn.Sequential(
+        torch.nn.Linear(256, 256),
+        torch.nn.ReLU(),
+        torch.nn.Linear(256, 256)
+    ).eval()
+
+
+def test_resolve_precision_falls_back_per_device():
+    assert resolve_precision("float32", "cpu") == "float32"
+    assert resolve_precision("BFLOAT16", "cpu") == "bfloat16"
+    assert resolve_precision("float16", "cpu") == "bfloat16"
+    assert resolve_precision("float16", "cuda") == "float16"
+    assert resolve_precision("int8", "cpu") == "int8"
+    assert resolve_precision("int8", "cuda") == "float16"
+    with pytest.raises(ValueError):
+        resolve_precision("int4", "cpu")
+
+
+@pytest.mark.parametrize("precision,ratio", [("bfloat16", 0.5), ("int8", 0.25)])
+def test_reduced_precision_shrinks_weights(precision, ratio):
+    """Memory is counted from the state dict, including packed int8 weights"""
+    baseline = model_memory_bytes(make_model())
+    reduced = model_memory_bytes(apply_precision(make_model(), precision))
+    assert reduced < baseline * (ratio + 0.05)
+
+
+def test_int8_output_stays_close_to_float32():
+    inputs = torch.randn(4, 256)
+    with torch.no_grad():
+        expected = make_model()(inputs)
+        actual = apply_precision(make_model(), "int8")(inputs)
+    assert torch.allclose(actual, expected, atol=0.05)
+
+
+def test_quality_scores_against_float32():
+    assert chrf("Hola, ¿cómo estás?", "Hola, ¿cómo estás?") == 100.0
+    assert 0 < chrf("Hola, ¿como estas?", "Hola, ¿cómo estás?") < 100
+    assert chrf("xyz", "Hola") == 0.0
+
+    quality = compare_outputs(["Hola", "Gracias"], ["Hola", "Gracia"])
+    assert quality["exact_match"] == 0.5
+    assert quality["min_chrf"] < quality["chrf"] < 100
@@ -0,0 +1,78 @@
+import asyncio
+import time
+import pytest
+from src.core.exceptions import RateLimitException
+from src.integrations.openai_translate import OpenAITranslateProvider
+from src.integrations.rate_limit import RateLimitScheduler
+from tests.integrations.mock_openai import MockOpenAIServer
+
+
+@pytest.mark.asyncio
+async def test_calls_queue_until_budget_refills():
+    """Calls over the request budget wait in line instead of failing"""
+    scheduler = RateLimitScheduler("test", requests_per_minute=600, tokens_per_minute=0, max_wait=5)
+    scheduler.requests.level = 0
+
+    start = time.monotonic()
+    pending = asyncio.gather(*(scheduler.acquire() for _ in range(3)))
+    await asyncio.sleep(0.05)
+    assert scheduler.queue_depth == 3
+    await pending
+
+    # 10 requests per second: the third call waits ~0.3s
+    assert 0.25 <= time.monotonic() - start < 0.6
+    stats = scheduler.stats()
+    assert (stats["queue_depth"], stats["queued"], stats["max_queue_depth"]) == (0, 3, 3)
+    assert stats["wait_p99_ms"] >= 250
+
+
+@pytest.mark.asyncio
+async def test_token_budget_and_wait_bound():
+    """Calls that would wait longer than max_wait are rejected"""
+    scheduler = RateLimitScheduler("test", requests_per_minute=0, tokens_per_minute=600, max_wait=1)
+
+    await scheduler.acquire(550)
+    await scheduler.acquire(50)
+    with pytest.raises(RateLimitException):
+        await scheduler.acquire(100)
+    assert scheduler.stats()["rejected"] == 1
+
+
+def test_limits_follow_response_headers():
+    """x-ratelimit headers update the budget and the remaining allowance"""
+    scheduler = RateLimitScheduler("test", requests_per_minute=100, tokens_per_minute=1000, max_wait=1)
+
+    scheduler.update_from_headers({
+        "x-ratelimit-limit-requests": "60",
+        "x-ratelimit-remaining-requests": "5",
+        "x-ratelimit-limit-tokens": "2000",
+    })
+
+    assert scheduler.requests.per_minute == 60
+    assert scheduler.requests.level <= 5
+    assert scheduler.tokens.per_minute == 2000
+
+
+@pytest.mark.asyncio
+async def test_openai_provider_uses_scheduler(settings, monkeypatch):
+    """The provider spends budget per call and adopts the API's limits"""
+    server = MockOpenAIServer(headers={
+        "x-ratelimit-limit-requests": "500",
+        "x-ratelimit-limit-tokens": "40000",
+        "x-ratelimit-remaining-tokens": "100",
+    }).start()
+    try:
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(settings, "OPENAI_BASE_URL", server.base_url)
+        monkeypatch.setattr(settings, "RATE_LIMIT_MAX_WAIT", 0.01)
+        provider = OpenAITranslateProvider()
+
+        assert await provider.translate("hello", "en", "es") == "<translated> hello"
+        stats = provider.get_stats()["rate_limit"]
+        assert (stats["requests_per_minute"], stats["tokens_per_minute"]) == (500, 40000)
+
+        # Only 100 tokens left at the API: the next call cannot fit in 10ms
+        with pytest.raises(RateLimitException):
+            await provider.translate("hello again " * 20, "en", "es")
+    finally:
+        server.stop()
@@ -0,0 +1,46 @@
+from src.integrations.segmentation import split_sentences, pack_sentences
+
+TEXT = (
+    "  First sentence. Second one?  Third \"quoted.\" Fourth!\n\n"
+    "Next paragraph。日本語です。Done...   \n  Last line"
+)
+
+
+def segment(text, max_tokens):
+    prefix, sentences, separators = split_sentences(text)
+    lengths = [len(sentence.split()) for sentence in sentences]
+    return pack_sentences(prefix, sentences, separators, lengths, max_tokens)
+
+
+def test_split_preserves_text_exactly():
+    """Sentences and separators rebuild the original text"""
+    prefix, sentences, separators = split_sentences(TEXT)
+
+    assert prefix == "  "
+    assert sentences[:3] == ["First sentence.", "Second one?", 'Third "quoted."']
+    assert prefix + "".join(s + sep for s, sep in zip(sentences, separators)) == TEXT
+
+
+def test_pack_respects_budget_and_paragraphs():
+    """Chunks stay within budget and never span a line break"""
+    segmented = segment(TEXT, max_tokens=4)
+
+    assert segmented.reassemble(segmented.chunks) == TEXT
+    assert segmented.chunks[0] == "First sentence. Second one?"
+    assert all("\n" not in chunk for chunk in segmented.chunks)
+    assert all(len(chunk.split()) <= 4 for chunk in segmented.chunks)
+
+
+def test_reassemble_keeps_structure_around_translations():
+    """Translated chunks are joined with the original whitespace"""
+    segmented = segment("One. Two.\n\nThree.", max_tokens=1)
+
+    assert segmented.reassemble(["Uno.", "Dos.", "Tres."]) == "Uno. Dos.\n\nTres."
+
+
+def test_over_budget_sentence_is_split_on_words():
+    """A single sentence longer than the budget is broken into pieces"""
+    segmented = segment("a b c d e f g h.", max_tokens=3)
+
+    assert len(segmented.chunks) == 3
+    assert " ".join(segmented.chunks) == "a b c d e f g h."
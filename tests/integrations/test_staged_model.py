@@ -0,0 +1,70 @@
+import copy
+import os
+import pytest
+import torch
+from safetensors.torch import load_file, save_file
+from transformers import M2M100Config, M2M100ForConditionalGeneration
+from src.integrations.staged_model import (
+    SAFETENSORS_FILE,
+    is_staged_model,
+    load_staged_model,
+    staged_checkpoint
+)
+from src.tools.stage_model import stage_model
+
+
+def tiny_model():
+    torch.manual_seed(0)
+    config = M2M100Config(
+        vocab_size=300,
+        d_model=32,
+        encoder_layers=2,
+        decoder_layers=2,
+        encoder_attention_heads=4,
+        decoder_attention_heads=4,
+        encoder_ffn_dim=64,
+        decoder_ffn_dim=64,
+        max_position_embeddings=128,
+        init_std=0.5,
+        pad_token_id=1,
+        bos_token_id=0,
+        eos_token_id=2,
+        decoder_start_token_id=2
+    )
+    return M2M100ForConditionalGeneration(config).eval()
+
+
+def greedy(model, input_ids):
+    return model.generate(input_ids, max_length=16, num_beams=1, do_sample=False).tolist()
+
+
+@pytest.mark.parametrize("precision,dtype", [("float32", torch.float32), ("bfloat16", torch.bfloat16)])
+def test_staged_model_matches_from_pretrained(tmp_path, precision, dtype):
+    """Mapped weights reproduce the original model, in the staged dtype"""
+    model = tiny_model()
+    stage_model(copy.deepcopy(model), str(tmp_path), "tiny-m2m", precision=precision)
+    assert is_staged_model(str(tmp_path))
+    assert staged_checkpoint(str(tmp_path)) == "tiny-m2m"
+
+    loaded = load_staged_model(str(tmp_path), dtype)
+    input_ids = torch.tensor([[15, 16, 17, 18, 2], [40, 41, 42, 2, 1]])
+    assert greedy(loaded, input_ids) == greedy(model.to(dtype), input_ids)
+    assert {tensor.dtype for tensor in loaded.state_dict().values() if tensor.is_floating_point()} == {dtype}
+    # Tied embeddings stay shared
+    assert loaded.lm_head.weight.data_ptr() == loaded.model.shared.weight.data_ptr()
+
+
+def test_incomplete_artifact_is_rejected(tmp_path):
+    stage_model(tiny_model(), str(tmp_path), "tiny-m2m")
+    weights = os.path.join(str(tmp_path), SAFETENSORS_FILE)
+    state = load_file(weights)
+    dropped = next(name for name in state if "fc1.weight" in name)
+    save_file({name: tensor for name, tensor in state.items() if name != dropped}, weights)
+
+    with pytest.raises(ValueError, match="fc1"):
+        load_staged_model(str(tmp_path), torch.float32)
+
+
+def test_hub_names_are_not_staged(tmp_path):
+    assert not is_staged_model("facebook/nllb-200-distilled-600M")
+    assert not is_staged_model(str(tmp_path))
@@ -0,0 +1,91 @@
+import pytest
+from src.integrations import warmup
+from src.integrations.cache import CachedTranslationProvider
+from src.integrations.composite import CompositeTranslationProvider
+from src.integrations.local_translate import LocalTranslateProvider
+from src.integrations.warmup import Readiness, start_up, warmup_targets
+
+
+class RecordingLocalProvider(LocalTranslateProvider):
+    """Local provider stand-in recording warmup traffic"""
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.pair_models = {}
+        self.preloaded = []
+        self.batches = []
+
+    async def preload(self, source_language, target_language):
+        self.preloaded.append((source_language, target_language))
+
+    async def batch_translate(self, texts, source_language, target_language):
+        self.batches.append((len(texts), len(texts[0].split()), target_language))
+        return texts
+
+
+@pytest.fixture
+def warmup_settings(settings, monkeypatch):
+    monkeypatch.setattr(settings, "WARMUP_LANGUAGE_PAIRS", "en-es,en-xx")
+    monkeypatch.setattr(settings, "WARMUP_SEQUENCE_LENGTHS", "4,16")
+    monkeypatch.setattr(settings, "WARMUP_BATCH_SIZE", 3)
+    monkeypatch.setattr(settings, "WARMUP_PASSES", 2)
+    monkeypatch.setattr(settings, "STARTUP_RETRY_SECONDS", 0)
+    return settings
+
+
+def test_warmup_targets_unwraps_cache_and_router(settings, fake_provider):
+    local = RecordingLocalProvider(settings.LOCAL_MODEL_NAME)
+    router = CompositeTranslationProvider({"local": local, "fake": fake_provider})
+    assert warmup_targets(CachedTranslationProvider(router)) == [local]
+    assert warmup_targets(fake_provider) == []
+
+
+@pytest.mark.asyncio
+async def test_start_up_warms_up_before_ready(warmup_settings, monkeypatch):
+    """Readiness turns ready only after every warmup batch has run"""
+    local = RecordingLocalProvider(warmup_settings.LOCAL_MODEL_NAME)
+    state = Readiness()
+    seen = []
+
+    async def batch_translate(texts, source_language, target_language):
+        seen.append(state.status)
+        return await RecordingLocalProvider.batch_translate(local, texts, source_language, target_language)
+
+    local.batch_translate = batch_translate
+    monkeypatch.setattr(warmup, "get_translation_provider", lambda: local)
+    await start_up(state)
+
+    assert state.ready and state.load_seconds is not None
+    assert set(seen) == {"warming"}
+    # en-xx is unsupported by the model and skipped
+    assert local.preloaded == [("en", "es")]
+    assert local.batches == [(3, 4, "es"), (3, 4, "es"), (3, 16, "es"), (3, 16, "es")]
+
+
+@pytest.mark.asyncio
+async def test_start_up_retries_failed_initialization(warmup_settings, monkeypatch):
+    attempts = []
+
+    def get_provider():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("model download failed")
+        return RecordingLocalProvider(warmup_settings.LOCAL_MODEL_NAME)
+
+    monkeypatch.setattr(warmup, "get_translation_provider", get_provider)
+    state = Readiness()
+    await start_up(state)
+    assert len(attempts) == 2
+    assert state.ready and state.error is None
+
+
+def test_ready_endpoint_is_separate_from_liveness(client, monkeypatch):
+    """/health stays up while /ready reports 503 until warmup finishes"""
+    monkeypatch.setattr(warmup.readiness, "status", "warming")
+    assert client.get("/health").status_code == 200
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "warming"
+
+    monkeypatch.setattr(warmup.readiness, "status", "ready")
+    assert client.get("/ready").status_code == 200
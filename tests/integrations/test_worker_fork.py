@@ -0,0 +1,100 @@
+import asyncio
+import json
+import os
+import select
+import pytest
+import torch
+from src.integrations import factory
+from src.integrations.local_translate import LocalTranslateProvider
+from src.integrations.model_registry import LoadedModel
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+class ShoutingTokenizer:
+    def __call__(self, texts, **kwargs):
+        return {"input_ids": [[ord(c) for c in text] for text in texts]}
+
+    def pad(self, encoded, **kwargs):
+        ids = encoded["input_ids"]
+        width = max(len(row) for row in ids)
+        return _Inputs(
+            input_ids=torch.tensor([row + [0] * (width - len(row)) for row in ids]),
+            attention_mask=torch.tensor([[1] * len(row) + [0] * (width - len(row)) for row in ids])
+        )
+
+    def batch_decode(self, tokens, **kwargs):
+        return ["".join(chr(t) for t in row if t).upper() for row in tokens.tolist()]
+
+
+class _Inputs(dict):
+    def to(self, device):
+        return self
+
+
+class EchoModel:
+    def generate(self, input_ids, **kwargs):
+        return input_ids
+
+
+@pytest.fixture
+def preloaded(settings, monkeypatch):
+    """A provider preloaded (and used) in the parent, as in a gunicorn master"""
+    monkeypatch.setattr(settings, "LOCAL_DEVICE", "cpu")
+    monkeypatch.setattr(settings, "LOCAL_PAIR_MODELS", "")
+    monkeypatch.setattr(settings, "LOCAL_MICROBATCH_ENABLED", True)
+    monkeypatch.setattr(
+        LocalTranslateProvider,
+        "_load_model",
+        lambda self, name: LoadedModel(name, ShoutingTokenizer(), EchoModel())
+    )
+    provider = LocalTranslateProvider()
+    monkeypatch.setattr(factory, "_provider", provider)
+    yield provider
+    factory.reset_translation_provider()
+
+
+def test_forked_worker_serves_inherited_model(preloaded):
+    """After reinit_after_fork a child translates with the parent's weights and its own threads"""
+    # Start executor and batcher threads in the parent; they do not survive fork
+    assert asyncio.run(preloaded.translate("warm", "en", "es")) == "WARM"
+    model_id = id(preloaded.fallback.model)
+    parent_executor = preloaded.inference_executor
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.close(read_end)
+            factory.reinit_after_fork()
+            provider = factory.get_translation_provider()
+            result = {
+                "translations": asyncio.run(provider.batch_translate(["hi", "there"], "en", "es")),
+                "single": asyncio.run(provider.translate("forked", "en", "es")),
+                "same_model": id(provider.fallback.model) == model_id,
+                "new_executor": provider.inference_executor is not parent_executor,
+            }
+            os.write(write_end, json.dumps(result).encode())
+            status = 0
+        finally:
+            os._exit(status)
+
+    os.close(write_end)
+    try:
+        ready, _, _ = select.select([read_end], [], [], 30)
+        if not ready:
+            os.kill(pid, 9)
+            pytest.fail("forked worker hung")
+        result = json.loads(os.read(read_end, 65536).decode())
+    finally:
+        os.close(read_end)
+        _, status = os.waitpid(pid, 0)
+
+    assert status == 0
+    assert result == {
+        "translations": ["HI", "THERE"],
+        "single": "FORKED",
+        "same_model": True,
+        "new_executor": True,
+    }
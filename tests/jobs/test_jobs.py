@@ -0,0 +1,139 @@
+import asyncio
+import json
+import pytest
+from fastapi import status
+from src.core.config import get_settings
+from src.core.exceptions import LocalTranslateException
+from src.jobs import tasks
+from src.jobs.celery_app import celery_app
+from src.jobs.store import JobStore
+from tests.conftest import FakeTranslationProvider
+
+
+class FlakyProvider(FakeTranslationProvider):
+    """Fake provider that fails on one batch call"""
+
+    def __init__(self, fail_on_call: int):
+        super().__init__()
+        self.fail_on_call = fail_on_call
+
+    async def batch_translate(self, texts, source_language, target_language):
+        if len(self.batch_calls) + 1 == self.fail_on_call:
+            self.batch_calls.append(None)
+            raise LocalTranslateException("worker lost")
+        return await super().batch_translate(texts, source_language, target_language)
+
+
+class LoopBoundProvider(FakeTranslationProvider):
+    """Fake provider whose semaphore binds to the first loop it waits on, like the API providers"""
+
+    def __init__(self):
+        super().__init__()
+        self.semaphore = asyncio.Semaphore(1)
+        self.loops = set()
+
+    async def batch_translate(self, texts, source_language, target_language):
+        self.loops.add(asyncio.get_running_loop())
+
+        async def one(text):
+            async with self.semaphore:
+                await asyncio.sleep(0)
+                return f"[{target_language}] {text}"
+
+        return list(await asyncio.gather(*(one(text) for text in texts)))
+
+
+@pytest.fixture
+def jobs_env(tmp_path, monkeypatch):
+    """Eager Celery, temporary job directory and a fake provider"""
+    monkeypatch.setattr(get_settings(), "JOBS_DIR", str(tmp_path))
+    monkeypatch.setitem(celery_app.conf, "task_always_eager", True)
+    provider = FakeTranslationProvider()
+    monkeypatch.setattr(tasks, "get_translation_provider", lambda: provider)
+    return provider
+
+
+def corpus(count):
+    return "\n".join(json.dumps({"id": i, "text": f"line {i}"}) for i in range(count))
+
+
+def test_job_lifecycle(client, jobs_env):
+    """A submitted corpus is translated and downloadable in input order"""
+    body = corpus(5) + "\n\n" + json.dumps({"text": "hola", "source_language": "es", "target_language": "en"})
+    response = client.post(
+        "/api/jobs/?source_language=en&target_language=fr",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    job_id = response.json()["job_id"]
+
+    job = client.get(f"/api/jobs/{job_id}").json()
+    assert job["status"] == "completed"
+    assert (job["total"], job["processed"], job["progress"]) == (6, 6, 1.0)
+
+    results = client.get(f"/api/jobs/{job_id}/results")
+    records = [json.loads(line) for line in results.text.splitlines()]
+    assert [r["index"] for r in records] == list(range(6))
+    assert records[0]["translated_text"] == "[fr] line 0"
+    assert records[5]["translated_text"] == "[en] hola"
+
+
+def test_job_rejects_malformed_input(client, jobs_env):
+    """Lines without a text field are rejected at submission"""
+    response = client.post(
+        "/api/jobs/?source_language=en&target_language=fr",
+        content='{"text": "ok"}\n{"nope": 1}\n'
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Line 2" in response.json()["detail"]
+
+
+def test_unknown_job_returns_404(client, jobs_env):
+    """Unknown job ids return 404"""
+    assert client.get("/api/jobs/doesnotexist").status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_job_resumes_from_checkpoint(jobs_env):
+    """A restarted job skips checkpointed chunks and never duplicates output"""
+    store = JobStore()
+    job_id = store.create("en", "de")["job_id"]
+    with open(store.input_path(job_id), "w") as f:
+        f.write(corpus(10) + "\n")
+    store.update(job_id, total=10)
+
+    flaky = FlakyProvider(fail_on_call=2)
+    with pytest.raises(LocalTranslateException):
+        await tasks.run_job(store, job_id, flaky, chunk_size=4)
+    assert store.load(job_id)["processed"] == 4
+
+    # Simulate a crash after writing part of a chunk but before checkpointing
+    with open(store.output_path(job_id), "a") as f:
+        f.write('{"partial": true}\n')
+
+    provider = FakeTranslationProvider()
+    state = await tasks.run_job(store, job_id, provider, chunk_size=4)
+
+    assert state["status"] == "completed"
+    assert provider.batch_calls == [[f"line {i}" for i in range(4, 8)], ["line 8", "line 9"]]
+    with open(store.output_path(job_id)) as f:
+        records = [json.loads(line) for line in f]
+    assert [r["id"] for r in records] == list(range(10))
+
+
+def test_jobs_share_one_event_loop(jobs_env, monkeypatch):
+    """Back-to-back jobs in one worker reuse the provider's loop-bound resources"""
+    provider = LoopBoundProvider()
+    monkeypatch.setattr(tasks, "get_translation_provider", lambda: provider)
+    store = JobStore()
+
+    for _ in range(2):
+        job_id = store.create("en", "fr")["job_id"]
+        with open(store.input_path(job_id), "w") as f:
+            f.write(corpus(3) + "\n")
+        store.update(job_id, total=3)
+        tasks.process_job.delay(job_id)
+        assert store.load(job_id)["status"] == "completed"
+
+    assert len(provider.loops) == 1
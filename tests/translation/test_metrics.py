@@ -0,0 +1,67 @@
+import threading
+from src.core.metrics import Counter, Gauge, Histogram, MetricsRegistry
+from tests.conftest import FakeTranslationProvider
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = Histogram("latency_seconds", "Latency", ["pair"], buckets=(0.1, 1.0), registry=registry)
+    for value in (0.05, 0.1, 0.5, 5.0):
+        latency.labels("en-es").observe(value)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{pair="en-es",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{pair="en-es",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{pair="en-es",le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum{pair="en-es"} 5.65' in lines
+    assert 'latency_seconds_count{pair="en-es"} 4' in lines
+
+
+def test_observations_from_many_threads_are_not_lost():
+    """Per-thread shards add up without locking"""
+    registry = MetricsRegistry()
+    total = Counter("events_total", "Events", registry=registry)
+    in_flight = Gauge("in_flight", "In flight", registry=registry)
+
+    def work():
+        for _ in range(10000):
+            total.inc()
+            in_flight.inc()
+            in_flight.dec()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lines = registry.render().splitlines()
+    assert "events_total 80000" in lines
+    assert "in_flight 0" in lines
+
+
+def test_collectors_are_read_at_scrape_time():
+    registry = MetricsRegistry()
+    depth = {"value": 1}
+    registry.register_collector(lambda: [("queue_depth", "gauge", "Depth", [({"queue": "q"}, depth["value"])])])
+    depth["value"] = 7
+    assert 'queue_depth{queue="q"} 7' in registry.render().splitlines()
+
+
+def test_metrics_endpoint_reports_translations(client, use_provider):
+    use_provider(FakeTranslationProvider())
+    response = client.post(
+        "/api/translate/",
+        json={"text": "Hello", "source_language": "en", "target_language": "es"}
+    )
+    assert response.status_code == 200
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'translation_duration_seconds_count{operation="translate",engine="FakeTranslationProvider",pair="en-es"}' in body
+    assert 'translation_characters_total{engine="FakeTranslationProvider",pair="en-es"}' in body
+    assert 'http_request_duration_seconds_count{method="POST",route="/api/translate/",status="200"}' in body
+    assert "http_requests_in_flight 1" in body
@@ -0,0 +1,149 @@
+import asyncio
+import pytest
+from src.translation.service import TranslationService
+from src.translation.schemas import TranslateRequest, BatchTranslateRequest
+from src.translation.singleflight import SingleFlight
+from src.core.exceptions import PartialBatchTranslationException, TranslationEngineException
+from tests.conftest import FakeTranslationProvider
+
+
+class SlowProvider(FakeTranslationProvider):
+    """Fake provider whose calls block until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def translate(self, text, source_language, target_language):
+        await self.release.wait()
+        return await super().translate(text, source_language, target_language)
+
+    async def batch_translate(self, texts, source_language, target_language):
+        await self.release.wait()
+        return await super().batch_translate(texts, source_language, target_language)
+
+
+@pytest.mark.asyncio
+async def test_batch_translates_each_unique_text_once(use_provider):
+    """Duplicates in a batch are translated once and fanned back out"""
+    provider = use_provider(FakeTranslationProvider())
+    request = BatchTranslateRequest(
+        texts=["OK", "Cancel", "OK", "OK", "Cancel", "Save"],
+        source_language="en",
+        target_language="es"
+    )
+
+    response = await TranslationService.batch_translate(request)
+
+    assert provider.batch_calls == [["OK", "Cancel", "Save"]]
+    assert response.translated_texts == [
+        "[es] OK", "[es] Cancel", "[es] OK", "[es] OK", "[es] Cancel", "[es] Save"
+    ]
+    assert response.count == 6
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call(use_provider):
+    """Identical in-flight requests await a single provider call"""
+    provider = use_provider(SlowProvider())
+    request = TranslateRequest(text="Hello", source_language="en", target_language="fr")
+    batch = BatchTranslateRequest(
+        texts=["Hello", "World"], source_language="en", target_language="fr"
+    )
+
+    pending = asyncio.gather(
+        TranslationService.translate(request),
+        TranslationService.translate(request),
+        TranslationService.batch_translate(batch),
+    )
+    await asyncio.sleep(0.01)
+    provider.release.set()
+    single, duplicate, batched = await pending
+
+    assert provider.translate_calls == ["Hello"]
+    assert provider.batch_calls == [["World"]]
+    assert single.translated_text == duplicate.translated_text == "[fr] Hello"
+    assert batched.translated_texts == ["[fr] Hello", "[fr] World"]
+
+
+@pytest.mark.asyncio
+async def test_followers_recover_when_leader_is_cancelled():
+    """Followers redo the work if the leading caller is cancelled"""
+    flight = SingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await release.wait()
+        return "done"
+
+    leader = asyncio.ensure_future(flight.run("key", work))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.run("key", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == "done"
+    assert len(calls) == 2
+
+
+class PartiallyFailingProvider(FakeTranslationProvider):
+    """Fake provider that cannot translate texts containing 'FAIL'"""
+
+    async def batch_translate(self, texts, source_language, target_language):
+        results = await super().batch_translate(texts, source_language, target_language)
+        errors = {i: "rejected" for i, text in enumerate(texts) if "FAIL" in text}
+        if errors:
+            raise PartialBatchTranslationException(
+                [None if i in errors else r for i, r in enumerate(results)],
+                errors
+            )
+        return results
+
+
+@pytest.mark.asyncio
+async def test_single_request_joining_a_failing_batch_raises(use_provider):
+    """A text that failed in a shared batch call fails the single request too"""
+    class SlowPartialProvider(PartiallyFailingProvider):
+        def __init__(self):
+            super().__init__()
+            self.release = asyncio.Event()
+
+        async def batch_translate(self, texts, source_language, target_language):
+            await self.release.wait()
+            return await super().batch_translate(texts, source_language, target_language)
+
+    provider = use_provider(SlowPartialProvider())
+    batch = asyncio.ensure_future(TranslationService.batch_translate(
+        BatchTranslateRequest(texts=["FAIL", "ok"], source_language="en", target_language="es")
+    ))
+    await asyncio.sleep(0.01)
+    single = asyncio.ensure_future(TranslationService.translate(
+        TranslateRequest(text="FAIL", source_language="en", target_language="es")
+    ))
+    await asyncio.sleep(0.01)
+    provider.release.set()
+
+    with pytest.raises(TranslationEngineException, match="rejected"):
+        await single
+    assert (await batch).translated_texts == [None, "[es] ok"]
+    assert provider.translate_calls == []
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_per_item_errors(use_provider):
+    """Failed texts are reported per index while the rest are returned"""
+    use_provider(PartiallyFailingProvider())
+    request = BatchTranslateRequest(
+        texts=["Hi", "FAIL", "Bye", "FAIL"],
+        source_language="en",
+        target_language="es"
+    )
+
+    response = await TranslationService.batch_translate(request)
+
+    assert response.translated_texts == ["[es] Hi", None, "[es] Bye", None]
+    assert [(e.index, e.error) for e in response.errors] == [(1, "rejected"), (3, "rejected")]
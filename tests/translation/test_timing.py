@@ -0,0 +1,86 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+from src.core.profiler import SamplingProfiler
+from src.core.timing import begin_stages, stage
+from src.integrations.batching import MicroBatcher
+from src.integrations.executor import InferenceExecutor
+from tests.conftest import FakeTranslationProvider
+
+
+def test_responses_carry_server_timing(client, use_provider):
+    use_provider(FakeTranslationProvider())
+    response = client.post(
+        "/api/translate/",
+        json={"text": "Hello", "source_language": "en", "target_language": "es"}
+    )
+    assert response.status_code == 200
+
+    metrics = dict(
+        entry.strip().split(";dur=") for entry in response.headers["server-timing"].split(",")
+    )
+    assert {"validate", "serialize", "total"} <= set(metrics)
+    assert all(float(duration) >= 0 for duration in metrics.values())
+
+
+@pytest.mark.asyncio
+async def test_stages_follow_work_into_executors_and_micro_batches():
+    """Stages timed on worker threads of a shared batch reach every caller"""
+    executor = InferenceExecutor("test", max_workers=1)
+
+    def generate(texts):
+        with stage("generate"):
+            time.sleep(0.02)
+        return [text.upper() for text in texts]
+
+    async def batch_fn(texts, source_language, target_language):
+        return await executor.run(generate, texts)
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=2, max_wait_ms=50)
+
+    async def request(text):
+        stages = begin_stages()
+        return await batcher.submit(text, "en", "es"), stages
+
+    (first, first_stages), (second, second_stages) = await asyncio.gather(request("a"), request("b"))
+
+    assert (first, second) == ("A", "B")
+    for stages in (first_stages, second_stages):
+        assert stages["generate"] >= 0.02
+        assert {"test_queue", "microbatch_wait"} <= set(stages)
+    executor.shutdown()
+
+
+def test_profiler_keeps_the_slowest_requests(tmp_path, monkeypatch):
+    profiler = SamplingProfiler(str(tmp_path), slowest=2, interval_ms=1)
+    writers = set()
+    write = profiler._write
+
+    def recording_write(*args):
+        writers.add(threading.current_thread().name)
+        write(*args)
+
+    monkeypatch.setattr(profiler, "_write", recording_write)
+    assert profiler.begin_request({"method": "POST", "path": "/"}) is None
+
+    profiler.start()
+    try:
+        for duration in (0.3, 0.1, 0.5, 0.2):
+            handle = profiler.begin_request({"method": "POST", "path": "/api/translate/"})
+            time.sleep(0.02)
+            profiler.end_request(handle, duration, {"generate": duration / 2})
+    finally:
+        profiler.stop()
+
+    assert writers and threading.current_thread().name not in writers
+    status = profiler.status()
+    assert not status["enabled"]
+    assert [profile["duration_ms"] for profile in status["profiles"]] == [500.0, 300.0]
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [".folded", ".folded", ".json", ".json"]
+
+    summary = json.loads((tmp_path / "0000500ms-2.json").read_text())
+    assert summary["path"] == "/api/translate/"
+    assert summary["stages_ms"] == {"generate": 250.0}
+    assert summary["samples"] > 0
@@ -1,3 +1,4 @@
+import json
 import pytest
 from fastapi import status
 
@@ -82,3 +83,64 @@ def test_translate_text_too_long(client):
         }
     )
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_batch_stream_ndjson(client, use_provider, fake_provider):
+    """Streaming batch emits one NDJSON line per text plus a summary"""
+    use_provider(fake_provider)
+    response = client.post(
+        "/api/translate/batch/stream",
+        json={
+            "texts": ["one", "two", "one"],
+            "source_language": "en",
+            "target_language": "es"
+        }
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    items = sorted(
+        (e for e in events if e["type"] == "translation"),
+        key=lambda e: e["index"]
+    )
+    assert [e["translated_text"] for e in items] == ["[es] one", "[es] two", "[es] one"]
+    assert events[-1]["type"] == "done"
+    assert events[-1]["count"] == 3
+
+
+def test_batch_stream_sse_and_validation(client, use_provider, fake_provider):
+    """SSE framing is used on request; invalid pairs fail before streaming"""
+    use_provider(fake_provider)
+    response = client.post(
+        "/api/translate/batch/stream",
+        headers={"Accept": "text/event-stream"},
+        json={"texts": ["hi"], "source_language": "en", "target_language": "fr"}
+    )
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "event: translation\ndata: " in response.text
+
+    response = client.post(
+        "/api/translate/batch/stream",
+        json={"texts": ["hi"], "source_language": "en", "target_language": "en"}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_translate_stream_sse(client, use_provider, fake_provider):
+    """Streaming translate sends deltas then a summary event"""
+    use_provider(fake_provider)
+    response = client.post(
+        "/api/translate/stream",
+        json={"text": "Hello", "source_language": "en", "target_language": "es"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert events[0] == {"type": "token", "text": "[es] Hello"}
+    assert events[-1]["type"] == "done"
+    assert events[-1]["translated_text"] == "[es] Hello"
+    assert events[-1]["time_to_first_token_ms"] is not None